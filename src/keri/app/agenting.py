@@ -25,12 +25,22 @@ logger = help.ogler.getLogger()
 
 class Receiptor(doing.DoDoer):
 
-    def __init__(self, hby, msgs=None, gets=None, cues=None):
-
+    def __init__(self, hby, msgs=None, gets=None, cues=None, batched=None):
+        """
+        Parameters:
+            hby (Habery): with habs of identifiers to receipt
+            msgs (Deck): dicts of pre and sn of events to receipt
+            gets (Deck): dicts of pre and sn of events to query receipts of
+            cues (Deck): msgs once receipted
+            batched (bool | None): True means post many messages in each request
+                as application/cesr. Falls back to one request per message when a
+                witness does not accept it. None means use hby.batched
+        """
+        self.batched = batched if batched is not None else hby.batched
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.gets = gets if gets is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
-        self.clienter = httping.Clienter()
+        self.clienter = httping.Clienter(pool=hby.pool)
 
         doers = [self.clienter, doing.doify(self.witDo), doing.doify(self.gitDo)]
         self.hby = hby
@@ -118,11 +128,7 @@ class Receiptor(doing.DoDoer):
             for wig in wigs:
                 msg.extend(wig)
 
-            client = clients[wit]
-
-            sent = httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(msg))
-            while len(client.responses) < sent:
-                yield self.tock
+            yield from self.post(clients[wit], wit, msg)
 
         self.remove(doers)
 
@@ -188,13 +194,53 @@ class Receiptor(doing.DoDoer):
         client, clientDoer = httpClient(hab, wit)
         self.extend([clientDoer])
 
+        msgs = bytearray()
         for fmsg in hab.db.clonePreIter(pre=pre):
-            httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(fmsg))
-            while not client.responses:
-                yield self.tock
+            msgs.extend(fmsg)
+
+        yield from self.post(client, wit, msgs)
 
         self.remove([clientDoer])
 
+    def post(self, client, wit, msgs):
+        """ Returns generator that posts messages to witness and waits for responses
+
+        Posts batches of messages as application/cesr when .batched. When the
+        witness does not accept batches, answering 406, posts one request per
+        message instead from then on.
+
+        Parameters:
+            client (Client): hio http client connected to witness
+            wit (str): qualified base64 AID of the witness
+            msgs (bytearray): stream of messages with attachments
+
+        Returns:
+            list: of Response of each request
+
+        """
+        if self.batched:
+            sent = httping.batchCESRRequests(client=client, dest=wit, ims=bytearray(msgs))
+            reps = yield from self.respond(client, sent)
+            if not any(rep.status == 406 for rep in reps):
+                return reps
+
+            logger.info("Witness %s does not accept batched messages", wit)
+            self.batched = False
+
+        sent = httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(msgs))
+        return (yield from self.respond(client, sent))
+
+    def respond(self, client, count):
+        """ Returns generator that waits for and returns count responses of client """
+        reps = []
+        while len(reps) < count:
+            while client.responses:
+                reps.append(client.respond())
+            if len(reps) < count:
+                yield self.tock
+
+        return reps
+
     def witDo(self, tymth=None, tock=0.0):
         """
          Returns doifiable Doist compatibile generator method (doer dog) to process
@@ -261,9 +307,38 @@ class WitnessReceiptor(doing.DoDoer):
     receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
     and an `all` method that runs and waits for more messages to receipt.
 
+    Events are receipted concurrently. Messengers are pooled per witness and shared
+    by all events until none have been in progress for .LingerMessenger seconds.
+    Waiting for receipts is woken by the db .wigNotifier when witness signatures
+    of the event are stored instead of reading them every tock. Events not fully
+    receipted within .timeout are given up and appended to .failed. Callers that
+    only watch .cues must keep the default of no timeout.
+
+    Class Attributes:
+        LingerMessenger (float): seconds pooled messengers are kept after the last
+            event is done so that witnesses process what was sent before the
+            connections close
+
+    Attributes:
+        hby (Habery): environment of identifiers to receipt
+        force (bool): True means send witnesses all receipts even if complete
+        msgs (Deck): incoming dicts with pre and optional sn of events to receipt
+        cues (Deck): outgoing dicts from .msgs of fully receipted events
+        failed (Deck): outgoing dicts from .msgs of events that timed out
+        timeout (float | None): seconds to wait for full set of receipts.
+            None or 0 means wait forever
+        witers (dict): pooled messengers keyed by witness prefix qb64
+        latencies (dict): receipt latency meters keyed by witness prefix qb64.
+            Each meter is list [count, total, last, max] of seconds from send
+            to receipt stored
+        timeouts (dict): number of receipts timed out keyed by witness prefix qb64
+        batched (bool): True means messengers post many messages in each request
+
     """
+    LingerMessenger = 1.0
 
-    def __init__(self, hby, msgs=None, cues=None, force=False, **kwa):
+    def __init__(self, hby, msgs=None, cues=None, force=False, timeout=None, failed=None,
+                 batched=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
@@ -273,15 +348,48 @@ class WitnessReceiptor(doing.DoDoer):
             msgs (Deck): incoming messages to publish to witnesses
             cues (Deck): outgoing cues of successful messages
             force (bool): True means to send witnesses all receipts even if we have a full compliment.
+            timeout (float | None): seconds to wait for full set of receipts.
+                None means wait forever
+            failed (Deck): outgoing cues of messages whose receipts timed out
+            batched (bool | None): True means messengers post many messages in
+                each request as application/cesr. None means use hby.batched
 
         """
         self.hby = hby
         self.force = force
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
+        self.failed = failed if failed is not None else decking.Deck()
+        self.timeout = timeout
+        self.batched = batched if batched is not None else hby.batched
+        self.witers = dict()
+        self.latencies = dict()
+        self.timeouts = dict()
 
         super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
 
+    def messenger(self, hab, wit):
+        """ Returns pooled messenger for witness wit creating it if needed
+
+        Parameters:
+            hab (Hab): environment to use to look up witness URLs
+            wit (str): qb64 identifier prefix of witness
+
+        """
+        if (witer := self.witers.get(wit)) is None:
+            witer = self.witers[wit] = messenger(hab, wit, batched=self.batched)
+            self.extend([witer])
+        return witer
+
+    def record(self, wit, elapsed):
+        """ Record receipt latency elapsed seconds of witness wit """
+        if (meter := self.latencies.get(wit)) is None:
+            meter = self.latencies[wit] = [0, 0.0, 0.0, 0.0]
+        meter[0] += 1
+        meter[1] += elapsed
+        meter[2] = elapsed
+        meter[3] = max(meter[3], elapsed)
+
     def receiptDo(self, tymth=None, tock=0.0):
         """
         Returns doifiable Doist compatible generator method (doer dog)
@@ -299,111 +407,146 @@ class WitnessReceiptor(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        receipts = []  # generators of events being receipted concurrently
+        used = self.tyme  # last tyme pooled messengers were used
         while True:
             while self.msgs:
-                evt = self.msgs.popleft()
-                pre = evt["pre"]
+                receipts.append(self.receiptIter(self.msgs.popleft()))
 
-                if pre not in self.hby.habs:
-                    continue
+            for receipt in list(receipts):
+                try:
+                    next(receipt)
+                except StopIteration:
+                    receipts.remove(receipt)
 
-                hab = self.hby.habs[pre]
+            if receipts:
+                used = self.tyme
+            elif self.witers and self.tyme - used >= self.LingerMessenger:  # release pool
+                self.remove(list(self.witers.values()))
+                self.witers.clear()
 
-                sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
-                wits = hab.kever.wits
+            yield self.tock
 
-                if len(wits) == 0:
-                    continue
+    def receiptIter(self, evt):
+        """
+        Returns generator that receipts one event with its witnesses. Each yield
+        means still waiting.
 
-                msg = hab.makeOwnEvent(sn=sn)
-                ser = coring.Serder(raw=msg)
+        Parameters:
+            evt (dict): with pre and optional sn of event to receipt
 
-                dgkey = dbing.dgKey(ser.preb, ser.saidb)
+        """
+        pre = evt["pre"]
 
-                witers = []
-                for wit in wits:
-                    witer = messenger(hab, wit)
-                    witers.append(witer)
-                    self.extend([witer])
+        if pre not in self.hby.habs:
+            return
+
+        hab = self.hby.habs[pre]
+
+        sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
+        wits = hab.kever.wits
+
+        if len(wits) == 0:
+            return
 
-                # Check to see if we already have all the receipts we need for this event
-                wigs = hab.db.getWigs(dgkey)
-                completed = len(wigs) == len(wits)
-                if len(wigs) != len(wits):  # We have all the receipts, skip
-                    for idx, witer in enumerate(witers):
-                        wit = wits[idx]
+        msg = hab.makeOwnEvent(sn=sn)
+        ser = coring.Serder(raw=msg)
 
-                        for dmsg in hab.db.cloneDelegation(hab.kever):
-                            witer.msgs.append(bytearray(dmsg))
+        dgkey = dbing.dgKey(ser.preb, ser.saidb)
 
-                        if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
-                                "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
-                            for fmsg in hab.db.clonePreIter(pre=pre):
-                                witer.msgs.append(bytearray(fmsg))
+        witers = [self.messenger(hab, wit) for wit in wits]
 
-                        witer.msgs.append(bytearray(msg))  # make a copy
-                        _ = (yield self.tock)
+        wigged = []  # notifications of stored wigs
 
-                    while True:
-                        wigs = hab.db.getWigs(dgkey)
-                        if len(wigs) == len(wits):
-                            break
-                        _ = yield self.tock
+        def notify(key):
+            wigged.append(key)
 
-                # If we started with all our recipts, exit unless told to force resubmit of all receipts
-                if completed and not self.force:
-                    self.cues.append(evt)
-                    continue
+        hab.db.wigNotifier.watch(dgkey, notify)
+        try:
+            # Check to see if we already have all the receipts we need for this event
+            wigs = hab.db.getWigs(dgkey)
+            completed = len(wigs) == len(wits)
+            if not completed:
+                for witer in witers:  # fan out to all witnesses at once
+                    wit = witer.wit
 
-                # generate all rct msgs to send to all witnesses
-                awigers = [coring.Siger(qb64b=bytes(wig)) for wig in wigs]
+                    for dmsg in hab.db.cloneDelegation(hab.kever):
+                        witer.msgs.append(bytearray(dmsg))
 
-                # make sure all witnesses have fully receipted KERL and know about each other
-                for witer in witers:
-                    ewits = []
-                    wigers = []
-                    for i, wit in enumerate(wits):
-                        if wit == witer.wit:
-                            continue
-                        ewits.append(wit)
-                        wigers.append(awigers[i])
+                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
+                            "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
+                        for fmsg in hab.db.clonePreIter(pre=pre):
+                            witer.msgs.append(bytearray(fmsg))
 
-                    if len(wigers) == 0:
+                    witer.msgs.append(bytearray(msg))  # make a copy
+
+                start = self.tyme
+                seen = set(coring.Siger(qb64b=bytes(wig)).index for wig in wigs)
+                while len(wigs) != len(wits):
+                    if wigged:  # wake on stored wigs
+                        wigged.clear()
+                        wigs = hab.db.getWigs(dgkey)
+                        for wig in wigs:
+                            index = coring.Siger(qb64b=bytes(wig)).index
+                            if index not in seen and index < len(wits):
+                                seen.add(index)
+                                self.record(wits[index], self.tyme - start)
                         continue
 
-                    rctMsg = bytearray()
+                    if self.timeout and self.tyme - start >= self.timeout:
+                        missing = [wit for index, wit in enumerate(wits) if index not in seen]
+                        for wit in missing:
+                            self.timeouts[wit] = self.timeouts.get(wit, 0) + 1
+                        logger.error("WitnessReceiptor: timed out receipting %s sn=%s "
+                                     "missing %s", pre, sn, missing)
+                        self.failed.append(evt)
+                        return
+
+                    yield
+        finally:
+            hab.db.wigNotifier.unwatch(dgkey, notify)
+
+        # If we started with all our recipts, exit unless told to force resubmit of all receipts
+        if completed and not self.force:
+            self.cues.append(evt)
+            return
 
-                    # Now that the witnesses have not met each other, send them each other's receipts
-                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-                    elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
-                            ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
+        # generate all rct msgs to send to all witnesses
+        awigers = [coring.Siger(qb64b=bytes(wig)) for wig in wigs]
 
-                    rserder = eventing.receipt(pre=ser.pre,
-                                               sn=sn,
-                                               said=ser.said)
-                    rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
+        # make sure all witnesses have fully receipted KERL and know about each other
+        for witer in witers:
+            ewits = []
+            wigers = []
+            for i, wit in enumerate(wits):
+                if wit == witer.wit:
+                    continue
+                ewits.append(wit)
+                wigers.append(awigers[i])
 
-                    witer.msgs.append(rctMsg)
-                    _ = (yield self.tock)
+            if len(wigers) == 0:
+                continue
 
-                while True:
-                    done = True
-                    for witer in witers:
-                        if not witer.idle:
-                            yield 1.0
-                            done = False
-                            break
-                    if done:
-                        break
+            rctMsg = bytearray()
 
-                self.remove(witers)
+            # Now that the witnesses have not met each other, send them each other's receipts
+            if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
+                rctMsg.extend(schemes(self.hby.db, eids=ewits))
+            elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
+                    ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
+                rctMsg.extend(schemes(self.hby.db, eids=ewits))
 
-                self.cues.append(evt)
-                yield self.tock
+            rserder = eventing.receipt(pre=ser.pre,
+                                       sn=sn,
+                                       said=ser.said)
+            rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
 
-            yield self.tock
+            witer.msgs.append(rctMsg)
+
+        while any(witer.msgs or not witer.idle for witer in witers):  # until all sent
+            yield
+
+        self.cues.append(evt)
 
 
 class WitnessInquisitor(doing.DoDoer):
@@ -486,10 +629,10 @@ class WitnessInquisitor(doing.DoDoer):
                     continue
 
                 ctrl, locs = random.choice(list(end.items()))
-                witer = messengerFrom(hab=hab, pre=ctrl, urls=locs)
+                witer = messengerFrom(hab=hab, pre=ctrl, urls=locs, batched=self.hby.batched)
             else:
                 wit = random.choice(wits)
-                witer = messenger(hab, wit)
+                witer = messenger(hab, wit, batched=self.hby.batched)
 
             self.extend([witer])
 
@@ -590,7 +733,7 @@ class WitnessPublisher(doing.DoDoer):
 
                 witers = []
                 for wit in wits:
-                    witer = messenger(hab, wit)
+                    witer = messenger(hab, wit, batched=self.hby.batched)
                     witers.append(witer)
                     witer.msgs.append(bytearray(msg))  # make a copy so everyone munges their own
                     self.extend([witer])
@@ -712,18 +855,24 @@ class HTTPMessenger(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, batched=False, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            batched (bool): True means post each msg as one application/cesr
+                request. Falls back to one request per message when the
+                recipient does not accept it.
 
         """
         self.hab = hab
         self.wit = wit
+        self.batched = batched
         self.posted = 0
+        self.responded = 0
+        self.refused = 0  # responses of 406 not acceptable
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
@@ -734,8 +883,11 @@ class HTTPMessenger(doing.DoDoer):
         if up.scheme != kering.Schemes.http:
             raise ValueError(f"invalid scheme {up.scheme} for HTTPMessenger")
 
-        self.client = http.clienting.Client(hostname=up.hostname, port=up.port)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
+        if hab.pool is not None:
+            self.client, clientDoer = hab.pool.lease(url)
+        else:
+            self.client = http.clienting.Client(hostname=up.hostname, port=up.port)
+            clientDoer = http.clienting.ClientDoer(client=self.client)
 
         doers.extend([clientDoer])
 
@@ -757,7 +909,20 @@ class HTTPMessenger(doing.DoDoer):
                 yield self.tock
 
             msg = self.msgs.popleft()
-            self.posted += httping.streamCESRRequests(client=self.client, dest=self.wit, ims=msg)
+            if self.batched:
+                refused = self.refused
+                self.posted += httping.batchCESRRequests(client=self.client, dest=self.wit,
+                                                         ims=bytearray(msg))
+                while self.responded < self.posted:
+                    yield self.tock
+
+                if self.refused > refused:
+                    logger.info("Recipient %s does not accept batched messages", self.wit)
+                    self.batched = False
+
+            if not self.batched:
+                self.posted += httping.streamCESRRequests(client=self.client, dest=self.wit, ims=msg)
+
             while self.client.requests:
                 yield self.tock
 
@@ -775,6 +940,12 @@ class HTTPMessenger(doing.DoDoer):
         while True:
             while self.client.responses:
                 rep = self.client.respond()
+                self.responded += 1
+                if rep.status == 406:
+                    self.refused += 1
+                if rep.status >= 400:
+                    logger.error("Recipient %s failed request with status %s: %s",
+                                 self.wit, rep.status, bytes(rep.body))
                 self.sent.append(rep)
                 yield
             yield
@@ -800,34 +971,38 @@ def mailbox(hab, cid):
     return mbx
 
 
-def messenger(hab, pre):
+def messenger(hab, pre, batched=False):
     """ Create a Messenger (tcp or http) based on available endpoints
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         pre (str): qb64 identifier prefix of recipient to create a messanger for
+        batched (bool): True means http messenger posts many messages in each
+            request as application/cesr
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     urls = hab.fetchUrls(eid=pre)
-    return messengerFrom(hab, pre, urls)
+    return messengerFrom(hab, pre, urls, batched=batched)
 
 
-def messengerFrom(hab, pre, urls):
+def messengerFrom(hab, pre, urls, batched=False):
     """ Create a Witnesser (tcp or http) based on provided endpoints
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         urls (dict): map of schemes to urls of available endpoints
+        batched (bool): True means http messenger posts many messages in each
+            request as application/cesr
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     if kering.Schemes.http in urls:
         url = urls[kering.Schemes.http]
-        witer = HTTPMessenger(hab=hab, wit=pre, url=url)
+        witer = HTTPMessenger(hab=hab, wit=pre, url=url, batched=batched)
     elif kering.Schemes.tcp in urls:
         url = urls[kering.Schemes.tcp]
         witer = TCPMessenger(hab=hab, wit=pre, url=url)
@@ -840,6 +1015,9 @@ def messengerFrom(hab, pre, urls):
 def httpClient(hab, wit):
     """ Create and return a http.client and http.ClientDoer for the witness
 
+    The client is leased from the connection pool of the hab when it has one
+    so its connection is reused once the ClientDoer is removed.
+
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         wit (str): qb64 identifier prefix of witness for which to create a client
@@ -853,6 +1031,9 @@ def httpClient(hab, wit):
     if not urls:
         raise kering.MissingEntryError(f"unable to query witness {wit}, no http endpoint")
 
+    if hab.pool is not None:
+        return hab.pool.lease(urls[kering.Schemes.http])
+
     up = urlparse(urls[kering.Schemes.http])
     client = http.clienting.Client(hostname=up.hostname, port=up.port)
     clientDoer = http.clienting.ClientDoer(client=client)
@@ -12,7 +12,7 @@ from hio.base import doing
 
 from keri.core import eventing
 from keri.app.cli.common import existing
-from keri.db import dbing
+from keri.db import dbing, escrowing
 from keri.kering import ConfigurationError
 from keri.vdr import viring
 
@@ -28,6 +28,8 @@ parser.add_argument('--passcode', '-p', help='22 character encryption passcode f
                     dest="bran", default=None)  # passcode => bran
 
 parser.add_argument("--escrow", "-e", help="show values for one specific escrow", default=None)
+parser.add_argument("--metrics", "-m", help="show escrow metrics in Prometheus text format instead of values",
+                    action="store_true")
 
 
 def handler(args):
@@ -51,6 +53,10 @@ def escrows(tymth, tock=0.0, **opts):
         with existing.existingHby(name=name, base=base, bran=bran) as hby:
             reger = viring.Reger(name=hby.name, db=hby.db, temp=False)
 
+            if args.metrics:
+                print(escrowing.metricsText(hby.db, reger=reger), end="")
+                return 0
+
             escrows = dict()
             if (not escrow) or escrow == "out-of-order-events":
                 oots = list()
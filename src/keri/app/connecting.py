@@ -3,7 +3,6 @@
 keri.app.connecting module
 
 """
-import re
 import json
 
 from ordered_set import OrderedSet as oset
@@ -12,7 +11,20 @@ from keri import kering
 
 
 class Organizer:
-    """ Organizes contacts relating contact information to AIDs """
+    """ Organizes contacts relating contact information to AIDs
+
+    Field values are indexed in .hby.db.cfvx by field then value and in
+    .hby.db.cfsx by field then each casefolded suffix of value so that
+    .find and .values are prefix scans of the index instead of full scans.
+    The indices are rebuilt once when .IndexVersion is not the version marked
+    in .hby.db.hbys under .IndexKey such as for contacts saved before the
+    indices existed.
+
+    """
+    ValueSize = 256  # max bytes of value in value index key
+    SuffixSize = 32  # max chars of suffix in substring index key
+    IndexKey = "__contacts_index__"  # key in hbys of version of indices
+    IndexVersion = "1"  # version of index schema
 
     def __init__(self, hby):
         """ Create contact Organizer
@@ -22,6 +34,10 @@ class Organizer:
         """
         self.hby = hby
 
+        db = self.hby.db
+        if db.hbys.get(self.IndexKey) != self.IndexVersion and not db.readonly:
+            self.reindex()
+
     def update(self, pre, data):
         """ Add or update contact information in data for the identifier prefix
 
@@ -30,20 +46,26 @@ class Organizer:
             data (dict): data to add to or update in contact information
 
         """
-        existing = self.get(pre)
-        if existing is None:
-            existing = dict()
+        with self.hby.db.transact():
+            existing = self.get(pre)
+            if existing is None:
+                existing = dict()
 
-        existing |= data
+            for field, val in data.items():
+                if field in existing and existing[field] != val:
+                    self._unindex(pre, field, existing[field])
 
-        raw = json.dumps(existing).encode("utf-8")
-        cigar = self.hby.signator.sign(ser=raw)
+            existing |= data
 
-        self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
-        self.hby.db.cons.pin(keys=(pre,), val=raw)
+            raw = json.dumps(existing).encode("utf-8")
+            cigar = self.hby.signator.sign(ser=raw)
 
-        for field, val in data.items():
-            self.hby.db.cfld.pin(keys=(pre, field), val=val)
+            self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
+            self.hby.db.cons.pin(keys=(pre,), val=raw)
+
+            for field, val in data.items():
+                self.hby.db.cfld.pin(keys=(pre, field), val=val)
+                self._index(pre, field, val)
 
     def replace(self, pre, data):
         """ Replace all contact information for identifier prefix with data
@@ -65,10 +87,10 @@ class Organizer:
             val (Union[str,bytes]): data value
 
         """
-        data = self.get(pre) or dict()
-        data[field] = val
-        self.replace(pre, data)
-        self.hby.db.cfld.pin(keys=(pre, field), val=val)
+        with self.hby.db.transact():
+            data = self.get(pre) or dict()
+            data[field] = val
+            self.replace(pre, data)
 
     def unset(self, pre, field):
         """ Remove field from contact information for identifier prefix
@@ -78,10 +100,10 @@ class Organizer:
             field (str): field to remove
 
         """
-        data = self.get(pre)
-        del data[field]
-        self.replace(pre, data)
-        self.hby.db.cfld.rem(keys=(pre, field))
+        with self.hby.db.transact():
+            data = self.get(pre)
+            del data[field]
+            self.replace(pre, data)
 
     def rem(self, pre):
         """ Remove all contact information for identifier prefix
@@ -92,9 +114,12 @@ class Organizer:
         Returns:
 
         """
-        self.hby.db.ccigs.rem(keys=(pre,))
-        self.hby.db.cons.rem(keys=(pre,))
-        return self.hby.db.cfld.trim(keys=(pre,))
+        with self.hby.db.transact():
+            for (_, field), val in self.hby.db.cfld.getItemIter(keys=(pre, "")):
+                self._unindex(pre, field, val)
+            self.hby.db.ccigs.rem(keys=(pre,))
+            self.hby.db.cons.rem(keys=(pre,))
+            return self.hby.db.cfld.trim(keys=(pre,))
 
     def get(self, pre, field=None):
         """ Retrieve all contact information for identifier prefix
@@ -154,19 +179,39 @@ class Organizer:
 
         Parameters:
             field (str): field name to search for
-            val (Union[str,bytes,list]): value to search for
+            val (str): case insensitive substring of value to search for
 
         Returns:
             list: All contacts that match the val in field
 
         """
-        pres = []
-        prog = re.compile(f".*{val}.*", re.I)
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field and prog.match(v):
-                pres.append(pre)
+        return [self.get(pre) for pre in self.search(field, val)]
 
-        return [self.get(pre) for pre in pres]
+    def search(self, field, val=None):
+        """ Returns identifier prefixes of contacts that have val in field
+
+        Parameters:
+            field (str): field name to search for
+            val (str | None): case insensitive substring of value to search for.
+                None means any value
+
+        Returns:
+            list: qb64 prefixes in order
+
+        """
+        if not val:
+            top = (field, "")
+            pres = set(pre for _, pre in self.hby.db.cfvx.getItemIter(keys=top))
+            # field with sep may also match so verify
+            return sorted(pre for pre in pres
+                          if self.hby.db.cfld.get(keys=(pre, field)) is not None)
+
+        val = val.casefold()
+        top = (field, val[:self.SuffixSize])  # no trailing sep so prefix of suffix
+        pres = set(pre for _, pre in self.hby.db.cfsx.getItemIter(keys=top))
+        # scan may match across sep into next key segment or suffix truncated so verify
+        return sorted(pre for pre in pres
+                      if val in str(self.hby.db.cfld.get(keys=(pre, field)) or "").casefold())
 
     def values(self, field, val=None):
         """ Find unique values for field in all contacts
@@ -179,16 +224,61 @@ class Organizer:
             list: Unique values from all contacts for field
 
         """
-        prog = re.compile(f".*{val}.*", re.I) if val is not None else None
-
         vals = oset()
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field:
-                if prog is None or prog.match(v):
+        if val:
+            for pre in self.search(field, val):
+                if (v := self.hby.db.cfld.get(keys=(pre, field))) is not None:
                     vals.add(v)
+            return list(vals)
+
+        top = f"{field}.".encode("utf-8")
+        for _, pre in self.hby.db.getTopItemIter(db=self.hby.db.cfvx.sdb, key=top):
+            # index value may be truncated or field with sep may also match
+            v = self.hby.db.cfld.get(keys=(bytes(pre).decode("utf-8"), field))
+            if v is not None:
+                vals.add(v)
 
         return list(vals)
 
+    def reindex(self):
+        """ Rebuild field value indices from all contact information and mark
+        them as .IndexVersion
+
+        Returns:
+            int: number of field values indexed
+
+        """
+        count = 0
+        with self.hby.db.transact():
+            self.hby.db.cfvx.trim()
+            self.hby.db.cfsx.trim()
+            for (pre, field), val in self.hby.db.cfld.getItemIter():
+                self._index(pre, field, val)
+                count += 1
+            self.hby.db.hbys.pin(self.IndexKey, self.IndexVersion)
+        return count
+
+    def _index(self, pre, field, val):
+        """ Add val of field of pre to value and substring indices """
+        for keys, suber in self._indexKeys(pre, field, val):
+            suber.pin(keys=keys, val=pre)
+
+    def _unindex(self, pre, field, val):
+        """ Remove val of field of pre from value and substring indices """
+        for keys, suber in self._indexKeys(pre, field, val):
+            suber.rem(keys=keys)
+
+    def _indexKeys(self, pre, field, val):
+        """ Returns list of (keys, suber) index entries of val of field of pre """
+        if not isinstance(val, str):
+            return []
+        value = val.encode("utf-8")[:self.ValueSize].decode("utf-8", "ignore")
+        entries = [((field, value, pre), self.hby.db.cfvx)]
+        folded = val.casefold()
+        for suffix in {folded[i:i + self.SuffixSize] for i in range(len(folded))}:
+            entries.append(((field, suffix, pre), self.hby.db.cfsx))
+        return entries
+
     def setImg(self, pre, typ, stream):
         """ Upload image for identifier prefix
 
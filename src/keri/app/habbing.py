@@ -13,7 +13,7 @@ from hio.base import doing
 from hio.help import hicting
 
 from keri.peer import exchanging
-from . import keeping, configing
+from . import keeping, configing, pooling
 from .. import help
 from .. import kering
 from ..core import coring, eventing, parsing, routing
@@ -130,6 +130,10 @@ class Habery:
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        pool (pooling.ClientPool): persistent HTTP client connections shared
+            by .habs
+        batched (bool): True means post CESR messages to witnesses and agents
+            in batches. Set by "batched" of config file
 
         habs (dict): Hab instances keyed by prefix.
             To look up Hab by name get prefix from db.habs .prefix field using
@@ -225,6 +229,8 @@ class Habery:
         self.kvy = eventing.Kevery(db=self.db, lax=False, local=True, rvy=self.rvy)
         self.kvy.registerReplyRoutes(router=self.rtr)
         self.psr = parsing.Parser(framed=True, kvy=self.kvy, rvy=self.rvy, exc=self.exc)
+        self.pool = pooling.ClientPool()
+        self.batched = False  # post CESR messages to witnesses in batches
         self.habs = {}  # empty .habs
         self.namespaces = {}  # empty .namespaces
         self._signator = None
@@ -332,21 +338,21 @@ class Habery:
             # create Hab instance and inject dependencies
             if habord.mid and not habord.sid:
                 hab = GroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                               rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                               rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                                name=name, pre=pre, temp=self.temp, smids=habord.smids)
                 groups.append(habord)
             elif habord.sid and not habord.mid:
                 hab = SignifyHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                                 rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                                 rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                                  name=name, pre=habord.sid)
             elif habord.sid and habord.mid:
                 hab = SignifyGroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                                      rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                                      rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                                       name=name, pre=habord.sid)
                 groups.append(habord)
             else:
                 hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                          rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                          rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                           name=name, pre=pre, temp=self.temp)
 
             # Rules for acceptance
@@ -368,21 +374,21 @@ class Habery:
             # create Hab instance and inject dependencies
             if habord.mid and not habord.sid:
                 hab = GroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                               rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                               rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                                name=name, ns=ns, pre=pre, temp=self.temp, smids=habord.smids)
                 groups.append(habord)
             elif habord.sid and not habord.mid:
                 hab = SignifyHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                                 rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                                 rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                                  name=name, ns=ns, pre=habord.sid)
             elif habord.sid and habord.mid:
                 hab = SignifyGroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                                      rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                                      rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                                       name=name, pre=habord.sid)
                 groups.append(habord)
             else:
                 hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                          rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                          rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                           name=name, ns=ns, pre=pre, temp=self.temp)
 
             # Rules for acceptance
@@ -429,7 +435,7 @@ class Habery:
 
         cf = cf if cf is not None else self.cf
         hab = Hab(ks=self.ks, db=self.db, cf=cf, mgr=self.mgr,
-                  rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                  rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                   name=name, ns=ns, temp=self.temp)
 
         hab.make(**kwa)
@@ -508,7 +514,7 @@ class Habery:
 
         # create group Hab in this Habery
         hab = GroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                       rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                       rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                        name=group, ns=ns, mhab=mhab, smids=smids, rmids=rmids, temp=self.temp)
 
         hab.make(**kwa)  # finish making group hab with injected pass throughs
@@ -562,7 +568,7 @@ class Habery:
 
         # create group Hab in this Habery
         hab = GroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                       rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                       rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                        name=group, ns=ns, mhab=mhab, smids=smids, rmids=rmids, temp=self.temp)
 
         hab.pre = pre
@@ -587,7 +593,7 @@ class Habery:
     def makeSignifyHab(self, name, ns=None, **kwa):
         # create group Hab in this Habery
         hab = SignifyHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                         rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                         rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                          name=name, ns=ns, temp=self.temp)
 
         hab.make(**kwa)  # finish making group hab with injected pass throughs
@@ -603,7 +609,7 @@ class Habery:
     def makeSignifyGroupHab(self, name, mhab, ns=None, **kwa):
         # create group Hab in this Habery
         hab = SignifyGroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                              rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                              rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                               name=name, mhab=mhab, ns=ns, temp=self.temp)
 
         hab.make(**kwa)  # finish making group hab with injected pass throughs
@@ -680,6 +686,8 @@ class Habery:
         if self.cf:
             self.cf.close(clear=self.cf.temp)
 
+        self.pool.close()
+
     @property
     def kevers(self):
         """
@@ -744,8 +752,13 @@ class Habery:
           dt: "isodatetime",
           curls: ["tcp://localhost:5620/"],
           iurls: ["tcp://localhost:5621/?name=eve"],
+          batched: true,
         }
 
+        batched true means messengers post many CESR messages in each request
+        to witnesses and agents falling back to one request per message for
+        those that do not accept batches.
+
         Config file is meant to be read only at init not changed by app at
         run time. Any dynamic app changes must go in database not config file
         that way we don't have to worry about multiple writers of cf.
@@ -754,6 +767,7 @@ class Habery:
 
         """
         conf = self.cf.get()
+        self.batched = bool(conf.get("batched", False))
         if "dt" in conf:  # datetime of config file
             dt = help.fromIso8601(conf["dt"])  # raises error if not convert
             if "iurls" in conf:  # process OOBI URLs
@@ -913,6 +927,8 @@ class BaseHab:
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        pool (pooling.ClientPool | None): persistent HTTP client connections
+            shared by Habs of Habery
 
 
      Attributes:
@@ -937,7 +953,7 @@ class BaseHab:
 
     """
 
-    def __init__(self, ks, db, cf, mgr, rtr, rvy, kvy, psr, *,
+    def __init__(self, ks, db, cf, mgr, rtr, rvy, kvy, psr, *, pool=None,
                  name='test', ns=None, pre=None, temp=False):
         """
         Initialize instance.
@@ -951,6 +967,8 @@ class BaseHab:
             rvy (routing.Revery): factory that processes reply 'rpy' messages
             kvy (eventing.Kevery): factory for local processing of local event msgs
             psr (parsing.Parser):  parses local messages for .kvy .rvy
+            pool (pooling.ClientPool | None): persistent HTTP client
+                connections shared by Habs of Habery
 
 
         Parameters:
@@ -969,6 +987,7 @@ class BaseHab:
         self.rvy = rvy  # injected
         self.kvy = kvy  # injected
         self.psr = psr  # injected
+        self.pool = pool  # injected
 
         self.name = name
         self.ns = ns
@@ -1435,6 +1454,24 @@ class BaseHab:
         Returns replay of FEL first seen event log for pre starting from fn
         Default pre is own .pre
 
+        Parameters:
+            pre is qb64 str or bytes of identifier prefix.
+                default is own .pre
+            fn is int first seen ordering number
+
+        """
+        msgs = bytearray()
+        for msg in self.replayIter(pre=pre, fn=fn):
+            msgs.extend(msg)
+
+        return msgs
+
+    def replayIter(self, pre=None, fn=0):
+        """
+        Returns iterator of messages of replay of FEL first seen event log for
+        pre starting from fn. Default pre is own .pre. Same as .replay but
+        one message at a time so replay of long KEL may be streamed.
+
         Parameters:
             pre is qb64 str or bytes of identifier prefix.
                 default is own .pre
@@ -1444,15 +1481,11 @@ class BaseHab:
         if not pre:
             pre = self.pre
 
-        msgs = bytearray()
         kever = self.kevers[pre]
-        for msg in self.db.cloneDelegation(kever=kever):
-            msgs.extend(msg)
+        yield from self.db.cloneDelegation(kever=kever)
 
-        for msg in self.db.clonePreIter(pre=pre, fn=fn):
-            msgs.extend(msg)
-
-        return msgs
+        replayer = basing.Replayer(db=self.db)
+        yield from replayer.cloneIter(pre=pre, fn=fn)
 
     def replayAll(self, key=b''):
         """
@@ -1463,7 +1496,8 @@ class BaseHab:
 
         """
         msgs = bytearray()
-        for msg in self.db.cloneAllPreIter(key=key):
+        replayer = basing.Replayer(db=self.db)
+        for msg in replayer.cloneAllIter(key=key):
             msgs.extend(msg)
         return msgs
 
@@ -1855,12 +1889,27 @@ class BaseHab:
             scheme (str): url scheme
         """
         msgs = bytearray()
+        for msg in self.replyEndRoleIter(cid=cid, role=role, eids=eids, scheme=scheme):
+            msgs.extend(msg)
+        return msgs
+
+    def replyEndRoleIter(self, cid, role=None, eids=None, scheme=""):
+        """
+        Returns iterator of messages of reply message stream of .replyEndRole
+        so the stream including KEL replay may be sent as it is generated.
 
+        Parameters:
+            cid (str): identifier prefix qb64 of controller authZ endpoint provided
+                       eid is witness
+            role (str): authorized role for eid
+            eids (list): when provided restrict returns to only eids in eids
+            scheme (str): url scheme
+        """
         if eids is None:
             eids = []
 
         if cid not in self.kevers:
-            return msgs
+            return
 
         kever = self.kevers[cid]
         witness = self.pre in kever.wits  # see if we are cid's witness
@@ -1870,19 +1919,18 @@ class BaseHab:
             for eid in kever.wits:
                 if not eids or eid in eids:
                     if eid == self.pre:
-                        msgs.extend(self.replyLocScheme(eid=eid, scheme=scheme))
+                        yield self.replyLocScheme(eid=eid, scheme=scheme)
                     else:
-                        msgs.extend(self.loadLocScheme(eid=eid, scheme=scheme))
+                        yield self.loadLocScheme(eid=eid, scheme=scheme)
                     if not witness:  # we are not witness, send auth records
-                        msgs.extend(self.makeEndRole(eid=eid, role=role))
+                        yield self.makeEndRole(eid=eid, role=role)
 
         for (_, erole, eid), end in self.db.ends.getItemIter(keys=(cid,)):
             if (end.enabled or end.allowed) and (not role or role == erole) and (not eids or eid in eids):
-                msgs.extend(self.replyLocScheme(eid=eid, scheme=scheme))
-                msgs.extend(self.loadEndRole(cid=cid, eid=eid, role=erole))
+                yield self.replyLocScheme(eid=eid, scheme=scheme)
+                yield self.loadEndRole(cid=cid, eid=eid, role=erole)
 
-        msgs.extend(self.replay(cid))
-        return msgs
+        yield from self.replayIter(cid)
 
     def replyToOobi(self, aid, role, eids=None):
         """
@@ -1908,6 +1956,18 @@ class BaseHab:
         # not permiteed in .habs.oobis
         return self.replyEndRole(cid=aid, role=role, eids=eids)
 
+    def replyToOobiIter(self, aid, role, eids=None):
+        """
+        Returns iterator of messages of reply message stream of .replyToOobi
+
+        Parameters:
+            aid (str): qb64 of identifier in oobi, may be cid or eid
+            role (str): authorized role for eid
+            eids (list): when provided restrict returns to only eids in eids
+
+        """
+        return self.replyEndRoleIter(cid=aid, role=role, eids=eids)
+
     def getOwnEvent(self, sn, allowPartiallySigned=False):
         """
         Returns: message Serder and controller signatures of
@@ -2051,6 +2111,8 @@ class Hab(BaseHab):
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        pool (pooling.ClientPool | None): persistent HTTP client connections
+            shared by Habs of Habery
 
 
      Attributes:
@@ -2324,33 +2386,10 @@ class SignifyHab(BaseHab):
             raise kering.ConfigurationError(f"Improper Habitat event type={serder.ked['t']} for "
                                             f"pre={self.pre}.")
 
-    def replyEndRole(self, cid, role=None, eids=None, scheme=""):
-
+    def replyEndRoleIter(self, cid, role=None, eids=None, scheme=""):
         """
-        Returns a reply message stream composed of entries authed by the given
-        cid from the appropriate reply database including associated attachments
-        in order to disseminate (percolate) BADA reply data authentication proofs.
-
-        Currently uses promiscuous model for permitting endpoint discovery.
-        Future is to use identity constraint graph to constrain discovery
-        of whom by whom.
-
-        cid and not role and not scheme then:
-            end authz for all eids in all roles and loc url for all schemes at each eid
-            if eids then only eids in eids else all eids
-
-        cid and not role and scheme then:
-            end authz for all eid in all roles and loc url for scheme at each eid
-            if eids then only eids in eids else all eids
-
-        cid and role and not scheme then:
-            end authz for all eid in role and loc url for all schemes at each eid
-            if eids then only eids in eids else all eids
-
-        cid and role and scheme then:
-            end authz for all eid in role and loc url for scheme at each eid
-            if eids then only eids in eids else all eids
-
+        Returns iterator of messages of reply message stream composed of
+        entries authed by the given cid. See BaseHab.replyEndRole.
 
         Parameters:
             cid (str): identifier prefix qb64 of controller authZ endpoint provided
@@ -2359,8 +2398,6 @@ class SignifyHab(BaseHab):
             eids (list): when provided restrict returns to only eids in eids
             scheme (str): url scheme
         """
-        msgs = bytearray()
-
         if eids is None:
             eids = []
 
@@ -2371,23 +2408,20 @@ class SignifyHab(BaseHab):
                 # latest key state for cid
                 for eid in kever.wits:
                     if not eids or eid in eids:
-                        msgs.extend(self.loadLocScheme(eid=eid, scheme=scheme))
+                        yield self.loadLocScheme(eid=eid, scheme=scheme)
                         if not witness:  # we are not witness, send auth records
-                            msgs.extend(self.makeEndRole(eid=eid, role=role))
+                            yield self.makeEndRole(eid=eid, role=role)
                 if witness:  # we are witness, set KEL as authz
-                    msgs.extend(self.replay(cid))
+                    yield from self.replayIter(cid)
 
         for (_, erole, eid), end in self.db.ends.getItemIter(keys=(cid,)):
             if (end.enabled or end.allowed) and (not role or role == erole) and (not eids or eid in eids):
-                msgs.extend(self.replay(eid))
-                msgs.extend(self.loadLocScheme(eid=eid, scheme=scheme))
-                msgs.extend(self.loadEndRole(cid=cid, eid=eid, role=erole))
+                yield from self.replayIter(eid)
+                yield self.loadLocScheme(eid=eid, scheme=scheme)
+                yield self.loadEndRole(cid=cid, eid=eid, role=erole)
 
         # introduce yourself, please
-        msgs.extend(self.replay(cid))
-
-
-        return msgs
+        yield from self.replayIter(cid)
 
 
 class SignifyGroupHab(SignifyHab):
@@ -2443,6 +2477,8 @@ class GroupHab(BaseHab):
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        pool (pooling.ClientPool | None): persistent HTTP client connections
+            shared by Habs of Habery
 
 
      Attributes:
@@ -2486,6 +2522,8 @@ class GroupHab(BaseHab):
             rvy (routing.Revery): factory that processes reply 'rpy' messages
             kvy (eventing.Kevery): factory for local processing of local event msgs
             psr (parsing.Parser):  parses local messages for .kvy .rvy
+            pool (pooling.ClientPool | None): persistent HTTP client
+                connections shared by Habs of Habery
 
 
         Parameters:
@@ -23,9 +23,12 @@ from keri.help import helping
 logger = help.ogler.getLogger()
 
 CESR_CONTENT_TYPE = "application/cesr+json"
+CESR_BATCH_CONTENT_TYPE = "application/cesr"
 CESR_ATTACHMENT_HEADER = "CESR-ATTACHMENT"
 CESR_DESTINATION_HEADER = "CESR-DESTINATION"
 
+CESR_BATCH_SIZE = 1048576  # maximum bytes of body of batched request
+
 
 class SignatureValidationComponent(object):
     """ Validate SKWA signatures """
@@ -113,6 +116,69 @@ def parseCesrHttpRequest(req):
     return cr
 
 
+def parseCesrHttpBatch(req):
+    """
+    Returns bytes of body of batched Falcon HTTP request in application/cesr
+    format. The body is a stream of one or more messages each followed by its
+    attachments as is ready to be fed to a Parser.
+
+    Parameters
+        req (falcon.Request) http request object in batched CESR format
+
+    """
+    if req.content_type != CESR_BATCH_CONTENT_TYPE:
+        raise falcon.HTTPError(falcon.HTTP_NOT_ACCEPTABLE,
+                               title="Content type error",
+                               description="Unacceptable content type.")
+
+    body = req.bounded_stream.read()
+    try:
+        parsing.Parser.sniff(body)
+    except (kering.ShortageError, kering.ColdStartError):
+        raise falcon.HTTPError(falcon.HTTP_400,
+                               title="Malformed CESR",
+                               description="Could not parse the request body as a "
+                                           "CESR stream.")
+
+    return body
+
+
+def splitCESRStream(ims):
+    """
+    Returns generator of (start, split, end) triples of offsets of each message
+    in stream ims where ims[start:split] is the message body and
+    ims[split:end] its attachments. Message boundaries are found from the size
+    in the version string of each message body and the start of the next
+    JSON message body so that no bytes are copied.
+
+    Parameters
+       ims (bytes | bytearray):  stream of KERI messages with attachments
+
+    """
+    cold = parsing.Parser.sniff(ims)  # check for spurious counters at front of stream
+    if cold in (parsing.Colds.txt, parsing.Colds.bny):  # not message error out to flush stream
+        # replace with pipelining here once CESR message format supported.
+        raise kering.ColdStartError("Expecting message counter tritet={}"
+                                    "".format(cold))
+
+    start = 0
+    length = len(ims)
+    while start < length:  # find boundaries of message body and its attachments
+        try:
+            _, _, _, size = coring.sniff(ims[start:start + coring.MINSNIFFSIZE])
+        except (kering.ShortageError, kering.VersionError) as ex:
+            raise kering.ExtractionError("unable to extract a valid message to send as HTTP")
+        split = start + size
+        if split > length:  # need more bytes
+            raise kering.ExtractionError("unable to extract a valid message to send as HTTP")
+
+        # attachments run to next message, must support CBOR and MsgPack
+        end = ims.find(b'{', split)
+        end = length if end < 0 else end
+        yield start, split, end
+        start = end
+
+
 def createCESRRequest(msg, client, dest, path=None):
     """
     Turns a KERI message into a CESR http request against the provided hio http Client
@@ -168,28 +234,10 @@ def streamCESRRequests(client, ims, dest, path=None):
     """
     path = path if path is not None else "/"
 
-    cold = parsing.Parser.sniff(ims)  # check for spurious counters at front of stream
-    if cold in (parsing.Colds.txt, parsing.Colds.bny):  # not message error out to flush stream
-        # replace with pipelining here once CESR message format supported.
-        raise kering.ColdStartError("Expecting message counter tritet={}"
-                                    "".format(cold))
-
-    # Otherwise its a message cold start
     cnt = 0
-    while ims:  # extract and deserialize message from ims
-        try:
-            serder = coring.Sadder(raw=ims)
-        except kering.ShortageError as ex:  # need more bytes
-            raise kering.ExtractionError("unable to extract a valid message to send as HTTP")
-        else:  # extracted successfully
-            del ims[:serder.size]  # strip off event from front of ims
-
-        attachment = bytearray()
-        while ims and ims[0] != 0x7b:  # not new message so process attachments, must support CBOR and MsgPack
-            attachment.append(ims[0])
-            del ims[:1]
-
-        body = serder.raw
+    for start, split, end in splitCESRStream(ims):
+        body = bytes(ims[start:split])
+        attachment = bytearray(ims[split:end])
 
         headers = Hict([
             ("Content-Type", CESR_CONTENT_TYPE),
@@ -206,25 +254,83 @@ def streamCESRRequests(client, ims, dest, path=None):
         )
         cnt += 1
 
+    del ims[:]  # all messages sent
     return cnt
 
 
+def batchCESRRequests(client, ims, dest, path=None, size=CESR_BATCH_SIZE):
+    """
+    Turns a stream of KERI messages into as few batched CESR http requests as
+    possible against the provided hio http Client. Each request body carries
+    many whole messages with their attachments in application/cesr format up
+    to size bytes. A message larger than size is sent in a request by itself.
+
+    Parameters
+       client (Client): hio http Client that will send the messages as CESR requests
+       ims (bytearray):  stream of KERI messages parsable as Serder.raw
+       dest (str): qb64 identifier prefix of destination controller
+       path (str): path to post to
+       size (int): maximum bytes of body of each request
+
+    Returns
+       int: Number of batched requests posted
+
+    """
+    path = path if path is not None else "/"
+
+    bounds = []  # (first, last) offsets of body of each request
+    for start, _, end in splitCESRStream(ims):
+        if bounds and end - bounds[-1][0] <= size:
+            bounds[-1][1] = end  # append message to current batch
+        else:
+            bounds.append([start, end])
+
+    for first, last in bounds:
+        body = bytes(ims[first:last])
+
+        headers = Hict([
+            ("Content-Type", CESR_BATCH_CONTENT_TYPE),
+            ("Content-Length", len(body)),
+            (CESR_DESTINATION_HEADER, dest)
+        ])
+
+        client.request(
+            method="POST",
+            path=path,
+            headers=headers,
+            body=body
+        )
+
+    del ims[:]  # all messages sent
+    return len(bounds)
+
+
 class Clienter(doing.DoDoer):
 
     TimeoutClient = 300
 
-    def __init__(self):
+    def __init__(self, pool=None):
+        """
+        Parameters:
+            pool (pooling.ClientPool | None): pool to lease clients from. None means
+                a new client and connection for each request
+        """
         self.clients = []
+        self.pool = pool
         doers = [doing.doify(self.clientDo)]
         super(Clienter, self).__init__(doers=doers)
 
     def request(self, method, url, body=None, headers=None):
         purl = parse.urlparse(url)
 
-        client = http.clienting.Client(scheme=purl.scheme,
-                                       hostname=purl.hostname,
-                                       port=purl.port,
-                                       portOptional=True)
+        if self.pool is not None:
+            client, clientDoer = self.pool.lease(url)
+        else:
+            client = http.clienting.Client(scheme=purl.scheme,
+                                           hostname=purl.hostname,
+                                           port=purl.port,
+                                           portOptional=True)
+            clientDoer = http.clienting.ClientDoer(client=client)
 
         client.request(
             method=method,
@@ -234,7 +340,6 @@ class Clienter(doing.DoDoer):
             body=body
         )
 
-        clientDoer = http.clienting.ClientDoer(client=client)
         self.extend([clientDoer])
         self.clients.append((client, clientDoer, helping.nowUTC()))
 
@@ -279,4 +384,3 @@ class Clienter(doing.DoDoer):
                 self.remove(client)
 
             yield self.tock
-
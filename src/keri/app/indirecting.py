@@ -24,7 +24,7 @@ from .habbing import GroupHab
 from .. import help, kering
 from ..core import eventing, parsing, routing, coring
 from ..core.coring import Ilks
-from ..db import basing, dbing
+from ..db import basing, dbing, escrowing
 from ..end import ending
 from ..help import helping
 from ..peer import exchanging
@@ -38,6 +38,10 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
     """
     Setup witness controller and doers
 
+    Mailbox retention of the default Mailboxer comes from the "mailbox" section of
+    the hby config file, see storing.retentionFrom. Mailbox size metrics are served
+    at /mailboxes/metrics.
+
     """
     cues = decking.Deck()
     doers = []
@@ -50,7 +54,10 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
     reger = viring.Reger(name=hab.name, db=hab.db, temp=False)
     verfer = verifying.Verifier(hby=hby, reger=reger)
 
-    mbx = mbx if mbx is not None else storing.Mailboxer(name=alias, temp=hby.temp)
+    if mbx is None:
+        conf = hby.cf.get() if hby.cf is not None else {}
+        policy, policies = storing.retentionFrom(conf.get("mailbox", {}))
+        mbx = storing.Mailboxer(name=alias, temp=hby.temp, policy=policy, policies=policies)
     forwarder = forwarding.ForwardHandler(hby=hby, mbx=mbx)
     exchanger = exchanging.Exchanger(db=hby.db, handlers=[forwarder])
     clienter = httping.Clienter()
@@ -79,7 +86,8 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             kvy=kvy,
                             tvy=tvy,
                             exc=exchanger,
-                            rvy=rvy)
+                            rvy=rvy,
+                            viewed=True)
 
     httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx)
     app.add_route("/", httpEnd)
@@ -105,6 +113,13 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
 
     doers.extend(oobiRes)
     doers.extend([regDoer, exchanger, httpServerDoer, rep, witStart, receiptEnd, *oobiery.doers])
+    compactor = None
+    if mbx.policy is not None or mbx.policies:
+        compactor = storing.MailboxCompactor(mbx=mbx)
+        doers.append(compactor)
+
+    mailboxEnd = MailboxEnd(mbx=mbx, compactor=compactor)
+    app.add_route("/mailboxes/metrics", mailboxEnd, suffix="metrics")
     return doers
 
 
@@ -526,7 +541,7 @@ class MailboxDirector(doing.DoDoer):
         self.prefixes = oset()
         self.cues = cues if cues is not None else decking.Deck()
 
-        self.ims = ims if ims is not None else bytearray()
+        self.ims = ims if ims is not None else parsing.ViewStream()
 
         doers = []
         doers.extend([doing.doify(self.pollDo),
@@ -563,7 +578,8 @@ class MailboxDirector(doing.DoDoer):
                                      tvy=self.tvy,
                                      exc=self.exchanger,
                                      rvy=self.rvy,
-                                     vry=self.verifier)
+                                     vry=self.verifier,
+                                     viewed=True)
 
         super(MailboxDirector, self).__init__(doers=doers, **kwa)
 
@@ -752,9 +768,14 @@ class Poller(doing.DoDoer):
     """
     Polls remote SSE endpoint for event that are KERI messages to be processed
 
+    Keeps one long lived event stream open to the witness. The stream is only
+    reopened when the witness closes the connection or when no event arrived
+    for timeout seconds. Each reopened stream resumes every topic after the
+    last index acknowledged by storing it in .hab.db.tops.
+
     """
 
-    def __init__(self, hab, witness, topics, msgs=None, retry=1000, **kwa):
+    def __init__(self, hab, witness, topics, msgs=None, retry=1000, timeout=None, **kwa):
         """
         Returns doist compatible doing.Doer that polls a witness for mailbox messages
         as SSE events
@@ -764,6 +785,9 @@ class Poller(doing.DoDoer):
             witness:
             topics:
             msgs:
+            retry (int): milliseconds to wait before reopening stream
+            timeout (float | None): seconds without events after which the stream
+                is reopened. None means keep stream open until the witness closes it
 
         """
         self.hab = hab
@@ -771,6 +795,7 @@ class Poller(doing.DoDoer):
         self.witness = witness
         self.topics = topics
         self.retry = retry
+        self.timeout = timeout
         self.msgs = None if msgs is not None else decking.Deck()
         self.times = dict()
 
@@ -778,6 +803,22 @@ class Poller(doing.DoDoer):
 
         super(Poller, self).__init__(doers=doers, **kwa)
 
+    def resume(self, witrec):
+        """
+        Returns:
+            dict: of index to resume each topic at, one after last acknowledged
+
+        Parameters:
+            witrec (TopicsRecord): last acknowledged index of each topic
+        """
+        topics = dict()
+        for topic in self.topics:
+            if topic in witrec.topics:
+                topics[topic] = witrec.topics[topic] + 1
+            else:
+                topics[topic] = 0
+        return topics
+
     def eventDo(self, tymth=None, tock=0.0):
         """
         Returns:
@@ -804,13 +845,7 @@ class Poller(doing.DoDoer):
 
             self.extend([clientDoer])
 
-            topics = dict()
-            q = dict(pre=self.pre, topics=topics)
-            for topic in self.topics:
-                if topic in witrec.topics:
-                    topics[topic] = witrec.topics[topic] + 1
-                else:
-                    topics[topic] = 0
+            q = dict(pre=self.pre, topics=self.resume(witrec))
 
             if isinstance(self.hab, GroupHab):
                 msg = self.hab.mhab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
@@ -822,16 +857,18 @@ class Poller(doing.DoDoer):
             while client.requests:
                 yield self.tock
 
-            created = helping.nowUTC()
+            heard = helping.nowUTC()
             while True:
+                if client.connector.cutoff:  # witness closed stream
+                    break
 
-                now = helping.nowUTC()
-                if now - created > datetime.timedelta(seconds=30):
-                    self.remove([clientDoer])
+                if (self.timeout is not None and
+                        helping.nowUTC() - heard > datetime.timedelta(seconds=self.timeout)):
                     break
 
                 while client.events:
                     evt = client.events.popleft()
+                    heard = helping.nowUTC()
                     if "retry" in evt:
                         self.retry = evt["retry"]
                     if "id" not in evt or "data" not in evt or "name" not in evt:
@@ -848,11 +885,13 @@ class Poller(doing.DoDoer):
                     self.msgs.append(msg.encode("utf=8"))
                     yield self.tock
 
-                    witrec.topics[tpc] = int(idx)
+                    witrec.topics[tpc] = int(idx)  # acknowledge
                     self.times[tpc] = helping.nowUTC()
                     self.hab.db.tops.pin((self.pre, self.witness), witrec)
 
                 yield 0.25
+
+            self.remove([clientDoer])
             yield self.retry / 1000
 
 
@@ -862,6 +901,9 @@ class HttpEnd:
     the message as a CESR attachment HTTP header.  KEL Messages are processed and added to the database
     of the provided Habitat.
 
+    Also accepts batches of many messages with their attachments POSTed as the application/cesr body of
+    one request. The body is fed as is to the parser.
+
     This also handles `req`, `exn` and `tel` messages that respond with a KEL replay.
     """
 
@@ -874,7 +916,7 @@ class HttpEnd:
         register the routes with.
 
         Parameters
-             rxbs (bytearray): output queue of bytes for message processing
+             rxbs (bytearray | ViewStream): output queue of bytes for message processing
              mbx (Mailboxer): Mailbox storage
              qrycues (Deck): inbound qry response queues
 
@@ -904,6 +946,11 @@ class HttpEnd:
                schema:
                  type: object
                  description: KERI event message
+             application/cesr:
+               schema:
+                 type: string
+                 format: binary
+                 description: KERI event messages each followed by its attachments
         responses:
            200:
               description: Mailbox query response for server sent events
@@ -915,7 +962,11 @@ class HttpEnd:
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
+
+        if req.content_type == httping.CESR_BATCH_CONTENT_TYPE:
+            self.rxbs.extend(httping.parseCesrHttpBatch(req=req))
+            rep.status = falcon.HTTP_204
+            return
 
         cr = httping.parseCesrHttpRequest(req=req)
         serder = eventing.Serder(ked=cr.payload, kind=eventing.Serials.json)
@@ -933,6 +984,7 @@ class HttpEnd:
             rep.status = falcon.HTTP_204
         elif ilk in (Ilks.qry,):
             if serder.ked["r"] in ("mbx",):
+                rep.set_header('connection', "close")  # stream ends by closing
                 rep.set_header('Content-Type', "text/event-stream")
                 rep.status = falcon.HTTP_200
                 rep.stream = QryRpyMailboxIterable(mbx=self.mbx, cues=self.qrycues, said=serder.said)
@@ -970,8 +1022,21 @@ class QryRpyMailboxIterable:
 
         return next(self.iter)
 
+    def close(self):
+        """ Close mailbox stream if any. Called by WSGI server when stream ends """
+        if self.iter is not None:
+            self.iter.close()
+
 
 class MailboxIterable:
+    """
+    Iterable of server sent events of the messages stored in a mailbox for
+    pre on topics. Subscribes to the topics so that each next only scans
+    the topics that changed since the last one. Resumes each topic at the
+    index given in topics which is updated as events are sent. The indices
+    requested acknowledge the messages before them for retention.
+
+    """
     TimeoutMBX = 30000000
 
     def __init__(self, mbx, pre, topics, retry=5000):
@@ -979,9 +1044,14 @@ class MailboxIterable:
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.sub = None
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
+        if self.sub is None:
+            self.sub = self.mbx.subscribe(self.pre + topic for topic in self.topics)
+            for topic, idx in self.topics.items():  # subscriber resumes after acknowledged
+                self.mbx.ackTopic(self.pre + topic, idx)
         return self
 
     def __next__(self):
@@ -991,8 +1061,11 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
+            changed = self.sub.pull()
             for topic, idx in self.topics.items():
                 key = self.pre + topic
+                if key.encode("utf-8") not in changed:
+                    continue
                 for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
                     data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
                                           .encode("utf-8")))
@@ -1005,8 +1078,58 @@ class MailboxIterable:
             self.end = time.perf_counter()
             return data
 
+        self.close()
         raise StopIteration
 
+    def close(self):
+        """ Unsubscribe from mailbox. Called by WSGI server when stream ends """
+        if self.sub is not None:
+            self.sub.close()
+            self.sub = None
+
+
+class MailboxEnd:
+    """
+    Witness mailbox size metrics endpoint
+
+    Attributes:
+        mbx (Mailboxer): witness mailbox storage
+        compactor (MailboxCompactor | None): compactor enforcing retention of mbx
+
+    """
+
+    def __init__(self, mbx, compactor=None):
+        """ Create mailbox metrics endpoint
+
+        Parameters:
+            mbx (Mailboxer): witness mailbox storage
+            compactor (MailboxCompactor | None): compactor enforcing retention of mbx
+
+        """
+        self.mbx = mbx
+        self.compactor = compactor
+
+    def on_get_metrics(self, _, rep):
+        """ Mailbox size metrics GET endpoint in Prometheus text exposition format
+
+        Parameters:
+            _: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+
+        ---
+        summary: Per identifier prefix mailbox topics, messages and bytes
+        tags:
+           - Mailboxes
+        responses:
+           200:
+              description: Prometheus text metrics
+
+        """
+        removed = self.compactor.removed if self.compactor is not None else None
+        rep.status = falcon.HTTP_200
+        rep.content_type = escrowing.MetricsContentType
+        rep.data = storing.metricsText(self.mbx.sizes(), removed=removed).encode("utf-8")
+
 
 class ReceiptEnd(doing.DoDoer):
     """ Endpoint class for Witnessing receipting functionality
@@ -1043,7 +1166,6 @@ class ReceiptEnd(doing.DoDoer):
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
         cr = httping.parseCesrHttpRequest(req=req)
         serder = eventing.Serder(ked=cr.payload, kind=eventing.Serials.json)
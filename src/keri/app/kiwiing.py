@@ -4,6 +4,7 @@ KERI
 keri.app.agenting module
 
 """
+import itertools
 import json
 from ordered_set import OrderedSet as oset
 
@@ -21,7 +22,8 @@ from .. import help
 from .. import kering
 from ..app import specing, forwarding, agenting, storing, indirecting, httping, habbing, delegating, booting
 from ..core import coring, eventing
-from ..db import dbing
+from ..db import dbing, escrowing
+from ..end import ending
 from ..db.dbing import dgKey
 from ..peer import exchanging
 from ..vc import proving, protocoling, walleting
@@ -763,51 +765,75 @@ class KeyStateEnd:
             return
 
         kever = self.hby.kevers[prefix]
-        pre = kever.prefixer.qb64
-        preb = kever.prefixer.qb64b
-
-        res = dict(
-            pre=pre,
-            state=kever.state()._asdict()
-        )
-
-        kel = []
-        for fn, dig in self.hby.db.getFelItemPreIter(preb, fn=0):
-            try:
-                event = eventing.loadEvent(self.hby.db, preb, dig)
-            except ValueError as e:
+        digs = self.keyStateDigs(kever)
+        for pre, dig in digs:  # validate before response starts
+            if self.hby.db.getEvt(dbing.dgKey(pre, dig)) is None:
                 rep.status = falcon.HTTP_400
-                rep.text = e.args[0]
+                rep.text = "Missing event for dig={}.".format(dig)
                 return
 
-            kel.append(event)
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.stream = ending.streamChunks(self.keyStateIter(kever, digs))
+
+    def keyStateDigs(self, kever):
+        """ Returns list of (pre, dig) duples of events of KEL of kever followed
+        by any partially witnessed and partially signed events of its prefix.
+
+        Parameters:
+            kever (Kever): key state of identifier
+
+        """
+        pre = kever.prefixer.qb64
+        preb = kever.prefixer.qb64b
+
+        digs = [(preb, bytes(dig)) for fn, dig in self.hby.db.getFelItemPreIter(preb, fn=0)]
 
         key = dbing.snKey(pre=pre, sn=0)
         # load any partially witnesses events for this prefix
         for ekey, edig in self.hby.db.getPweItemsNextIter(key=key):
-            pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-            try:
-                kel.append(eventing.loadEvent(self.hby.db, pre, edig))
-            except ValueError as e:
-                rep.status = falcon.HTTP_400
-                rep.text = e.args[0]
-                return
+            epre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
+            digs.append((epre, bytes(edig)))
 
         # load any partially signed events from this prefix
         for ekey, edig in self.hby.db.getPseItemsNextIter(key=key):
-            pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-            try:
-                kel.append(eventing.loadEvent(self.hby.db, pre, edig))
-            except ValueError as e:
-                rep.status = falcon.HTTP_400
-                rep.text = e.args[0]
-                return
+            epre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
+            digs.append((epre, bytes(edig)))
 
-        res["kel"] = kel
+        return digs
 
-        rep.status = falcon.HTTP_200
-        rep.content_type = "application/json"
-        rep.data = json.dumps(res).encode("utf-8")
+    def keyStateIter(self, kever, digs=None):
+        """ Returns iterator of bytes parts of JSON of key state and KEL of kever
+
+        The KEL is loaded one event at a time as it is streamed. An event that
+        fails to load, such as an escrowed event removed after validation, ends
+        the KEL with an "error" field holding the reason so the body stays
+        valid JSON.
+
+        Parameters:
+            kever (Kever): key state of identifier
+            digs (list | None): (pre, dig) duples of events from .keyStateDigs.
+                None means get them now
+
+        """
+        pre = kever.prefixer.qb64
+        digs = digs if digs is not None else self.keyStateDigs(kever)
+
+        head = json.dumps(dict(pre=pre, state=kever.state()._asdict()))
+        yield f'{head[:-1]}, "kel": ['.encode("utf-8")
+
+        sep = b""
+        try:
+            for epre, dig in digs:
+                event = eventing.loadEvent(self.hby.db, epre, dig)
+                yield sep + json.dumps(event).encode("utf-8")
+                sep = b", "
+        except ValueError as e:  # response already started so end well formed
+            logger.error("KeyStateEnd: truncated KEL of %s: %s", pre, e.args[0])
+            yield f'], "error": {json.dumps(e.args[0])}}}'.encode("utf-8")
+            return
+
+        yield b"]}"
 
     def on_get_pubkey(self, _, rep, pubkey):
         """
@@ -1047,6 +1073,25 @@ class CredentialEnd(doing.DoDoer):
                 type: string
              description:  schema to filter by if provided
              required: false
+           - in: query
+             name: after
+             schema:
+                type: string
+             description:  qb64 SAID of last credential of previous page
+             required: false
+           - in: query
+             name: limit
+             schema:
+                type: integer
+             description:  maximum number of credentials to return
+             required: false
+           - in: query
+             name: chains
+             schema:
+                type: string
+             description:  expand to return chained credentials in full (default) or
+                           refs to return their SAIDs
+             required: false
         responses:
            200:
               description: Credential list.
@@ -1061,6 +1106,9 @@ class CredentialEnd(doing.DoDoer):
         """
         typ = req.params.get("type")
         schema = req.params.get("schema")
+        after = req.params.get("after")
+        limit = req.params.get("limit")
+        chains = req.params.get("chains", "expand")
 
         hab = self.hby.habByName(name=alias)
         if hab is None:
@@ -1069,21 +1117,34 @@ class CredentialEnd(doing.DoDoer):
                        "".format(alias)
             return
 
-        creds = []
-        if typ == "issued":
-            saids = self.rgy.reger.issus.get(keys=hab.pre)
-        elif typ == "received":
-            saids = self.rgy.reger.subjs.get(keys=hab.pre)
-        else:
+        if typ not in ("issued", "received"):
             rep.status = falcon.HTTP_400
             rep.text = f"Invalid type {typ}"
             return
 
-        if schema is not None:
-            scads = self.rgy.reger.schms.get(keys=schema)
-            saids = [saider for saider in saids if saider.qb64 in [saider.qb64 for saider in scads]]
+        if chains not in ("expand", "refs"):
+            rep.status = falcon.HTTP_400
+            rep.text = f"Invalid chains {chains}"
+            return
+
+        try:
+            limit = int(limit) if limit is not None else None
+            if limit is not None and limit < 0:
+                raise ValueError(f"Negative limit {limit}")
+        except ValueError:
+            rep.status = falcon.HTTP_400
+            rep.text = f"Invalid limit {limit}"
+            return
 
-        creds = self.rgy.reger.cloneCreds(saids)
+        saids = self.rgy.reger.credsIter(hab.pre, issued=typ == "issued", schema=schema, after=after)
+        try:
+            saids = list(itertools.islice(saids, limit))
+        except kering.MissingEntryError:
+            rep.status = falcon.HTTP_400
+            rep.text = f"Invalid after {after}"
+            return
+
+        creds = self.rgy.reger.cloneCreds(saids, expand=chains == "expand")
 
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json"
@@ -1132,14 +1193,28 @@ class CredentialEnd(doing.DoDoer):
             rep.text = "Invalid alias {} for credentials".format(alias)
             return
 
-        data = self.outputCred(hab, said)
+        _, chunks = ending.primeStream(ending.streamChunks(self.outputCredIter(hab, said)))
 
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json+cesr"
-        rep.data = bytes(data)
+        rep.stream = chunks
 
     def outputCred(self, hab, said):
         out = bytearray()
+        for msg in self.outputCredIter(hab, said):
+            out.extend(msg)
+        return out
+
+    def outputCredIter(self, hab, said):
+        """ Returns iterator of messages of credential said with its chained
+        credentials and the KELs and TELs that support it. Chained credentials
+        come first. Messages are cloned one at a time as they are consumed.
+
+        Parameters:
+            hab (Hab): environment of exporter
+            said (str): SAID of credential to export
+
+        """
         creder, sadsigers, sadcigars = self.rgy.reger.cloneCred(said=said)
         chains = creder.chains
         saids = []
@@ -1153,32 +1228,17 @@ class CredentialEnd(doing.DoDoer):
             saids.append(source['n'])
 
         for said in saids:
-            out.extend(self.outputCred(hab, said))
+            yield from self.outputCredIter(hab, said)
 
         issr = creder.issuer
-        for msg in self.hby.db.clonePreIter(pre=issr):
-            serder = coring.Serder(raw=msg)
-            atc = msg[serder.size:]
-            out.extend(serder.raw)
-            out.extend(atc)
+        yield from self.hby.db.clonePreIter(pre=issr)
 
         if creder.status is not None:
-            for msg in self.rgy.reger.clonePreIter(pre=creder.status):
-                serder = coring.Serder(raw=msg)
-                atc = msg[serder.size:]
-                out.extend(serder.raw)
-                out.extend(atc)
+            yield from self.rgy.reger.clonePreIter(pre=creder.status)
+            yield from self.rgy.reger.clonePreIter(pre=creder.said)
 
-            for msg in self.rgy.reger.clonePreIter(pre=creder.said):
-                serder = coring.Serder(raw=msg)
-                atc = msg[serder.size:]
-                out.extend(serder.raw)
-                out.extend(atc)
-
-        out.extend(creder.raw)
-        out.extend(eventing.proofize(sadtsgs=sadsigers, sadcigars=sadcigars, pipelined=True))
-
-        return out
+        yield creder.raw
+        yield eventing.proofize(sadtsgs=sadsigers, sadcigars=sadcigars, pipelined=True)
 
     def on_post(self, req, rep, alias):
         """ Initiate a credential issuance
@@ -2106,13 +2166,25 @@ class NotificationEnd:
             schema:
               type: string
             required: false
-            description: qb64 SAID of last notification seen
+            description: qb64 random ID of last notification seen. Results start after it
           - in: query
             name: limit
             schema:
               type: integer
             required: false
             description: size of the result list.  Defaults to 25
+          - in: query
+            name: unread
+            schema:
+              type: boolean
+            required: false
+            description: true means only unread notifications
+          - in: query
+            name: route
+            schema:
+              type: string
+            required: false
+            description: only notifications with this route
         tags:
            - Notifications
 
@@ -2122,24 +2194,43 @@ class NotificationEnd:
         """
         last = req.params.get("last")
         limit = req.params.get("limit")
+        route = req.params.get("route")
+        unread = req.params.get("unread", "false").lower() == "true"
 
-        limit = int(limit) if limit is not None else 25
-
-        if last is not None:
-            lastNote = self.notifier.get(last)
-            if lastNote is not None:
-                start = lastNote.datetime
-            else:
-                start = ""
-        else:
-            start = ""
+        try:
+            limit = int(limit) if limit is not None else 25
+        except ValueError:
+            rep.status = falcon.HTTP_400
+            rep.text = f"Invalid limit {limit}"
+            return
 
-        notes = self.notifier.getNotes(start=start, limit=limit)
+        notes = self.notifier.getNotes(limit=limit, after=last, unread=unread, route=route)
         out = [note.pad for note in notes]
 
         rep.status = falcon.HTTP_200
         rep.data = json.dumps(out).encode("utf-8")
 
+    def on_get_count(self, _, rep):
+        """ Notification count GET endpoint
+
+        Parameters:
+            _: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+        ---
+        summary:  Get number of notifications and of unread notifications
+        description:  Get number of notifications and of unread notifications for the controller
+                      of the agent without loading them
+        tags:
+           - Notifications
+
+        responses:
+           200:
+              description: Counts of notifications
+        """
+        out = dict(total=self.notifier.cntNotes(), unread=self.notifier.cntNotes(unread=True))
+        rep.status = falcon.HTTP_200
+        rep.data = json.dumps(out).encode("utf-8")
+
     def on_put_said(self, _, rep, said):
         """ Notification PUT endpoint
 
@@ -2671,14 +2762,16 @@ class SchemaEnd:
 
 class EscrowEnd:
 
-    def __init__(self, db):
+    def __init__(self, db, reger=None):
         """ Create endpoint for retrieving escrow status
 
         Parameters:
             db (Baser): escrow database
+            reger (Reger): credential escrow database for metrics
 
         """
         self.db = db
+        self.reger = reger
 
     def on_get(self, req, rep):
         """
@@ -2812,6 +2905,36 @@ class EscrowEnd:
         rep.content_type = "application/json"
         rep.data = json.dumps(escrows, indent=2).encode("utf-8")
 
+    def on_get_metrics(self, req, rep):
+        """ Escrow metrics GET endpoint
+
+        Parameters:
+            req (Request): falcon.Request HTTP request
+            rep (Response): falcon.Response HTTP response
+
+        ---
+        summary:  Export escrow backlog and escrow processing metrics
+        description:  Export count and age histogram of entries of each escrow and durations of
+                      escrow processing passes in Prometheus text exposition format
+        tags:
+           - Escrows
+        parameters:
+          - in: query
+            name: ages
+            schema:
+              type: boolean
+            required: false
+            description: false means omit age histograms which iterate escrows
+        responses:
+           200:
+              description: Escrow metrics
+
+        """
+        ages = req.get_param_as_bool("ages", default=True)
+        rep.status = falcon.HTTP_200
+        rep.content_type = escrowing.MetricsContentType
+        rep.data = escrowing.metricsText(self.db, reger=self.reger, ages=ages).encode("utf-8")
+
     def on_get_partial(self, req, rep, pre, dig):
         """
 
@@ -3057,14 +3180,16 @@ def loadEnds(app, *,
 
     notes = NotificationEnd(notifier=notifier)
     app.add_route("/notifications", notes)
+    app.add_route("/notifications/count", notes, suffix="count")
     app.add_route("/notifications/{said}", notes, suffix="said")
 
     schemaEnd = SchemaEnd(db=hby.db)
     app.add_route("/schema", schemaEnd, suffix="list")
     app.add_route("/schema/{said}", schemaEnd)
 
-    escrowEnd = EscrowEnd(db=hby.db)
+    escrowEnd = EscrowEnd(db=hby.db, reger=rgy.reger)
     app.add_route("/escrows", escrowEnd)
+    app.add_route("/escrows/metrics", escrowEnd, suffix="metrics")
     app.add_route("/escrows/{pre}/{dig}", escrowEnd, suffix="partial")
 
     aeidEnd = AeidEnd(hby=hby)
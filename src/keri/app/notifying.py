@@ -194,10 +194,20 @@ class Noter(dbing.LMDBer):
     Noter stores Notifications generated by the agent that are
     intended to be read and dismissed by the controller of the agent.
 
+    Attributes:
+        notes (DicterSuber): notices keyed by (datetime, rid)
+        nidx (Suber): datetime of notice keyed by rid
+        ncigs (CesrSuber): signature of notice keyed by rid
+        nurd (Suber): unread index of rid keyed by (datetime, rid) of each
+            unread notice. Number of entries is number of unread notices.
+        nrte (Suber): route index of rid keyed by (route, datetime, rid) of
+            each notice whose attributes have a route 'r'
+
     """
     TailDirPath = "keri/not"
     AltTailDirPath = ".keri/not"
     TempPrefix = "keri_not_"
+    RouteSep = '|'  # routes include '/' so route index uses another separator
 
     def __init__(self, name="not", headDirPath=None, reopen=True, **kwa):
         """
@@ -211,6 +221,8 @@ class Noter(dbing.LMDBer):
         self.notes = None
         self.nidx = None
         self.ncigs = None
+        self.nurd = None
+        self.nrte = None
 
         super(Noter, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -225,6 +237,12 @@ class Noter(dbing.LMDBer):
         self.notes = DicterSuber(db=self, subkey='nots.', sep='/', klas=Notice)
         self.nidx = subing.Suber(db=self, subkey='nidx.')
         self.ncigs = subing.CesrSuber(db=self, subkey='ncigs.', klas=coring.Cigar)
+        self.nurd = subing.Suber(db=self, subkey='nurd.', sep='/')
+        self.nrte = subing.Suber(db=self, subkey='nrte.', sep=self.RouteSep)
+
+        if (not self.readonly and not self.cntEntries(self.nurd.sdb)
+                and not self.cntEntries(self.nrte.sdb) and self.cntEntries(self.notes.sdb)):
+            self.reindex()  # notes stored before indices existed
 
         return self.env
 
@@ -239,12 +257,14 @@ class Noter(dbing.LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is not None:
-            return False
+        with self.transact():
+            if self.nidx.get(keys=(rid,)) is not None:
+                return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self._index(note)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def update(self, note, cigar):
         """
@@ -257,12 +277,18 @@ class Noter(dbing.LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is None:
-            return False
-
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+        with self.transact():
+            if (res := self.get(rid)) is None:
+                return False
+
+            old, _ = res
+            self._unindex(old)
+            if old.datetime != dt:
+                self.notes.rem(keys=(old.datetime, rid))
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self._index(note)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def get(self, rid):
         """
@@ -294,58 +320,142 @@ class Noter(dbing.LMDBer):
         Returns:
             bool:  True if deleted
         """
-        res = self.get(rid)
-        if res is None:
-            return False
+        with self.transact():
+            res = self.get(rid)
+            if res is None:
+                return False
 
-        note, _ = res
-        dt = note.datetime
-        rid = note.rid
-        self.nidx.rem(keys=(rid,))
-        self.ncigs.rem(keys=(rid,))
-        return self.notes.rem(keys=(dt, rid))
+            note, _ = res
+            dt = note.datetime
+            rid = note.rid
+            self._unindex(note)
+            self.nidx.rem(keys=(rid,))
+            self.ncigs.rem(keys=(rid,))
+            return self.notes.rem(keys=(dt, rid))
 
-    def getNoteIter(self, start="", limit=25):
+    def cntNotes(self, unread=False):
+        """
+        Returns number of notes or of unread notes read from lmdb stats
+        without iterating.
+
+        Parameters:
+            unread (bool): True means count only unread notes
+        """
+        return self.cntEntries(self.nurd.sdb if unread else self.notes.sdb)
+
+    def getNoteIter(self, start="", limit=25, after=None, unread=False, route=None):
         """
         Returns iterator of tuples (note, cigar) of notices for controller of agent with attached signatures.
+        Pages by keyset so next page starts after the last note of previous page.
 
         Parameters:
             start (Optiona(str,datetime)): date/time to start iteration
             limit (int): number of items to return
+            after (str | None): qb64 rid of last note of previous page.
+                Iteration starts after it. Overrides start when note exists
+            unread (bool): True means only unread notes
+            route (str | None): only notes whose attributes have this route 'r'
 
         """
+        if start is None:
+            start = ""
         if hasattr(start, "isoformat"):
             start = start.isoformat()
 
+        last = None
+        if after is not None and (dt := self.nidx.get(keys=(after,))) is not None:
+            start, last = dt, after
+
+        keys = (start, last) if last is not None else (start,)
+        if route is not None:
+            items = self._indexItemIter(self.nrte, top=(route, ""), keys=(route, *keys))
+        elif unread:
+            items = self._indexItemIter(self.nurd, top="", keys=keys)
+        else:
+            items = ((keys, None) for keys, _ in self.notes.getItemIter(keys=(start,)))
+
         res = 0
-        for ((_, _), note) in self.notes.getItemIter(keys=(start,)):
-            cig = self.ncigs.get(keys=(note.rid,))
+        for keys, _ in items:
+            dt, rid = keys[-2:]
+            if last is not None and (dt, rid) <= (start, last):  # after is exclusive
+                continue
+            if (couple := self.get(rid)) is None:
+                continue
+            note, cig = couple
+            if unread and note.read:
+                continue
             yield note, cig
             res += 1
             if res == limit:
                 break
 
-    def getNotes(self, start="", limit=25):
+    def getNotes(self, start="", limit=25, after=None, unread=False, route=None):
         """
         Returns list of tuples (note, cigar) of notes for controller of agent
 
         Parameters:
             start (Optiona(str,datetime)): date/time to start iteration
             limit (int): number of items to return
+            after (str | None): qb64 rid of last note of previous page
+            unread (bool): True means only unread notes
+            route (str | None): only notes whose attributes have this route 'r'
 
         """
-        if hasattr(start, "isoformat"):
-            start = start.isoformat()
+        return list(self.getNoteIter(start=start, limit=limit, after=after,
+                                     unread=unread, route=route))
 
-        notes = []
+    def reindex(self):
+        """
+        Rebuild unread and route indices from all notes. Returns number of
+        notes indexed.
+        """
+        with self.transact():
+            self.nurd.trim()
+            self.nrte.trim()
+            count = 0
+            for _, note in self.notes.getItemIter():
+                self._index(note)
+                count += 1
+            return count
 
-        for ((_, _), note) in self.notes.getItemIter(keys=(start,)):
-            cig = self.ncigs.get(keys=(note.rid,))
-            notes.append((note, cig))
-            if len(notes) == limit:
-                break
+    def _indexItemIter(self, suber, top, keys):
+        """
+        Returns iterator of (keys, rid) items of index suber starting at key
+        made from keys that stay within branch of key space given by top.
 
-        return notes
+        Parameters:
+            suber (Suber): index
+            top (tuple | str): partial keys of branch. Empty means whole index
+            keys (tuple): full keys to start at
+        """
+        prefix = suber._tokey(top)
+        for key, val in self.getAllItemIter(db=suber.sdb, key=suber._tokey(keys), split=False):
+            key = bytes(key)
+            if not key.startswith(prefix):
+                break
+            yield suber._tokeys(key), suber._des(val)
+
+    def _index(self, note):
+        """ Add index entries of note """
+        dt, rid = note.datetime, note.rid
+        if not note.read:
+            self.nurd.pin(keys=(dt, rid), val=rid)
+        if (route := self._route(note)) is not None:
+            self.nrte.pin(keys=(route, dt, rid), val=rid)
+
+    def _unindex(self, note):
+        """ Remove index entries of note """
+        dt, rid = note.datetime, note.rid
+        self.nurd.rem(keys=(dt, rid))
+        if (route := self._route(note)) is not None:
+            self.nrte.rem(keys=(route, dt, rid))
+
+    @staticmethod
+    def _route(note):
+        """ Returns route str of note attributes or None """
+        attrs = note.attrs
+        route = attrs.get("r") if isinstance(attrs, dict) else None
+        return route if isinstance(route, str) else None
 
 
 class Notifier:
@@ -462,23 +572,36 @@ class Notifier:
 
         return False
 
-    def getNoteIter(self, start=None, limit=25):
+    def cntNotes(self, unread=False):
+        """ Returns number of notes or of unread notes without iterating
+
+        Parameters:
+            unread (bool): True means count only unread notes
+
+        """
+        return self.noter.cntNotes(unread=unread)
+
+    def getNoteIter(self, start=None, limit=25, after=None, unread=False, route=None):
         """
         Returns iterator of notices that have verified signatures over the data stored
 
         Parameters:
             start (Optiona(str,datetime)): date/time to start iteration
             limit (int): number of items to return
+            after (str | None): qb64 rid of last note of previous page
+            unread (bool): True means only unread notes
+            route (str | None): only notes whose attributes have this route 'r'
 
         """
 
-        for note, cig in self.noter.getNoteIter(start=start, limit=limit):
+        for note, cig in self.noter.getNoteIter(start=start, limit=limit, after=after,
+                                                unread=unread, route=route):
             if not self.hby.signator.verify(ser=note.raw, cigar=cig):
                 raise kering.ValidationError("note stored without valid signature")
 
             yield note
 
-    def getNotes(self, start="", limit=25):
+    def getNotes(self, start="", limit=25, after=None, unread=False, route=None):
         """
 
         Returns list of notices that have verified signatures over the data stored
@@ -486,18 +609,11 @@ class Notifier:
         Parameters:
             start (Optiona(str,datetime)): date/time to start iteration
             limit (int): number of items to return
+            after (str | None): qb64 rid of last note of previous page
+            unread (bool): True means only unread notes
+            route (str | None): only notes whose attributes have this route 'r'
 
 
         """
-        if hasattr(start, "isoformat"):
-            start = start.isoformat()
-
-        notes = []
-
-        for note, cig in self.noter.getNoteIter(start=start, limit=limit):
-            if not self.hby.signator.verify(ser=note.raw, cigar=cig):
-                raise kering.ValidationError("note stored without valid signature")
-
-            notes.append(note)
-
-        return notes
+        return list(self.getNoteIter(start=start, limit=limit, after=after,
+                                     unread=unread, route=route))
@@ -372,7 +372,7 @@ class Oobiery:
         rvy = routing.Revery(db=self.hby.db, rtr=rtr)
         kvy = eventing.Kevery(db=self.hby.db, lax=True, local=False, rvy=rvy)
         kvy.registerReplyRoutes(router=rtr)
-        self.parser = parsing.Parser(framed=True, kvy=kvy, rvy=rvy)
+        self.parser = parsing.Parser(framed=True, kvy=kvy, rvy=rvy, viewed=True)
 
         self.cues = cues if cues is not None else decking.Deck()
         self.clients = dict()
@@ -490,7 +490,7 @@ class Oobiery:
                     self.hby.db.roobi.put(keys=(url,), val=obr)
 
                 elif response["headers"]["Content-Type"] == "application/json+cesr":  # CESR Stream response to OOBI
-                    self.parser.parse(ims=bytearray(response["body"]))
+                    self.parser.parse(ims=bytes(response["body"]))
                     if ending.OOBI_AID_HEADER in response["headers"]:
                         obr.cid = response["headers"][ending.OOBI_AID_HEADER]
 
@@ -0,0 +1,243 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.app.pooling module
+
+Persistent HTTP client connections shared by the Habs of a Habery
+
+"""
+import datetime
+from urllib import parse
+
+from hio.core import http
+from hio.help import Hict
+
+from keri.help import helping
+
+
+class ClientPool:
+    """
+    ClientPool keeps persistent HTTP client connections open for reuse keyed
+    by (scheme, host, port) so that repeated requests to the same witness or
+    agent do not each pay for a new TCP and TLS connection setup. One pool is
+    shared by all the Habs of a Habery.
+
+    A client is leased to one user at a time together with a PooledClientDoer
+    that services the client while leased and releases it back to the pool on
+    exit. A released client whose connection is still open and has no request
+    in progress is kept idle for reuse until timeout. Otherwise it is closed.
+
+    At most maxConnections pooled connections are kept open per host. A lease
+    beyond that gets a client of its own that is closed on exit.
+
+    Only use for requests whose responses have a known length such as those of
+    witness endpoints. A hio server sends a streamed response of unknown
+    length, such as an OOBI, unframed on a reused connection.
+
+    Attributes:
+        maxConnections (int): most pooled connections open per host
+        timeout (float): seconds an idle connection is kept open
+        idles (dict): lists of (client, datetime released) of idle clients
+            keyed by (scheme, host, port), most recently released last
+        leases (dict): (scheme, host, port) keys of leased pooled clients
+            keyed by client
+        counts (dict): number of pooled connections open keyed by
+            (scheme, host, port)
+        created (int): number of pooled connections opened
+        reused (int): number of leases of idle connections
+        evicted (int): number of idle connections closed on timeout
+
+    """
+
+    MaxConnections = 4  # pooled connections open per host
+    TimeoutIdle = 60.0  # seconds idle connection is kept open
+
+    def __init__(self, maxConnections=None, timeout=None):
+        """
+        Initialize instance
+
+        Parameters:
+            maxConnections (int | None): most pooled connections open per host
+            timeout (float | None): seconds an idle connection is kept open
+        """
+        self.maxConnections = (maxConnections if maxConnections is not None
+                               else self.MaxConnections)
+        self.timeout = timeout if timeout is not None else self.TimeoutIdle
+        self.idles = dict()
+        self.leases = dict()
+        self.counts = dict()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    @staticmethod
+    def keyed(url):
+        """
+        Returns:
+            tuple: (scheme, host, port) key of url with default port of scheme
+
+        Parameters:
+            url (str): url of request
+        """
+        purl = parse.urlparse(url)
+        scheme = "https" if purl.scheme.lower() == "https" else "http"
+        port = purl.port if purl.port is not None else (443 if scheme == "https" else 80)
+        return scheme, purl.hostname, port
+
+    def lease(self, url):
+        """
+        Returns:
+            tuple: (Client, Doer) of client for host of url and doer that services
+                it until removed. Run the doer, for example with .extend of a
+                DoDoer, and remove it when done with the client.
+
+        Parameters:
+            url (str): url of request to be made with client
+        """
+        self.evict()
+        key = self.keyed(url)
+
+        idles = self.idles.get(key, [])
+        while idles:
+            client, _ = idles.pop()
+            client.connector.serviceReceives()  # detect closed by far side
+            if client.connector.cutoff or client.connector.rxbs:
+                self.discard(client, key)
+                continue
+
+            self.leases[client] = key
+            self.reused += 1
+            return client, PooledClientDoer(client=client, pool=self, reused=True)
+
+        scheme, hostname, port = key
+        client = http.clienting.Client(scheme=scheme,
+                                       hostname=hostname,
+                                       port=port,
+                                       portOptional=True)
+        if self.counts.get(key, 0) >= self.maxConnections:  # not pooled
+            return client, http.clienting.ClientDoer(client=client)
+
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.created += 1
+        self.leases[client] = key
+        return client, PooledClientDoer(client=client, pool=self)
+
+    def release(self, client):
+        """
+        Returns leased client to pool idle for reuse when its connection is open
+        and no request is in progress. Otherwise closes it.
+
+        Parameters:
+            client (Client): leased from .lease
+        """
+        key = self.leases.pop(client, None)
+        if key is None:  # not leased or pool closed
+            client.close()
+            return
+
+        connector = client.connector
+        if (client.waited or client.requests or connector.txbs or connector.rxbs
+                or connector.cutoff or not connector.connected):
+            self.discard(client, key)
+            return
+
+        client.responses.clear()  # unread responses of last lease
+        client.events.clear()
+        client.redirects.clear()
+        client.requester.reinit(method="GET", path="/", qargs=dict(), fragment="",
+                                headers=Hict())  # defaults of next lease
+        self.idles.setdefault(key, []).append((client, helping.nowUTC()))
+        self.evict()
+
+    def discard(self, client, key):
+        """
+        Closes pooled client connection
+
+        Parameters:
+            client (Client): pooled client not idle or leased
+            key (tuple): (scheme, host, port) of client
+        """
+        client.close()
+        self.counts[key] -= 1
+        if not self.counts[key]:
+            del self.counts[key]
+
+    def evict(self):
+        """ Closes connections idle for longer than .timeout """
+        now = helping.nowUTC()
+        for key, idles in list(self.idles.items()):
+            while idles and (now - idles[0][1]) > datetime.timedelta(seconds=self.timeout):
+                client, _ = idles.pop(0)
+                self.discard(client, key)
+                self.evicted += 1
+
+            if not idles:
+                del self.idles[key]
+
+    def close(self):
+        """ Closes idle connections. Leased clients are closed when released """
+        for key, idles in self.idles.items():
+            for client, _ in idles:
+                client.close()
+
+        self.idles.clear()
+        self.leases.clear()
+        self.counts.clear()
+
+
+class PooledClientDoer(http.clienting.ClientDoer):
+    """
+    PooledClientDoer services a client leased from a ClientPool and releases
+    it back to the pool on exit instead of closing its connection.
+
+    See ClientDoer for inherited attributes, properties, and methods.
+
+    A far side may close an idle connection at any time so a request on a
+    reused connection that is closed before any response arrives is sent again
+    once on a new connection.
+
+    Attributes:
+        pool (ClientPool): pool client is leased from
+        reused (bool): True means connection of client was reused and not yet
+            reopened
+
+    """
+
+    def __init__(self, client, pool, reused=False, **kwa):
+        """
+        Initialize instance.
+
+        Parameters:
+            client (Client): leased from pool
+            pool (ClientPool): pool client is leased from
+            reused (bool): True means connection of client is reused
+        """
+        self.pool = pool
+        self.reused = reused
+        super(PooledClientDoer, self).__init__(client=client, **kwa)
+
+    def enter(self):
+        """ Open connection unless reusing one that is still open """
+        connector = self.client.connector
+        if not connector.connected or connector.cutoff:
+            self.client.reopen()
+
+    def recur(self, tyme):
+        """ Service client and resend on new connection when reused one was closed """
+        client = self.client
+        connector = client.connector
+        if (self.reused and connector.cutoff and (client.waited or client.requests)
+                and not client.respondent.started):
+            self.reused = False  # only once so failure of new connection is seen
+            if client.waited and client.latest:  # resend request in progress
+                client.requests.appendleft(client.latest)
+            client.waited = False
+            connector.txbs.clear()
+            connector.rxbs.clear()
+            client.reopen()
+            client.respondent.makeParser()
+
+        client.service()
+
+    def exit(self):
+        """ Release client back to pool """
+        self.pool.release(self.client)
@@ -4,11 +4,12 @@ keri.app.signaling module
 
 """
 import datetime
+import heapq
 import time
+from collections import deque
 
 import falcon
 from hio.base import doing
-from hio.help import decking
 
 from keri.core import coring
 from keri.help import helping
@@ -87,6 +88,216 @@ class Signal(coring.Dicter):
         return None
 
 
+class Signals:
+    """
+    Signals is a bounded buffer of Signal instances in push order with the
+    deque interface used by consumers of Signaler such as SignalIterable.
+
+    Each topic has a ring buffer of at most .TopicSize signals. Pushing to a
+    full topic drops its oldest signal. Pushing a signal whose collapse key
+    matches one not yet read on the same topic replaces that one in place so
+    repeated signals coalesce. Signals are expired in date order from a heap
+    so expiry does not scan the buffer. Heap entries of signals popped,
+    dropped or replaced are left in place until they outnumber the signals
+    buffered plus .DatesSlack when the heap is rebuilt so its size stays
+    bounded by the buffer. Cursors read signals without consuming them.
+
+    Attributes:
+        topicSize (int): maximum number of signals kept per topic
+        seq (int): sequence number of last signal pushed
+        dropped (int): number of signals dropped from full topics
+        coalesced (int): number of signals replaced by one with same ckey
+        expired (int): number of signals expired
+
+    """
+    TopicSize = 1024  # default maximum number of signals per topic
+    DatesSlack = 64  # stale date heap entries allowed beyond number of signals
+
+    def __init__(self, topicSize=None):
+        """
+        Parameters:
+            topicSize (int | None): maximum number of signals kept per topic
+        """
+        self.topicSize = topicSize if topicSize is not None else self.TopicSize
+        self.seq = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.expired = 0
+        self._sigs = dict()  # signals keyed by seq in push order
+        self._topics = dict()  # deque of seqs keyed by topic
+        self._ckeys = dict()  # seq keyed by (topic, ckey)
+        self._dates = []  # heap of (datetime, seq, rid)
+
+    def __len__(self):
+        return len(self._sigs)
+
+    def __bool__(self):
+        return bool(self._sigs)
+
+    def __iter__(self):
+        return iter(list(self._sigs.values()))
+
+    def __getitem__(self, i):
+        return list(self._sigs.values())[i]
+
+    def __repr__(self):
+        return f"Signals({list(self._sigs.values())})"
+
+    def append(self, sig):
+        """
+        Push sig coalescing with unread signal of same topic and ckey or dropping
+        oldest signal of its topic when full.
+
+        Parameters:
+            sig (Signal): signal to push
+        """
+        ckey = (sig.topic, sig.ckey)
+        if sig.ckey is not None and (seq := self._ckeys.get(ckey)) is not None:
+            self._sigs[seq] = sig  # replace in place
+            self.coalesced += 1
+        else:
+            topic = self._topics.setdefault(sig.topic, deque())
+            if len(topic) >= self.topicSize:
+                self._pop(topic[0])
+                self.dropped += 1
+            self.seq = seq = self.seq + 1
+            self._sigs[seq] = sig
+            topic.append(seq)
+            if sig.ckey is not None:
+                self._ckeys[ckey] = seq
+
+        dte = helping.fromIso8601(sig.dt)
+        if dte.tzinfo is not None:  # compare as naive local time like datetime.now()
+            dte = dte.astimezone().replace(tzinfo=None)
+        heapq.heappush(self._dates, (dte, seq, sig.rid))
+        if len(self._dates) > 2 * len(self._sigs) + self.DatesSlack:
+            self._rebuild()
+
+    def popleft(self):
+        """ Returns and removes oldest signal. Raises IndexError when empty """
+        if not self._sigs:
+            raise IndexError("pop from empty Signals")
+        return self._pop(next(iter(self._sigs)))
+
+    def remove(self, sig):
+        """ Removes sig. Raises ValueError when not present """
+        for seq, s in self._sigs.items():
+            if s is sig:
+                self._pop(seq)
+                return
+        raise ValueError("Signal not in Signals")
+
+    def clear(self):
+        """ Removes all signals """
+        self._sigs.clear()
+        self._topics.clear()
+        self._ckeys.clear()
+        self._dates.clear()
+
+    def expire(self, before):
+        """
+        Removes signals dated before datetime before. Returns number removed.
+
+        Parameters:
+            before (datetime): naive local time. Signals with earlier dt expire
+        """
+        count = 0
+        while self._dates and self._dates[0][0] < before:
+            _, seq, rid = heapq.heappop(self._dates)
+            if (sig := self._sigs.get(seq)) is not None and sig.rid == rid:
+                self._pop(seq)
+                count += 1
+        self.expired += count
+        return count
+
+    def cursor(self, topics=None):
+        """
+        Returns SignalCursor that reads signals pushed after now without
+        consuming them.
+
+        Parameters:
+            topics (Iterable | None): topics to read. None means all
+        """
+        return SignalCursor(signals=self, seq=self.seq, topics=topics)
+
+    def since(self, seq):
+        """
+        Returns list of (seq, signal) duples of signals pushed after seq
+        in push order. Coalesced signals keep their original seq.
+
+        Parameters:
+            seq (int): sequence number of last signal read
+        """
+        return [(s, sig) for s, sig in self._sigs.items() if s > seq]
+
+    def stats(self):
+        """ Returns dict of buffer metrics """
+        return dict(signals=len(self._sigs),
+                    topics={topic: len(seqs) for topic, seqs in self._topics.items()},
+                    dropped=self.dropped,
+                    coalesced=self.coalesced,
+                    expired=self.expired)
+
+    def _rebuild(self):
+        """ Rebuilds date heap without entries of signals no longer buffered """
+        self._dates = [(dte, seq, rid) for dte, seq, rid in self._dates
+                       if (sig := self._sigs.get(seq)) is not None and sig.rid == rid]
+        heapq.heapify(self._dates)
+
+    def _pop(self, seq):
+        """ Removes and returns signal at seq """
+        sig = self._sigs.pop(seq)
+        topic = self._topics[sig.topic]
+        topic.remove(seq)  # usually leftmost
+        if not topic:
+            del self._topics[sig.topic]
+        ckey = (sig.topic, sig.ckey)
+        if sig.ckey is not None and self._ckeys.get(ckey) == seq:
+            del self._ckeys[ckey]
+        return sig
+
+
+class SignalCursor:
+    """
+    SignalCursor reads signals of Signals pushed after its position without
+    consuming them so that each subscriber sees every signal still buffered.
+    For in process subscribers. SignalsEnd streams to the single controller
+    and so consumes signals from the buffer instead.
+
+    Attributes:
+        signals (Signals): buffer read
+        seq (int): sequence number of last signal read
+        topics (set | None): topics read. None means all
+        missed (int): number of signals dropped or expired before read
+
+    """
+
+    def __init__(self, signals, seq=0, topics=None):
+        """
+        Parameters:
+            signals (Signals): buffer to read
+            seq (int): sequence number of last signal read
+            topics (Iterable | None): topics to read. None means all
+        """
+        self.signals = signals
+        self.seq = seq
+        self.topics = set(topics) if topics is not None else None
+        self.missed = 0
+
+    def read(self):
+        """ Returns list of unread signals and advances past them """
+        sigs = []
+        expect = self.seq + 1
+        for seq, sig in self.signals.since(self.seq):
+            self.missed += seq - expect  # gaps are signals removed before read
+            expect = seq + 1
+            if self.topics is None or sig.topic in self.topics:
+                sigs.append(sig)
+        self.missed += max(0, self.signals.seq + 1 - expect)
+        self.seq = self.signals.seq
+        return sigs
+
+
 class Signaler(doing.DoDoer):
     """ Class for sending signals to the controller of an agent.
 
@@ -96,12 +307,15 @@ class Signaler(doing.DoDoer):
 
     SignalTimeout = datetime.timedelta(minutes=10)
 
-    def __init__(self, signals=None):
+    def __init__(self, signals=None, topicSize=None):
         """
 
         Parameters:
+            signals (Signals | None): buffer of signals
+            topicSize (int | None): maximum number of signals kept per topic
+                when signals not provided
         """
-        self.signals = signals if signals is not None else decking.Deck()
+        self.signals = signals if signals is not None else Signals(topicSize=topicSize)
         doers = [doing.doify(self.expireDo)]
         super(Signaler, self).__init__(doers=doers)
 
@@ -119,13 +333,6 @@ class Signaler(doing.DoDoer):
         """
         dt = dt if dt is not None else datetime.datetime.now()
         sig = signal(attrs=attrs, topic=topic, ckey=ckey, dt=dt)
-
-        if sig.ckey is not None:
-            for i, s in enumerate(self.signals):
-                if s.ckey == sig.ckey:
-                    self.signals[i] = sig
-                    return
-
         self.signals.append(sig)
 
     def expireDo(self, tymth=None, tock=0.0):
@@ -145,17 +352,8 @@ class Signaler(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        while True:  # loop checking for expired messages
-            now = datetime.datetime.now()
-            toRemove = []
-            for sig in self.signals:
-                if now - helping.fromIso8601(sig.dt) > self.SignalTimeout:  # Expire messages that are too old
-                    toRemove.append(sig)
-                yield self.tock
-
-            for sig in toRemove:
-                self.signals.remove(sig)
-
+        while True:  # loop expiring messages that are too old
+            self.signals.expire(datetime.datetime.now() - self.SignalTimeout)
             yield self.tock
 
 
@@ -164,7 +362,7 @@ def loadEnds(app, *, signals=None):
 
     Args:
         app (falcon.App): falcon.App to register handlers with:
-        signals (Deck): messages for the mailbox stream
+        signals (Signals): messages for the mailbox stream
 
     Returns:
 
@@ -194,7 +392,7 @@ class SignalsEnd:
              qrycues (Deck): inbound qry response queues
 
         """
-        self.signals = signals if signals is not None else decking.Deck()
+        self.signals = signals if signals is not None else Signals()
 
     def on_post(self, req, rep):
         """
@@ -4,6 +4,11 @@ keri.app.storing module
 
 """
 
+import datetime
+import weakref
+from dataclasses import dataclass
+from typing import Optional
+
 from hio.base import doing
 from hio.help import decking
 from ordered_set import OrderedSet as oset
@@ -13,30 +18,168 @@ from .. import help
 from ..core import coring
 from ..core.coring import MtrDex
 from ..db import dbing, subing
+from ..help import helping
 
 logger = help.ogler.getLogger()
 
 
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    Retention policy for the messages of a mailbox topic. A message expires
+    when any of the set limits is exceeded. The newest message of a topic is
+    always retained so that the index of the next message keeps increasing.
+
+    Attributes:
+        age (float | None): seconds a message is retained after stored
+        count (int | None): number of newest messages retained
+        acked (bool): True means messages at indices acknowledged by the
+            subscriber expire
+
+    """
+    age: Optional[float] = None
+    count: Optional[int] = None
+    acked: bool = False
+
+
+def retentionFrom(conf):
+    """
+    Returns (policy, policies) duple of default RetentionPolicy or None and dict
+    of RetentionPolicy keyed by topic name from mailbox configuration conf
+    such as the "mailbox" section of a witness config file
+
+    {
+      age: 604800,
+      count: 1000,
+      acked: true,
+      topics: {"/receipt": {age: 3600}}
+    }
+
+    Parameters:
+        conf (dict): mailbox configuration. Empty means keep all messages
+    """
+    def policyFrom(sect):
+        return RetentionPolicy(age=sect.get("age"),
+                               count=sect.get("count"),
+                               acked=bool(sect.get("acked", False)))
+
+    policy = None
+    if any(limit in conf for limit in ("age", "count", "acked")):
+        policy = policyFrom(conf)
+    policies = {topic: policyFrom(sect) for topic, sect in conf.get("topics", {}).items()}
+    return policy, policies
+
+
+def metricsText(sizes, removed=None):
+    """
+    Returns str of mailbox size metrics in Prometheus text exposition format.
+
+    Metrics:
+        keri_mailbox_topics (gauge): topics per identifier prefix
+        keri_mailbox_messages (gauge): messages per identifier prefix
+        keri_mailbox_bytes (gauge): bytes of messages per identifier prefix
+        keri_mailbox_removed_total (counter): topic entries compacted away
+
+    Parameters:
+        sizes (dict): from Mailboxer.sizes
+        removed (int | None): topic entries removed by MailboxCompactor.
+            None means no compactor
+    """
+    lines = []
+    for name, key, text in (("topics", "topics", "Number of mailbox topics."),
+                            ("messages", "msgs", "Number of mailbox messages."),
+                            ("bytes", "bytes", "Total bytes of mailbox messages.")):
+        lines.extend([f"# HELP keri_mailbox_{name} {text}",
+                      f"# TYPE keri_mailbox_{name} gauge"])
+        for pre, size in sorted(sizes.items()):
+            lines.append(f'keri_mailbox_{name}{{pre="{pre}"}} {size[key]}')
+
+    if removed is not None:
+        lines.extend(["# HELP keri_mailbox_removed_total Mailbox topic entries compacted away.",
+                      "# TYPE keri_mailbox_removed_total counter",
+                      f"keri_mailbox_removed_total {removed}"])
+
+    return "\n".join(lines) + "\n"
+
+
+class Subscription:
+    """
+    Subscription to changes of topics in a Mailboxer. Mailboxer.storeMsg
+    signals each subscription of the topic stored so that a reader only scans
+    the topics that changed since it last pulled instead of all of them.
+
+    Attributes:
+        mbx (Mailboxer): mailbox subscribed to
+        topics (set): of bytes topics subscribed to
+        changed (set): of bytes topics signalled since last pull. Starts with
+            all topics so that the first pull reads any backlog.
+
+    """
+
+    def __init__(self, mbx, topics):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox subscribed to
+            topics (Iterable): of bytes topics
+        """
+        self.mbx = mbx
+        self.topics = set(topics)
+        self.changed = set(self.topics)
+
+    def signal(self, topic):
+        """ Mark topic as changed """
+        self.changed.add(topic)
+
+    def pull(self):
+        """
+        Returns:
+            set: of bytes topics changed since last pull and clears them
+        """
+        changed = self.changed
+        self.changed = set()
+        return changed
+
+    def close(self):
+        """ Stop receiving signals """
+        self.mbx.unsubscribe(self)
+
+
 class Mailboxer(dbing.LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
 
+    Attributes:
+        subs (dict): of weakref.WeakSet of Subscription keyed by bytes topic.
+            Weak so that abandoned streams do not keep being signalled.
+        policy (RetentionPolicy | None): default retention policy of topics.
+            None means retain forever.
+        policies (dict): of RetentionPolicy keyed by topic name such as
+            "/receipt" overriding .policy for that topic of every prefix
+
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
 
-    def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
+    def __init__(self, name="mbx", headDirPath=None, reopen=True, policy=None, policies=None, **kwa):
         """
 
         Parameters:
             headDirPath:
             perm:
             reopen:
+            policy (RetentionPolicy | None): default retention policy
+            policies (dict | None): of RetentionPolicy keyed by topic name
             kwa:
         """
         self.tpcs = None
         self.msgs = None
+        self.dts = None
+        self.refs = None
+        self.acks = None
+        self.subs = dict()
+        self.policy = policy
+        self.policies = policies if policies is not None else dict()
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -50,9 +193,42 @@ class Mailboxer(dbing.LMDBer):
 
         self.tpcs = self.env.open_db(key=b'tpcs.', dupsort=True)
         self.msgs = subing.Suber(db=self, subkey='msgs.')  # key states
+        self.dts = subing.Suber(db=self, subkey='dts.')  # msg dig to datetime stored
+        self.refs = subing.Suber(db=self, subkey='refs.')  # msg dig to hex count of topic entries
+        self.acks = subing.Suber(db=self, subkey='acks.')  # topic to hex index of first unacked
+
+        with self.env.begin() as txn:  # stored before retention indices existed
+            backfill = (not txn.stat(self.refs.sdb)["entries"] and
+                        txn.stat(self.msgs.sdb)["entries"])
+        if backfill and not self.readonly:
+            self.backfill()
 
         return self.env
 
+    def backfill(self):
+        """ Rebuild reference counts of all messages from topic entries in one
+        transaction. Messages without a stored datetime get now since when
+        they were stored is unknown.
+
+        Returns:
+            int: number of messages backfilled
+
+        """
+        counts = dict()
+        with self.transact() as txn:
+            cursor = txn.cursor(db=self.tpcs)
+            for _, dig in cursor.iternext():
+                dig = bytes(dig)
+                counts[dig] = counts.get(dig, 0) + 1
+
+            dts = helping.nowIso8601()
+            for dig, count in counts.items():
+                self.refs.pin(keys=dig, val=f"{count:x}")
+                if self.dts.get(keys=dig) is None:
+                    self.dts.pin(keys=dig, val=dts)
+
+        return len(counts)
+
     def delTopic(self, key):
         """
         Use snKey()
@@ -113,8 +289,216 @@ class Mailboxer(dbing.LMDBer):
             msg = msg.encode("utf-8")
 
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        self.appendToTopic(topic=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        with self.transact():
+            self.appendToTopic(topic=topic, val=digb)
+            result = self.msgs.pin(keys=digb, val=msg)
+            self.dts.pin(keys=digb, val=helping.nowIso8601())
+            refs = self.refs.get(keys=digb)
+            self.refs.pin(keys=digb, val=f"{int(refs, 16) + 1 if refs else 1:x}")
+        self.notify(topic)
+        return result
+
+    def ackTopic(self, topic, fn):
+        """
+        Acknowledge that the subscriber of topic has received every message
+        before index fn. Never moves acknowledgment backwards.
+
+        Returns:
+            bool: True if acknowledgment advanced
+
+        Parameters:
+            topic (str | bytes): topic acknowledged
+            fn (int): index of first message not yet received
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+
+        with self.transact():
+            acked = self.acks.get(keys=topic)
+            if acked is not None and int(acked, 16) >= fn:
+                return False
+            return self.acks.pin(keys=topic, val=f"{fn:x}")
+
+    def policyFor(self, topic):
+        """
+        Returns:
+            RetentionPolicy | None: of topic
+
+        Parameters:
+            topic (bytes): prefix and topic name such as b"pre/receipt"
+        """
+        _, sep, name = bytes(topic).partition(b"/")
+        return self.policies.get((sep + name).decode("utf-8"), self.policy)
+
+    def topicsIter(self):
+        """
+        Returns:
+            Iterator: of each bytes topic with entries in .tpcs
+        """
+        key = b''
+        while True:
+            with self.env.begin(db=self.tpcs, buffers=True) as txn:
+                cursor = txn.cursor()
+                if not cursor.set_range(key):
+                    return
+                topic, _ = dbing.unsuffix(cursor.key())
+            yield topic
+            key = dbing.suffix(topic, dbing.MaxSuffix) + b'\x00'  # past last entry
+
+    def compactIter(self, now=None, batch=1000):
+        """
+        Returns:
+            Iterator: of number of expired entries deleted by each batched
+                write transaction. Message bodies are deleted once no topic
+                entry refers to them.
+
+        Parameters:
+            now (datetime | None): time to expire ages against. Default now
+            batch (int): maximum entries deleted per transaction
+        """
+        now = now if now is not None else helping.nowUTC()
+        for topic in self.topicsIter():
+            if (policy := self.policyFor(topic)) is None:
+                continue
+            while True:
+                with self.transact() as txn:
+                    removed = self._compactTopic(txn, topic, policy, now, batch)
+                if removed:
+                    yield removed
+                if removed < batch:
+                    break
+
+    def compact(self, now=None, batch=1000):
+        """
+        Returns:
+            int: number of expired topic entries deleted from all topics
+
+        Parameters:
+            now (datetime | None): time to expire ages against. Default now
+            batch (int): maximum entries deleted per transaction
+        """
+        return sum(self.compactIter(now=now, batch=batch))
+
+    def _compactTopic(self, txn, topic, policy, now, batch):
+        """
+        Returns number of up to batch oldest entries of topic deleted by
+        policy in write transaction txn.
+        """
+        cursor = txn.cursor(db=self.tpcs)
+        if cursor.set_range(dbing.suffix(topic, dbing.MaxSuffix)):
+            found = cursor.prev()
+        else:
+            found = cursor.last()
+        if not found:
+            return 0
+        ckey, last = dbing.unsuffix(cursor.key())
+        if ckey != topic:
+            return 0
+
+        cut = 0  # entries before cut expire regardless of age
+        if policy.count is not None:
+            cut = max(cut, last - policy.count + 1)
+        if policy.acked and (acked := self.acks.get(keys=topic)) is not None:
+            cut = max(cut, int(acked, 16))
+        cut = min(cut, last)  # always retain newest
+        oldest = (now - datetime.timedelta(seconds=policy.age)
+                  if policy.age is not None else None)
+
+        expired = []
+        if cursor.set_range(dbing.suffix(topic, 0)):
+            for iokey, dig in cursor.iternext():
+                ckey, ion = dbing.unsuffix(iokey)
+                if ckey != topic or ion >= last or len(expired) >= batch:
+                    break
+                if ion >= cut:
+                    if oldest is None:
+                        break
+                    dts = self.dts.get(keys=dig)  # unknown is expired
+                    if dts is not None and helping.fromIso8601(dts) > oldest:
+                        break
+                expired.append((bytes(iokey), bytes(dig)))
+
+        for iokey, dig in expired:
+            txn.delete(iokey, db=self.tpcs)
+            refs = self.refs.get(keys=dig)
+            if refs is None:  # unknown references so keep message
+                continue
+            refs = int(refs, 16) - 1
+            if refs > 0:
+                self.refs.pin(keys=dig, val=f"{refs:x}")
+            else:
+                self.refs.rem(keys=dig)
+                self.msgs.rem(keys=dig)
+                self.dts.rem(keys=dig)
+
+        return len(expired)
+
+    def sizes(self):
+        """
+        Returns:
+            dict: of mailbox size metrics keyed by str identifier prefix. Each
+                is dict with number of topics, number of messages and total
+                bytes of messages.
+        """
+        sizes = dict()
+        with self.snapshot() as txn:
+            cursor = txn.cursor(db=self.tpcs)
+            msgs = self.msgs.sdb
+            for iokey, dig in cursor.iternext():
+                topic, _ = dbing.unsuffix(iokey)
+                pre = topic.partition(b"/")[0].decode("utf-8")
+                size = sizes.setdefault(pre, dict(topics=set(), msgs=0, bytes=0))
+                size["topics"].add(topic)
+                size["msgs"] += 1
+                if (msg := txn.get(dig, db=msgs)) is not None:
+                    size["bytes"] += len(msg)
+
+        for size in sizes.values():
+            size["topics"] = len(size["topics"])
+        return sizes
+
+    def subscribe(self, topics):
+        """
+        Returns:
+            Subscription: signalled by .storeMsg whenever one of topics changes
+
+        Parameters:
+            topics (Iterable): of topics as str or bytes
+        """
+        topics = [topic.encode("utf-8") if hasattr(topic, "encode") else bytes(topic)
+                  for topic in topics]
+        sub = Subscription(mbx=self, topics=topics)
+        for topic in sub.topics:
+            self.subs.setdefault(topic, weakref.WeakSet()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        """
+        Stop signalling Subscription sub
+
+        Parameters:
+            sub (Subscription): returned by .subscribe
+        """
+        for topic in sub.topics:
+            if (subs := self.subs.get(topic)) is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self.subs[topic]
+
+    def notify(self, topic):
+        """
+        Signal subscriptions to topic that it changed
+
+        Parameters:
+            topic (bytes): topic changed
+        """
+        if (subs := self.subs.get(topic)) is None:
+            return
+        if not subs:  # all subscriptions garbage collected
+            del self.subs[topic]
+            return
+        for sub in list(subs):
+            sub.signal(topic)
 
     def cloneTopicIter(self, topic, fn=0):
         """
@@ -131,6 +515,60 @@ class Mailboxer(dbing.LMDBer):
                 yield ion, topic, msg.encode("utf-8")
 
 
+class MailboxCompactor(doing.Doer):
+    """
+    MailboxCompactor periodically deletes the messages of a Mailboxer expired
+    by its retention policies. Each batch is its own write transaction and the
+    Doer yields between batches so that other Doers and writers are not
+    blocked by a large compaction.
+
+    Attributes:
+        mbx (Mailboxer): mailbox compacted
+        period (float): seconds between compactions
+        batch (int): maximum entries deleted per transaction
+        removed (int): total number of topic entries deleted
+        metrics (dict): mailbox size metrics per prefix from Mailboxer.sizes
+            as of last compaction
+
+    """
+
+    def __init__(self, mbx, period=60.0, batch=1000, **kwa):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox to compact
+            period (float): seconds between compactions
+            batch (int): maximum entries deleted per transaction
+        """
+        super(MailboxCompactor, self).__init__(**kwa)
+        self.mbx = mbx
+        self.period = period
+        self.batch = batch
+        self.removed = 0
+        self.metrics = dict()
+
+    def do(self, tymth, tock=0.0, **opts):
+        """
+        Returns doifiable Doist compatible generator method that compacts
+        mailbox every .period seconds
+
+        Parameters:
+            tymth (function): injected function wrapper closure returned by .tymen() of
+                Tymist instance. Calling tymth() returns associated Tymist .tyme.
+            tock (float): injected initial tock value
+        """
+        self.wind(tymth)
+        self.tock = tock
+        yield self.tock
+
+        while True:
+            for removed in self.mbx.compactIter(batch=self.batch):
+                self.removed += removed
+                yield self.tock
+
+            self.metrics = self.mbx.sizes()
+            yield self.period
+
+
 class Respondant(doing.DoDoer):
     """
     Respondant processes buffer of response messages from inbound 'exn' messages and
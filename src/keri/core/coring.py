@@ -298,17 +298,17 @@ def loads(raw, size=None, kind=Serials.json):
        ked (dict): deserialized
 
     Parameters:
-       raw (Union[bytes,bytearray]): raw serialization to deserialze as dict
+       raw (Union[bytes,bytearray,memoryview]): raw serialization to deserialze as dict
        size (int): number of bytes to consume for the deserialization. If None
                    then consume all bytes
        kind (str): serialization kind (JSON, MGPK, CBOR)
     """
     if kind == Serials.json:
         try:
-            ked = json.loads(raw[:size].decode("utf-8"))
+            ked = json.loads(str(raw[:size], "utf-8"))
         except Exception as ex:
             raise DeserializeError("Error deserializing JSON: {}"
-                                       "".format(raw[:size].decode("utf-8")))
+                                       "".format(str(raw[:size], "utf-8")))
 
     elif kind == Serials.mgpk:
         try:
@@ -1234,6 +1234,11 @@ class Seqner(Matter):
         .qb2  is bytes in binary with derivation code + crypto material
         .transferable is Boolean, True when transferable derivation code False otherwise
 
+    Class Attributes:
+        InternSize (int): sequence numbers below InternSize have their qb64b
+            precomputed in .Interns
+        Interns (tuple): precomputed qb64b indexed by sequence number
+
     Properties:
         .sn is int sequence number
         .snh is hex string representation of sequence number no leading zeros
@@ -1252,6 +1257,9 @@ class Seqner(Matter):
 
     """
 
+    InternSize = 1024
+    Interns = ()  # filled in below class definition
+
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.Salt_128, sn=None, snh=None, **kwa):
         """
@@ -1285,6 +1293,32 @@ class Seqner(Matter):
             raise ValidationError("Invalid code = {} for Seqner."
                                   "".format(self.code))
 
+    @classmethod
+    def trusted(cls, sn):
+        """
+        Returns Seqner of int sn without validating it. Fast path for trusted
+        internal values such as first seen numbers read from the database.
+
+        Parameters:
+            sn (int): sequence number or some form of ordinal number
+        """
+        seqner = cls.__new__(cls)
+        seqner._code = MtrDex.Salt_128
+        seqner._size = None
+        seqner._raw = sn.to_bytes(16, 'big')  # Salt_128 raw size
+        return seqner
+
+    @property
+    def qb64b(self):
+        """
+        Property qb64b:
+        Returns Fully Qualified Base64 Version encoded as bytes
+        Uses precomputed .Interns when available
+        """
+        if (sn := self.sn) < len(self.Interns):
+            return self.Interns[sn]
+        return self._infil()
+
     @property
     def sn(self):
         """
@@ -1302,6 +1336,10 @@ class Seqner(Matter):
         return f"{self.sn:x}"  # "{:x}".format(self.sn)
 
 
+# precompute qb64b of small sequence numbers
+Seqner.Interns = tuple(Seqner.trusted(sn=sn)._infil() for sn in range(Seqner.InternSize))
+
+
 class Number(Matter):
     """
     Number is subclass of Matter, cryptographic material, for ordinal counting
@@ -1955,6 +1993,12 @@ class Verfer(Matter):
 
     See Matter for inherited attributes and properties:
 
+    Class Attributes:
+        Cache (LRUCache | None): memo of successful verifications shared by all
+            instances. Keyed by (blake3 digest of serialization, verfer code,
+            verfer raw, signature). None means do not memoize. Replay and
+            escrow reprocessing of the same event then skip re-verification.
+
     Attributes:
 
     Properties:
@@ -1963,6 +2007,7 @@ class Verfer(Matter):
         verify: verifies signature
 
     """
+    Cache = helping.LRUCache(maxsize=4096)
 
     def __init__(self, **kwa):
         """
@@ -1986,11 +2031,34 @@ class Verfer(Matter):
         using .raw as verifier public key for ._verify cipher suite determined
         by .code
 
+        Only successful verifications are memoized in .Cache when not None.
+        The memo key includes a digest of ser rather than any claimed SAID of
+        ser so that a hit may not be spoofed with different content.
+
         Parameters:
             sig is bytes signature
             ser is bytes serialization
         """
-        return (self._verify(sig=sig, ser=ser, key=self.raw))
+        if (cache := self.Cache) is None:
+            return (self._verify(sig=sig, ser=ser, key=self.raw))
+
+        key = self.memoKey(sig=sig, ser=ser)
+        if cache.get(key):
+            return True
+
+        if (result := self._verify(sig=sig, ser=ser, key=self.raw)):
+            cache.put(key, True)
+        return result
+
+    def memoKey(self, sig, ser):
+        """
+        Returns key into .Cache for signature sig on serialization ser by .raw
+
+        Parameters:
+            sig is bytes signature
+            ser is bytes serialization
+        """
+        return (blake3.blake3(ser).digest(), self.code, self.raw, bytes(sig))
 
     @staticmethod
     def _ed25519(sig, ser, key):
@@ -4538,8 +4606,17 @@ class Counter:
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
+    Class Attributes:
+        InternSize (int): counts below InternSize of the small count codes
+            have their qb64b precomputed in .Interns
+        Interns (dict): precomputed qb64b keyed by (code, count)
+        Externs (dict): (code, count) keyed by precomputed qb64b
+
     """
     Codex = CtrDex
+    InternSize = 64
+    Interns = {}  # filled in below class definition
+    Externs = {}  # filled in below class definition
     # Hards table maps from bytes Base64 first two code chars to int of
     # hard size, hs,(stable) of code. The soft size, ss, (unstable) for Counter
     # is always > 0 and hs + ss = fs always
@@ -4636,6 +4713,22 @@ class Counter:
                                      "(code and count) or qb64b or "
                                      "qb64 or qb2.")
 
+    @classmethod
+    def trusted(cls, code, count):
+        """
+        Returns Counter with code and count without validating them.
+        Fast path for trusted internal values such as when assembling
+        messages. Invalid values still raise when .qb64b is computed.
+
+        Parameters:
+            code (str): stable (hard) part of derivation code
+            count (int): count for soft part of code
+        """
+        counter = cls.__new__(cls)
+        counter._code = code
+        counter._count = count
+        return counter
+
     @property
     def code(self):
         """
@@ -4660,7 +4753,10 @@ class Counter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Uses precomputed .Interns when available
         """
+        if (qb64b := self.Interns.get((self._code, self._count))) is not None:
+            return qb64b
         return self._infil()
 
 
@@ -4792,6 +4888,12 @@ class Counter:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
 
+        both = qb64b[:4]  # fast path for precomputed small count codes
+        both = both.encode("utf-8") if hasattr(both, "encode") else bytes(both)
+        if (codeCount := self.Externs.get(both)) is not None:
+            self._code, self._count = codeCount
+            return
+
         first = qb64b[:2]  # extract first two char code selector
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
@@ -4872,6 +4974,14 @@ class Counter:
         self._count = count
 
 
+# precompute qb64b of small counts for the small (four char) count codes
+Counter.Interns.update({(code, count): f"{code}{intToB64(count, l=ss)}".encode("utf-8")
+                        for code, (hs, ss, fs, ls) in Counter.Sizes.items()
+                        if hs == 2 and fs == 4
+                        for count in range(Counter.InternSize)})
+Counter.Externs.update({qb64b: codeCount for codeCount, qb64b in Counter.Interns.items()})
+
+
 class Sadder:
     """
     Sadder is self addressed data (SAD) serializer-deserializer class
@@ -3,6 +3,8 @@
 keri.core.eventing module
 
 """
+import bisect
+import copy
 import datetime
 import json
 import logging
@@ -462,31 +464,84 @@ def verifySigs(raw, sigers, verfers):
         verfers is list of Verfer instance (public keys)
 
     """
-    if sigers is None:
-        sigers = []
-    # Ensure no duplicate sigers by using set math on sigers' sigs otherwise
-    # indices count for threshold will be erroneous. Does not modify in place
-    # passed in sigers list, but instead depends on caller to use indices to
-    # modify its copy to filter out unverifiable or duplicate sigers
-    usigs = oset([siger.qb64 for siger in sigers])
-    usigers = [Siger(qb64=sig) for sig in usigs]
-
-    # verify indexes of attached signatures against verifiers and assign
-    # verfer to each siger
-    for siger in usigers:
-        if siger.index >= len(verfers):
-            logger.info("Skipped sig: Index=%s to large.\n", siger.index)
-        siger.verfer = verfers[siger.index]  # assign verfer
-
-    # create lists of unique verified signatures and indices
-    vindices = []
-    vsigers = []
-    for siger in usigers:
-        if siger.verfer.verify(siger.raw, raw):
-            vindices.append(siger.index)
-            vsigers.append(siger)
-
-    return (vsigers, vindices)
+    return verifySigsBatch(batch=[(raw, sigers, verfers)])[0]
+
+
+def verifySigsBatch(batch, *, executor=None):
+    """
+    Returns list of (vsigers, vindices) duples one for each (raw, sigers, verfers)
+    triple in batch in the same order as batch where for each triple:
+        vsigers is list  of unique verified sigers with assigned verfer
+        vindices is list of indices from those verified sigers
+
+    Batches the signature verifications of many events such as all the events
+    of an escrow pass or of a parsed stream chunk, or both the controller and
+    witness signatures of one event. When executor is provided the individual
+    verifications are fanned out to it. The underlying libsodium and
+    cryptography calls release the GIL so a ThreadPoolExecutor runs them
+    concurrently.
+
+    Duplicate sigers are removed by comparing their code, indices and raw
+    signature instead of round tripping through qb64. Each unique siger is a
+    shallow copy so that assigning its .verfer does not modify the
+    passed in sigers.
+
+    Parameters:
+        batch (Iterable): of (raw, sigers, verfers) triples where
+            raw (bytes): signed data
+            sigers (list | None): of indexed Siger instances (signatures)
+            verfers (list): of Verfer instances (public keys)
+        executor (concurrent.futures.Executor | None): when provided and there
+            is more than one verification then map verifications onto executor.
+            Otherwise verify serially in this thread.
+
+    """
+    groups = []  # list of lists of unique sigers with verfers one per triple
+    jobs = []  # flattened (raw, siger) duples of all verifications
+    for raw, sigers, verfers in batch:
+        usigers = []
+        seen = set()
+        for siger in (sigers if sigers is not None else []):
+            key = (siger.code, siger.index, siger.ondex, siger.raw)
+            if key in seen:  # duplicate sig would inflate indices for threshold
+                continue
+            seen.add(key)
+            if siger.index >= len(verfers):
+                logger.info("Skipped sig: Index=%s to large.\n", siger.index)
+                continue
+            siger = copy.copy(siger)  # do not assign verfer to caller's siger
+            siger.verfer = verfers[siger.index]  # assign verfer
+            usigers.append(siger)
+            jobs.append((raw, siger))
+        groups.append(usigers)
+
+    if executor is not None and len(jobs) > 1:
+        verdicts = list(executor.map(_verifySig, jobs))
+    else:
+        verdicts = [_verifySig(job) for job in jobs]
+
+    results = []
+    verdicts = iter(verdicts)
+    for usigers in groups:
+        # create lists of unique verified signatures and indices
+        vindices = []
+        vsigers = []
+        for siger in usigers:
+            if next(verdicts):
+                vindices.append(siger.index)
+                vsigers.append(siger)
+        results.append((vsigers, vindices))
+
+    return results
+
+
+def _verifySig(job):
+    """
+    Returns True if signature of siger verifies on raw given job duple
+    (raw, siger) where siger.verfer is assigned. Returns False otherwise.
+    """
+    raw, siger = job
+    return siger.verfer.verify(siger.raw, raw)
 
 
 def validateSigs(serder, sigers, verfers, tholder):
@@ -1408,21 +1463,21 @@ def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
 
     if sigers:
         if isinstance(seal, SealEvent):
-            atc.extend(Counter(CtrDex.TransIdxSigGroups, count=1).qb64b)
+            atc.extend(Counter.trusted(code=CtrDex.TransIdxSigGroups, count=1).qb64b)
             atc.extend(seal.i.encode("utf-8"))
             atc.extend(Seqner(snh=seal.s).qb64b)
             atc.extend(seal.d.encode("utf-8"))
 
         elif isinstance(seal, SealLast):
-            atc.extend(Counter(CtrDex.TransLastIdxSigGroups, count=1).qb64b)
+            atc.extend(Counter.trusted(code=CtrDex.TransLastIdxSigGroups, count=1).qb64b)
             atc.extend(seal.i.encode("utf-8"))
 
-        atc.extend(Counter(code=CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
+        atc.extend(Counter.trusted(code=CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
         for siger in sigers:
             atc.extend(siger.qb64b)
 
     if wigers:
-        atc.extend(Counter(code=CtrDex.WitnessIdxSigs, count=len(wigers)).qb64b)
+        atc.extend(Counter.trusted(code=CtrDex.WitnessIdxSigs, count=len(wigers)).qb64b)
         for wiger in wigers:
             if wiger.verfer and wiger.verfer.code not in NonTransDex:
                 raise ValueError("Attempt to use tranferable prefix={} for "
@@ -1430,7 +1485,7 @@ def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
             atc.extend(wiger.qb64b)
 
     if cigars:
-        atc.extend(Counter(code=CtrDex.NonTransReceiptCouples, count=len(cigars)).qb64b)
+        atc.extend(Counter.trusted(code=CtrDex.NonTransReceiptCouples, count=len(cigars)).qb64b)
         for cigar in cigars:
             if cigar.verfer.code not in NonTransDex:
                 raise ValueError("Attempt to use tranferable prefix={} for "
@@ -1442,8 +1497,8 @@ def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
         if len(atc) % 4:
             raise ValueError("Invalid attachments size={}, nonintegral"
                              " quadlets.".format(len(atc)))
-        msg.extend(Counter(code=CtrDex.AttachedMaterialQuadlets,
-                           count=(len(atc) // 4)).qb64b)
+        msg.extend(Counter.trusted(code=CtrDex.AttachedMaterialQuadlets,
+                                   count=(len(atc) // 4)).qb64b)
 
     msg.extend(atc)
     return msg
@@ -1474,33 +1529,33 @@ def proofize(sadtsgs=None, *, sadsigers=None, sadcigars=None, pipelined=False):
     count = 0
     for (pather, sigers) in sadsigers:
         count += 1
-        atc.extend(coring.Counter(coring.CtrDex.SadPathSig, count=1).qb64b)
+        atc.extend(coring.Counter.trusted(code=coring.CtrDex.SadPathSig, count=1).qb64b)
         atc.extend(pather.qb64b)
 
-        atc.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
+        atc.extend(coring.Counter.trusted(code=coring.CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
         for siger in sigers:
             atc.extend(siger.qb64b)
 
     for (pather, prefixer, seqner, saider, sigers) in sadtsgs:
         count += 1
-        atc.extend(coring.Counter(coring.CtrDex.SadPathSig, count=1).qb64b)
+        atc.extend(coring.Counter.trusted(code=coring.CtrDex.SadPathSig, count=1).qb64b)
         atc.extend(pather.qb64b)
 
-        atc.extend(coring.Counter(coring.CtrDex.TransIdxSigGroups, count=1).qb64b)
+        atc.extend(coring.Counter.trusted(code=coring.CtrDex.TransIdxSigGroups, count=1).qb64b)
         atc.extend(prefixer.qb64b)
         atc.extend(seqner.qb64b)
         atc.extend(saider.qb64b)
 
-        atc.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
+        atc.extend(coring.Counter.trusted(code=coring.CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
         for siger in sigers:
             atc.extend(siger.qb64b)
 
     for (pather, cigars) in sadcigars:
         count += 1
-        atc.extend(coring.Counter(coring.CtrDex.SadPathSig, count=1).qb64b)
+        atc.extend(coring.Counter.trusted(code=coring.CtrDex.SadPathSig, count=1).qb64b)
         atc.extend(pather.qb64b)
 
-        atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples, count=len(sadcigars)).qb64b)
+        atc.extend(coring.Counter.trusted(code=coring.CtrDex.NonTransReceiptCouples, count=len(sadcigars)).qb64b)
         for cigar in cigars:
             if cigar.verfer.code not in coring.NonTransDex:
                 raise ValueError("Attempt to use tranferable prefix={} for "
@@ -1514,12 +1569,12 @@ def proofize(sadtsgs=None, *, sadsigers=None, sadcigars=None, pipelined=False):
         if len(atc) % 4:
             raise ValueError("Invalid attachments size={}, nonintegral"
                              " quadlets.".format(len(atc)))
-        msg.extend(coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
-                                  count=(len(atc) // 4)).qb64b)
+        msg.extend(coring.Counter.trusted(code=coring.CtrDex.AttachedMaterialQuadlets,
+                                          count=(len(atc) // 4)).qb64b)
 
     if count > 1:
         root = coring.Pather(bext="-")
-        msg.extend(coring.Counter(code=coring.CtrDex.SadPathSigGroup, count=count).qb64b)
+        msg.extend(coring.Counter.trusted(code=coring.CtrDex.SadPathSigGroup, count=count).qb64b)
         msg.extend(root.qb64b)
 
     msg.extend(atc)
@@ -1553,6 +1608,9 @@ class Kever:
             True means only process msgs for own events when .prefixes is not empty
             False means only process msgs for not own events when .prefixes is not empty
                 Default is False.
+        executor (Executor | None): Injected from Kevery when provided.
+            Used to fan out batched signature verifications. None means verify
+            serially.
         version (Versionage): serder.version instance of current event state version
         prefixer (Prefixer):  instance for current event state
         sner (Number): instance of sequence number
@@ -1582,12 +1640,26 @@ class Kever:
 
 
     Properties:
+        serder (Serder): instance of current event. When reloaded from state
+            kept as raw bytes until first accessed
+        verfers (list): of Verfer instances for current signing keys. When
+            reloaded from state kept as qb64 until first accessed
+        digers (list): of Diger instances for current next key digests. When
+            reloaded from state kept as qb64 until first accessed
         sn (int): sequence number property that returns .sner.num
         fn (int): first seen ordinal number property the returns .fner.num
         digs (list): of digests qb64 of .digers
         kevers (dict): reference to self.db.kevers
         transferable (bool): True if .digers is not empty and pre is transferable
 
+    Hidden:
+        _serder (Serder | None): current event once materialized
+        _raw (bytes | None): raw current event not yet materialized
+        _verfers (list | None): Verfers once materialized
+        _keys (list | None): qb64 signing keys not yet materialized
+        _digers (list | None): Digers once materialized
+        _digs (list | None): qb64 next key digests not yet materialized
+
     ToDo:
        Add Registrar Backer support:
         Class variable, instance variable and parse support config trait.
@@ -1598,9 +1670,16 @@ class Kever:
     EstOnly = False
     DoNotDelegate = False
 
+    __slots__ = ('db', 'cues', 'prefixes', 'local', 'executor', 'version',
+                 'prefixer', 'sner', 'fner', 'dater', 'ilk', 'tholder',
+                 'ntholder', 'toader', 'wits', 'cuts', 'adds', 'estOnly',
+                 'doNotDelegate', 'lastEst', 'delegator', 'delegated',
+                 '_serder', '_raw', '_verfers', '_keys', '_digers', '_digs')
+
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, delseqner=None, delsaider=None, firner=None,
-                 dater=None, cues=None, prefixes=None, local=False, check=False):
+                 dater=None, cues=None, prefixes=None, local=False, check=False,
+                 executor=None):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
@@ -1640,6 +1719,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            executor (Executor | None): reference to Kevery.executor when
+                provided for batched signature verification
         """
         if not (state or (serder and sigers)):
             raise ValueError("Missing required arguments. Need state or serder"
@@ -1647,10 +1728,14 @@ class Kever:
 
         if db is None:
             db = basing.Baser(reopen=True)  # default name = "main"
+        self._serder = self._raw = None
+        self._verfers = self._keys = None
+        self._digers = self._digs = None
         self.db = db
         self.cues = cues
         self.prefixes = prefixes if prefixes is not None else db.prefixes
         self.local = True if local else False
+        self.executor = executor
 
         if state:  # preload from state
             self.reload(state)
@@ -1698,14 +1783,15 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                first=True if not check else False, seqner=delseqner, saider=delsaider,
-                                firner=firner, dater=dater)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fner = Number(num=fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64,
-                               val=self.state())
+        with self.db.transact():  # accept event and key state atomically
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                    first=True if not check else False, seqner=delseqner, saider=delsaider,
+                                    firner=firner, dater=dater)
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                self.fner = Number(num=fn)
+                self.dater = Dater(dts=dts)
+                self.db.states.pin(keys=self.prefixer.qb64,
+                                   val=self.state())
 
 
     @property
@@ -1726,12 +1812,68 @@ class Kever:
         return self.fner.num
 
 
+    @property
+    def serder(self):
+        """
+        Returns:
+            (Serder): current event materialized from raw on first access
+        """
+        if self._serder is None and self._raw is not None:
+            self._serder = Serder(raw=self._raw)
+            self._raw = None
+        return self._serder
+
+
+    @serder.setter
+    def serder(self, serder):
+        self._serder = serder
+        self._raw = None
+
+
+    @property
+    def verfers(self):
+        """
+        Returns:
+            (list): Verfers materialized from qb64 keys on first access
+        """
+        if self._verfers is None and self._keys is not None:
+            self._verfers = [Verfer(qb64=key) for key in self._keys]
+            self._keys = None
+        return self._verfers
+
+
+    @verfers.setter
+    def verfers(self, verfers):
+        self._verfers = verfers
+        self._keys = None
+
+
+    @property
+    def digers(self):
+        """
+        Returns:
+            (list): Digers materialized from qb64 digs on first access
+        """
+        if self._digers is None and self._digs is not None:
+            self._digers = [Diger(qb64=dig) for dig in self._digs]
+            self._digs = None
+        return self._digers
+
+
+    @digers.setter
+    def digers(self, digers):
+        self._digers = digers
+        self._digs = None
+
+
     @property
     def digs(self):
         """
         Returns:
             (list): digs of digers
         """
+        if self._digers is None and self._digs is not None:
+            return list(self._digs)
         return [diger.qb64 for diger in self.digers]
 
 
@@ -1770,8 +1912,8 @@ class Kever:
         self.ilk = state.et
         self.tholder = Tholder(sith=state.kt)
         self.ntholder = Tholder(sith=state.nt)
-        self.verfers = [Verfer(qb64=key) for key in state.k]
-        self.digers = [Diger(qb64=dig) for dig in state.n]
+        self._verfers, self._keys = None, state.k  # materialized when accessed
+        self._digers, self._digs = None, state.n
         self.toader = Number(numh=state.bt)  # auto converts from hex num
         self.wits = state.b
         self.cuts = state.ee.br
@@ -1788,7 +1930,7 @@ class Kever:
                                             dig=state.d))) is None:
             raise MissingEntryError(f"Corresponding event not found for state="
                                     f"{state}.")
-        self.serder = Serder(raw=bytes(raw))
+        self._serder, self._raw = None, bytes(raw)  # materialized when accessed
         # May want to do additional checks here
 
 
@@ -1990,30 +2132,31 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                    first=True if not check else False, seqner=delseqner, saider=delsaider,
-                                    firner=firner, dater=dater)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            self.digers = serder.digers
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.saider.qb64)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            with self.db.transact():  # accept event and key state atomically
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                        first=True if not check else False, seqner=delseqner, saider=delsaider,
+                                        firner=firner, dater=dater)
+
+                # nxt and signatures verify so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need whole serder for digest agility compare
+                self.ilk = ilk
+                self.tholder = tholder
+                self.verfers = serder.verfers
+                self.digers = serder.digers
+                self.ntholder = serder.ntholder
+
+                self.toader = toader
+                self.wits = wits
+                self.cuts = cuts
+                self.adds = adds
+
+                # last establishment event location need this to recognize recovery events
+                self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.saider.qb64)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -2050,17 +2193,18 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            with self.db.transact():  # accept event and key state atomically
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False)  # First seen accepted
+
+                # validates so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need for digest agility includes .serder.diger
+                self.ilk = ilk
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2238,14 +2382,15 @@ class Kever:
                                             [verfer.qb64 for verfer in verfers],
                                             serder.ked))
 
-        # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
-        # sigers  now have .verfer assigned
-
         werfers = [Verfer(qb64=wit) for wit in wits]
 
-        # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers)
+        # get unique verified sigers and indices lists from sigers list and
+        # unique verified wigers and windices lists from wigers list in one batch
+        ((sigers, indices),
+         (wigers, windices)) = verifySigsBatch(batch=[(serder.raw, sigers, verfers),
+                                                      (serder.raw, wigers, werfers)],
+                                               executor=self.executor)
+        # sigers  now have .verfer assigned
         # each wiger now has werfer of corresponding wit
 
         # check if fully signed
@@ -2466,43 +2611,45 @@ class Kever:
                 If cloned mode then dater maybe provided (not None)
                 When dater provided then use dater for first seen datetime
         """
-        fn = None  # None means not a first seen log event so does not return an fn
-        dgkey = dgKey(serder.preb, serder.saidb)
-        dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        val = (coring.Prefixer(qb64b=serder.preb), coring.Seqner(sn=serder.sn))
-        for verfer in serder.verfers:
-            self.db.pubs.add(keys=(verfer.qb64,), val=val)
-        for diger in serder.digers:
-            self.db.digs.add(keys=(diger.qb64,), val=val)
-        if first:  # append event dig to first seen database in order
-            if seqner and saider:  # authorized delegated or issued event
-                couple = seqner.qb64b + saider.qb64b
-                self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:
-                    self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
-                                          fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                            serder.preb, fn, firner.sn, serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                        serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
-        logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
-                    serder.preb, serder.pretty())
+        with self.db.transact():  # one commit for all the logs
+            fn = None  # None means not a first seen log event so does not return an fn
+            dgkey = dgKey(serder.preb, serder.saidb)
+            dtsb = helping.nowIso8601().encode("utf-8")
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            val = (coring.Prefixer(qb64b=serder.preb), coring.Seqner(sn=serder.sn))
+            for verfer in serder.verfers:
+                self.db.pubs.add(keys=(verfer.qb64,), val=val)
+            for diger in serder.digers:
+                self.db.digs.add(keys=(diger.qb64,), val=val)
+            if first:  # append event dig to first seen database in order
+                if seqner and saider:  # authorized delegated or issued event
+                    couple = seqner.qb64b + saider.qb64b
+                    self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:
+                        self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
+                                              fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
+                                serder.preb, fn, firner.sn, serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                self.db.scheduler.signal(serder.preb)  # may unblock escrows
+                logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
+                            serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
+                        serder.preb, serder.pretty())
         return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
 
     def escrowPSEvent(self, serder, sigers, wigers=None):
@@ -2523,6 +2670,7 @@ class Kever:
         self.db.putEvt(dgkey, serder.raw)
         snkey = snKey(serder.preb, serder.sn)
         self.db.addPse(snkey, serder.saidb)  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
+        self.db.scheduler.escrowed(serder.preb, deps=self._escrowDeps(serder))
         logger.info("Kever state: Escrowed partially signed or delegated "
                     "event = %s\n", serder.ked)
 
@@ -2545,6 +2693,7 @@ class Kever:
         dgkey = dgKey(serder.preb, serder.saidb)
         couple = seqner.qb64b + saider.qb64b
         self.db.putPde(dgkey, couple)  # idempotent
+        self.db.scheduler.escrowed(serder.preb, deps=self._escrowDeps(serder))
         logger.info("Kever state: Escrowed source couple for partially signed "
                     "or delegated event = %s\n", serder.ked)
 
@@ -2572,7 +2721,23 @@ class Kever:
         self.db.putEvt(dgkey, serder.raw)
         logger.info("Kever state: Escrowed partially witnessed "
                     "event = %s\n", serder.ked)
-        return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+        added = self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.scheduler.escrowed(serder.preb, deps=self._escrowDeps(serder))
+        return added
+
+    def _escrowDeps(self, serder):
+        """
+        Returns tuple of prefixes whose accepted events may unblock escrowed
+        event serder, that is the delegator of a delegated event.
+
+        Parameters:
+            serder (Serder): escrowed event
+        """
+        if serder.ked["t"] == Ilks.dip:
+            return (serder.ked["di"],)
+        if serder.ked["t"] == Ilks.drt and self.delegator:
+            return (self.delegator,)
+        return ()
 
 
     def state(self):
@@ -2598,11 +2763,12 @@ class Kever:
                       fn=self.fn, # property self.fner.num
                       stamp=self.dater.dts,  # need to add dater object for first seen dts
                       eilk=self.ilk,
-                      keys=[verfer.qb64 for verfer in self.verfers],
+                      keys=(list(self._keys) if self._keys is not None
+                            else [verfer.qb64 for verfer in self.verfers]),
                       eevt=eevt,
                       sith=self.tholder.sith,
                       nsith=self.ntholder.sith if self.ntholder else '0',
-                      ndigs=[diger.qb64 for diger in self.digers],
+                      ndigs=self.digs,
                       toad=self.toader.num,
                       wits=self.wits,
                       cnfg=cnfg,
@@ -2636,12 +2802,13 @@ class Kever:
         if sn is None:
             sn = self.lastEst.s - 1
 
-        for digb in self.db.getKelBackIter(pre, sn):
-            dgkey = dgKey(pre, digb)
-            raw = self.db.getEvt(dgkey)
-            serder = coring.Serder(raw=bytes(raw))
-            if serder.est:  # establishment event
-                return serder.digers
+        with self.db.snapshot():  # all reads from one snapshot
+            for digb in self.db.getKelBackIter(pre, sn):
+                dgkey = dgKey(pre, digb)
+                raw = self.db.getEvt(dgkey)
+                serder = coring.Serder(raw=bytes(raw))
+                if serder.est:  # establishment event
+                    return serder.digers
 
         return None
 
@@ -2785,6 +2952,8 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        executor (Executor | None): used to fan out batched signature
+                verifications. Injected into kevers. None means verify serially.
 
 
     Properties:
@@ -2805,7 +2974,8 @@ class Kevery:
     TimeoutQNF = 300   # seconds to timeout query not found escrows
 
     def __init__(self, *, cues=None, db=None, rvy=None,
-                 lax=True, local=False, cloned=False, direct=True, check=False):
+                 lax=True, local=False, cloned=False, direct=True, check=False,
+                 executor=None):
         """
         Initialize instance:
 
@@ -2827,6 +2997,9 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            executor (Executor | None): for fanning out batched signature
+                verifications such as concurrent.futures.ThreadPoolExecutor.
+                None means verify serially.
         """
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         if db is None:
@@ -2838,6 +3011,7 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.executor = executor  # batched signature verification
 
     @property
     def kevers(self):
@@ -2944,7 +3118,8 @@ class Kevery:
                               cues=self.cues,
                               prefixes=self.prefixes,
                               local=self.local,
-                              check=self.check)
+                              check=self.check,
+                              executor=self.executor)
                 self.kevers[pre] = kever  # not exception so add to kevers
 
                 if self.direct or self.lax or pre not in self.prefixes:  # not own event when owned
@@ -2969,13 +3144,12 @@ class Kevery:
                     # raises ValidationError if no valid sig
                     kever = self.kevers[pre]  # get key state
                     # get unique verified lists of sigers and indices from sigers
-                    sigers, indices = verifySigs(raw=serder.raw,
-                                                 sigers=sigers,
-                                                 verfers=eserder.verfers)
-
-                    wigers, windices = verifySigs(raw=serder.raw,
-                                                  sigers=wigers,
-                                                  verfers=eserder.werfers)
+                    # and of wigers and windices from wigers
+                    ((sigers, indices),
+                     (wigers, windices)) = verifySigsBatch(
+                        batch=[(serder.raw, sigers, eserder.verfers),
+                               (serder.raw, wigers, eserder.werfers)],
+                        executor=self.executor)
 
                     if sigers or wigers:  # at least one verified sig or wig so log evt
                         # not first seen inception so ignore return
@@ -2988,6 +3162,7 @@ class Kevery:
             else:  # rot, drt, or ixn, so sn matters
                 kever = self.kevers[pre]  # get existing kever for pre
                 #kever.cues = self.cues This is injected when inception is accepted
+                kever.executor = self.executor  # kever may be reloaded from db state
                 sno = kever.sner.num + 1  # proper sn of new inorder event
 
                 if not serder.saider.verify(sad=serder.ked):
@@ -3025,16 +3200,15 @@ class Kevery:
                         # may have attached valid signature not yet logged
                         # raises ValidationError if no valid sig
                         kever = self.kevers[pre]
-                        # get unique verified lists of sigers and indices from sigers
-                        sigers, indices = verifySigs(raw=serder.raw,
-                                                     sigers=sigers,
-                                                     verfers=eserder.verfers)
-
                         wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
                         werfers = [Verfer(qb64=wit) for wit in wits]
-                        wigers, windices = verifySigs(raw=serder.raw,
-                                                      sigers=wigers,
-                                                      verfers=werfers)
+                        # get unique verified lists of sigers and indices from sigers
+                        # and of wigers and windices from wigers
+                        ((sigers, indices),
+                         (wigers, windices)) = verifySigsBatch(
+                            batch=[(serder.raw, sigers, eserder.verfers),
+                                   (serder.raw, wigers, werfers)],
+                            executor=self.executor)
 
                         if sigers or wigers:  # at least one verified sig or wig so log evt
                             # not first seen update so ignore return
@@ -3085,11 +3259,13 @@ class Kevery:
 
             # process each couple verify sig and write to db
             wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
+            werfers = [Verfer(qb64=wit) for wit in wits]
+            rigers = []  # wigers from acceptable receiptors
             for wiger in wigers:
                 # assign verfers from witness list
                 if wiger.index >= len(wits):
                     continue  # skip invalid witness index
-                wiger.verfer = Verfer(qb64=wits[wiger.index])  # assign verfer
+                wiger.verfer = werfers[wiger.index]  # assign verfer
                 if wiger.verfer.transferable:  # skip transferable verfers
                     continue  # skip invalid witness prefix
 
@@ -3104,9 +3280,14 @@ class Kevery:
                                     " on nonlocal event receipt=\n%s\n", serder.pretty())
                         continue  # skip own receipt attachment on non-local event
 
-                if wiger.verfer.verify(wiger.raw, lserder.raw):
-                    # write receipt indexed sig to database
-                    self.db.addWig(key=dgkey, val=wiger.qb64b)
+                rigers.append(wiger)
+
+            # verify all remaining wigers in one batch
+            rigers, _ = verifySigsBatch(batch=[(lserder.raw, rigers, werfers)],
+                                        executor=self.executor)[0]
+            for wiger in rigers:
+                # write receipt indexed sig to database
+                self.db.addWig(key=dgkey, val=wiger.qb64b)
 
         else:  # no events to be receipted yet at that sn so escrow
             # get digest from receipt message not receipted event
@@ -3952,24 +4133,25 @@ class Kevery:
             sn is int sequence number of event in KEL of pre
         """
 
-        found = False
-        while not found:
-            dig = bytes(self.db.getKeLast(key=snKey(pre, sn)))
-            if not dig:
-                return None
+        with self.db.snapshot():  # all reads from one snapshot
+            found = False
+            while not found:
+                dig = bytes(self.db.getKeLast(key=snKey(pre, sn)))
+                if not dig:
+                    return None
 
-            # retrieve event by dig
-            raw = bytes(self.db.getEvt(key=dgKey(pre=pre, dig=dig)))
-            if not raw:
-                return None
+                # retrieve event by dig
+                raw = bytes(self.db.getEvt(key=dgKey(pre=pre, dig=dig)))
+                if not raw:
+                    return None
 
-            serder = Serder(raw=raw)  # deserialize event raw
-            if serder.ked["t"] in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):
-                return serder  # establishment event so return
+                serder = Serder(raw=raw)  # deserialize event raw
+                if serder.ked["t"] in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):
+                    return serder  # establishment event so return
 
-            sn = int(serder.ked["s"], 16) - 1  # set sn to previous event
-            if sn < 0:  # no more events
-                return None
+                sn = int(serder.ked["s"], 16) - 1  # set sn to previous event
+                if sn < 0:  # no more events
+                    return None
 
     def escrowOOEvent(self, serder, sigers, seqner=None, saider=None, wigers=None):
         """
@@ -3992,6 +4174,7 @@ class Kevery:
         if seqner and saider:
             couple = seqner.qb64b + saider.qb64b
             self.db.putPde(dgkey, couple)  # idempotent
+        self.db.scheduler.escrowed(serder.preb)
         # log escrowed
         logger.info("Kevery process: escrowed out of order event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -4016,6 +4199,8 @@ class Kevery:
         for cigar in cigars:
             self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
 
+        qpre = serder.ked.get("q", {}).get("i")  # queried prefix not yet found
+        self.db.scheduler.escrowed(prefixer.qb64b, deps=(qpre,) if qpre else ())
         # log escrowed
         logger.info("Kevery process: escrowed query not found event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -4033,6 +4218,7 @@ class Kevery:
         self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
         self.db.putEvt(dgkey, serder.raw)
         self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.scheduler.escrowed(serder.preb)
         # log duplicitous
         logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -4069,6 +4255,7 @@ class Kevery:
             # continue  # skip invalid triplets
             couple = said.encode("utf-8") + wiger.qb64b
             self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
+        self.db.scheduler.escrowed(serder.preb)
         # log escrowed
         logger.info("Kevery process: escrowed unverified witness indexed receipt"
                     " of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -4100,6 +4287,7 @@ class Kevery:
                 continue  # skip invalid triplets
             triple = said.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
             self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+        self.db.scheduler.escrowed(serder.preb)
         # log escrowed
         logger.info("Kevery process: escrowed unverified receipt of pre= %s "
                     " sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -4144,6 +4332,7 @@ class Kevery:
             for siger in sigers:  # escrow each quintlet
                 quintuple = prelet + siger.qb64b  # quintuple
                 self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            self.db.scheduler.escrowed(serder.preb, deps=(prefixer.qb64b,))
             # log escrowed
             logger.info("Kevery process: escrowed unverified transferable receipt "
                         "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4186,6 +4375,7 @@ class Kevery:
         for siger in sigers:  # escrow each quintlet
             quintuple = prelet + siger.qb64b  # quintuple
             self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.db.scheduler.escrowed(serder.preb, deps=(prefixer.qb64b,))
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferable receipt "
                     "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4219,27 +4409,39 @@ class Kevery:
         quintuple = (serder.saidb + sprefixer.qb64b + sseqner.qb64b +
                      saider.qb64b + siger.qb64b)
         self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.db.scheduler.escrowed(serder.preb, deps=(sprefixer.qb64b,))
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferabe validator "
                     "receipt of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn,
                     serder.said)
 
-    def processEscrows(self):
+    def processEscrows(self, full=False):
         """
-        Iterate throush escrows and process any that may now be finalized
+        Iterate throush escrows and process any that may now be finalized.
+        Only escrows of the prefixes that .db.scheduler has made ready since
+        the last pass of this Kevery are reattempted. The first pass walks all
+        escrows.
+        Duration of each processor pass is recorded in .db.escrowMeter.
 
         Parameters:
+            full (bool): True means walk all escrows regardless of schedule
         """
-
+        scheduler = self.db.scheduler
+        pres = scheduler.pull(reader=self)
+        if full:
+            pres = None
+        scheduler.busy = True
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processQueryNotFound()
+            for processor in (self.processEscrowOutOfOrders,
+                              self.processEscrowUnverWitness,
+                              self.processEscrowUnverNonTrans,
+                              self.processEscrowUnverTrans,
+                              self.processEscrowPartialWigs,
+                              self.processEscrowPartialSigs,
+                              self.processEscrowDuplicitous,
+                              self.processQueryNotFound):
+                with self.db.escrowMeter.timed(f"Kevery.{processor.__name__}"):
+                    processor(pres=pres)
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -4248,7 +4450,43 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+        finally:
+            scheduler.busy = False
+
+    def _escrowItemsIter(self, getter, key, pres, timeout):
+        """
+        Returns iterator of escrow items from getter starting after key but
+        only of those prefixes in pres. Jumps over escrows of other prefixes.
+        Schedules expiry of escrows of visited prefixes with .db.scheduler.
+
+        Parameters:
+            getter (Callable): escrow items next iterator such as
+                .db.getOoeItemsNextIter
+            key (bytes): escrow key of last item processed
+            pres (list | None): sorted bytes prefixes to process.
+                None means all prefixes
+            timeout (float): seconds to timeout of escrows from getter
+        """
+        skip = True
+        while True:
+            items = getter(key=key, skip=skip)
+            item = next(items, None)
+            if item is None:
+                return
+            pre = bytes(splitKey(item[0])[0])
+            i = bisect.bisect_left(pres, pre) if pres is not None else 0
+            if pres is None or (i < len(pres) and pres[i] == pre):
+                self.db.scheduler.expire(pre, timeout)
+                yield item
+                yield from items
+                return
+            items.close()  # release read transaction before jumping ahead
+            if i >= len(pres):  # no later prefixes to process
+                return
+            key = pres[i] + b'.'  # first key of next prefix to process
+            skip = False
+
+    def processEscrowOutOfOrders(self, pres=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -4288,7 +4526,8 @@ class Kevery:
 
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getOoeItemsNextIter(key=key):
+            for ekey, edig in self._escrowItemsIter(self.db.getOoeItemsNextIter,
+                                                    key, pres, self.TimeoutOOE):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     # check date if expired then remove escrow.
@@ -4384,7 +4623,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialSigs(self):
+    def processEscrowPartialSigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -4421,7 +4660,8 @@ class Kevery:
 
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getPseItemsNextIter(key=key):
+            for ekey, edig in self._escrowItemsIter(self.db.getPseItemsNextIter,
+                                                    key, pres, self.TimeoutPSE):
                 eserder = None
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
@@ -4543,7 +4783,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -4582,7 +4822,8 @@ class Kevery:
 
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getPweItemsNextIter(key=key):
+            for ekey, edig in self._escrowItemsIter(self.db.getPweItemsNextIter,
+                                                    key, pres, self.TimeoutPWE):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     # check date if expired then remove escrow.
@@ -4699,7 +4940,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, pres=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4751,7 +4992,8 @@ class Kevery:
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
+            for ekey, ecouple in self._escrowItemsIter(self.db.getUweItemsNextIter,
+                                                       key, pres, self.TimeoutUWE):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
                     #  get escrowed receipt's rdiger of receipted event and
@@ -4822,7 +5064,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, pres=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4872,7 +5114,8 @@ class Kevery:
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
+            for ekey, etriplet in self._escrowItemsIter(self.db.getUreItemsNextIter,
+                                                        key, pres, self.TimeoutURE):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
@@ -4995,7 +5238,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processQueryNotFound(self):
+    def processQueryNotFound(self, pres=None):
         """
         Process qry events escrowed by Kevery for KELs that have not yet met the criteria of the query.
         A missing KEL or criteria for an event in a KEL at a particular sequence number or an event containing a
@@ -5024,7 +5267,8 @@ class Kevery:
         pre = b''
         sn = 0
         while True:  # break when done
-            for ekey, edig in self.db.getQnfItemsNextIter(key=key):
+            for ekey, edig in self._escrowItemsIter(self.db.getQnfItemsNextIter,
+                                                    key, pres, self.TimeoutQNF):
                 try:
                     pre, _ = splitKey(ekey)  # get pre and sn from escrow item
                     # check date if expired then remove escrow.
@@ -5218,7 +5462,7 @@ class Kevery:
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, pres=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -5266,7 +5510,8 @@ class Kevery:
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
+            for ekey, equinlet in self._escrowItemsIter(self.db.getVreItemsNextIter,
+                                                        key, pres, self.TimeoutVRE):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
@@ -5375,6 +5620,8 @@ class Kevery:
                 except UnverifiedTransferableReceiptError as ex:
                     # still waiting on missing prior event to validate
                     # only happens if we process above
+                    # so wait again on next accepted event of validator
+                    self.db.scheduler.escrowed(pre, deps=(sprefixer.qb64b,))
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
                     else:
@@ -5399,7 +5646,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowDuplicitous(self):
+    def processEscrowDuplicitous(self, pres=None):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -5437,7 +5684,8 @@ class Kevery:
         """
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getLdeItemsNextIter(key=key):
+            for ekey, edig in self._escrowItemsIter(self.db.getLdeItemsNextIter,
+                                                    key, pres, self.TimeoutLDE):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     # check date if expired then remove escrow.
@@ -0,0 +1,240 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.core.ingesting module
+
+Parallel KEL ingestion pipeline. Worker processes parse and pre-validate
+framed key event messages. The single writer that owns the database then
+processes them in order through Kevery.
+"""
+from collections import deque, namedtuple
+from itertools import islice
+
+from . import coring, eventing, parsing
+from .coring import Ilks, Protos, Sadder, Verfer
+from .. import help
+from .. import kering
+
+logger = help.ogler.getLogger()
+
+# Prevalidation result of one framed message returned by worker
+# msg (bytes): framed message with attachments as submitted
+# valid (bool): False means message must be dropped
+# reason (str | None): why not valid
+# memos (list): Verfer.memoKey tuples of signatures verified by worker
+Prevalidation = namedtuple("Prevalidation", "msg valid reason memos")
+
+
+class Prevalidator:
+    """
+    Prevalidator stands in for Kevery when parsing in a worker process.
+    Checks a key event against the key state it claims without any database.
+    SAID, version, prefix are always checked. Controller signatures of
+    establishment events are verified against the keys in the event itself
+    and witness signatures of inception events against its witnesses.
+    Interaction events claim no keys so their signatures are left to Kevery.
+
+    Attributes:
+        valid (bool | None): None means no key event was parsed
+        reason (str | None): why not valid
+        memos (list): Verfer.memoKey tuples of verified signatures
+
+    """
+
+    def __init__(self):
+        """ Initialize instance """
+        self.valid = None
+        self.reason = None
+        self.memos = []
+
+    def processEvent(self, serder, sigers, *, wigers=None, **kwa):
+        """
+        Pre-validate one key event serder with attached sigers and wigers.
+        Same parameters as Kevery.processEvent. Unused ones are ignored.
+        """
+        ked = serder.ked
+        ilk = ked["t"]
+        try:
+            prefixer = coring.Prefixer(qb64=serder.pre)
+        except Exception:
+            return self._reject(f"Invalid pre={serder.pre}.")
+
+        if serder.version != kering.Version:
+            return self._reject(f"Unsupported version={serder.version}.")
+
+        if ilk in (Ilks.icp, Ilks.dip):
+            if not prefixer.verify(ked=ked, prefixed=True):
+                return self._reject(f"Invalid prefix={serder.pre}.")
+            # digestive prefix verification also verified dummied 'd' field
+            if not prefixer.digestive and not serder.saider.verify(sad=ked):
+                return self._reject(f"Invalid SAID={serder.said}.")
+        elif not serder.saider.verify(sad=ked):
+            return self._reject(f"Invalid SAID={serder.said}.")
+
+        batch = []
+        if ilk in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):  # keys in event
+            batch.append((serder.raw, sigers, serder.verfers))
+            if ilk in (Ilks.icp, Ilks.dip):  # witnesses in event
+                batch.append((serder.raw, wigers, serder.werfers))
+
+        results = eventing.verifySigsBatch(batch=batch)
+        if results:
+            _, indices = results[0]
+            if not indices:  # Kevery would drop it too
+                return self._reject(f"No verified signatures for evt={serder.said}.")
+            for vsigers, _ in results:
+                self.memos.extend(siger.verfer.memoKey(sig=siger.raw, ser=serder.raw)
+                                  for siger in vsigers)
+
+        self.valid = True
+
+    def processReceiptCouples(self, serder, cigars, firner=None):
+        """ Receipts attached to event are left to Kevery """
+
+    def processReceiptQuadruples(self, serder, trqs, firner=None):
+        """ Receipts attached to event are left to Kevery """
+
+    def _reject(self, reason):
+        """ Record failure with reason """
+        self.valid = False
+        self.reason = reason
+
+
+def prevalidate(msg):
+    """
+    Returns Prevalidation of one framed message msg with its attachments.
+    Runs in a worker process so uses no database. Messages other than key
+    events are passed through as valid for the writer to process.
+
+    Parameters:
+        msg (bytes): framed message with attachments
+    """
+    msg = bytes(msg)
+    try:
+        sadder = Sadder(raw=msg)
+    except kering.ShortageError as ex:
+        return Prevalidation(msg, False, f"Truncated message: {ex}", [])
+    except Exception:  # not a message pass through and let writer log
+        return Prevalidation(msg, True, None, [])
+
+    if (sadder.proto != Protos.keri or
+            sadder.ked.get("t") not in (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt)):
+        return Prevalidation(msg, True, None, [])
+
+    prevalidator = Prevalidator()
+    parser = parsing.Parser(framed=True, kvy=prevalidator, viewed=True)
+    parser.parseOne(ims=msg)
+    if prevalidator.valid is None:  # extraction error so writer logs it
+        return Prevalidation(msg, True, None, [])
+    return Prevalidation(msg, prevalidator.valid, prevalidator.reason,
+                         prevalidator.memos)
+
+
+def prevalidateBatch(msgs):
+    """
+    Returns list of Prevalidation of each framed message in msgs in order.
+    Worker entry point so a whole batch is sent to a worker at once.
+
+    Parameters:
+        msgs (list): of framed messages (bytes) each with attachments
+    """
+    return [prevalidate(msg) for msg in msgs]
+
+
+class Ingester:
+    """
+    Ingester runs a parallel KEL ingestion pipeline. Framed messages are
+    pre-validated by prevalidate in worker processes of an executor. Results
+    are consumed in submission order on this, the single writer, which feeds
+    the valid messages to its parser and Kevery so that only the ordered
+    state mutating processing stays on the thread that owns the database.
+
+    Signatures verified by the workers are seeded into Verfer.Cache so that
+    Kevery does not verify them again. Messages that fail pre-validation are
+    dropped and counted.
+
+    Attributes:
+        kvy (Kevery): single writer of key state
+        parser (Parser): parses valid messages into .kvy
+        executor (Executor | None): pool of workers such as a
+            concurrent.futures.ProcessPoolExecutor. None means
+            pre-validate on this thread.
+        chunksize (int): number of messages sent to a worker at once
+        window (int): maximum number of chunks in flight at once so memory
+            is bounded for long or unbounded msgs iterables
+        accepted (int): number of messages fed to .parser
+        rejected (int): number of messages dropped by pre-validation
+
+    """
+
+    def __init__(self, kvy, *, parser=None, executor=None, chunksize=64, window=8):
+        """
+        Initialize instance
+
+        Parameters:
+            kvy (Kevery): single writer of key state
+            parser (Parser | None): parser to feed. Default routes to kvy.
+            executor (Executor | None): pool of worker processes
+            chunksize (int): number of messages sent to a worker at once
+            window (int): maximum number of chunks in flight at once
+        """
+        self.kvy = kvy
+        self.parser = (parser if parser is not None else
+                       parsing.Parser(framed=True, kvy=kvy, rvy=kvy.rvy))
+        self.executor = executor
+        self.chunksize = chunksize
+        self.window = max(1, window)
+        self.accepted = 0
+        self.rejected = 0
+
+    def ingest(self, msgs):
+        """
+        Pre-validates framed msgs in parallel and processes the valid ones in
+        order. Returns number of messages accepted for processing.
+
+        Parameters:
+            msgs (Iterable): of framed messages (bytes) each with attachments
+                such as from Baser.clonePreIter or an OOBI response
+        """
+        if self.executor is not None:
+            results = self.prevalidateIter(msgs)
+        else:
+            results = map(prevalidate, msgs)
+
+        accepted = 0
+        for result in results:  # in submission order
+            if not result.valid:
+                self.rejected += 1
+                logger.info("Ingester: dropped msg. %s\n", result.reason)
+                continue
+
+            if (cache := Verfer.Cache) is not None:
+                for memo in result.memos:
+                    cache.put(memo, True)
+
+            self.parser.parseOne(ims=bytearray(result.msg))
+            accepted += 1
+
+        self.accepted += accepted
+        return accepted
+
+    def prevalidateIter(self, msgs):
+        """
+        Generator of Prevalidation of each of msgs in order from .executor.
+        Submits msgs in chunks of .chunksize with at most .window chunks in
+        flight so msgs is consumed lazily and results are not all buffered.
+
+        Parameters:
+            msgs (Iterable): of framed messages (bytes) each with attachments
+        """
+        msgs = iter(msgs)
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < self.window and (chunk := list(islice(msgs, self.chunksize))):
+                    pending.append(self.executor.submit(prevalidateBatch, chunk))
+                if not pending:
+                    return
+                yield from pending.popleft().result()
+        finally:  # consumer stopped early
+            for future in pending:
+                future.cancel()
@@ -67,6 +67,117 @@ Coldage = namedtuple("Coldage", 'msg txt bny')  # stream cold start status
 Colds = Coldage(msg='msg', txt='txt', bny='bny')
 
 
+class ViewStream:
+    """
+    ViewStream is an incoming message stream buffer with a read cursor.
+    Supports the subset of bytearray behavior used by Parser and by the
+    primitive classes when extracting with strip=True i.e. len, truth, indexing,
+    slicing, extend and deletion from the front with del ims[:n]. Like
+    bytearray a slice is a bytearray copy of only the sliced bytes.
+
+    Deleting from the front only advances the read cursor. The consumed bytes
+    are compacted away in bulk once they exceed .Compaction and half the
+    buffer so stripping is O(1) and a whole stream is parsed in linear time.
+    An immutable bytes stream is wrapped without copying and is only copied
+    into a bytearray if extended. Message bodies are deserialized from a
+    zero-copy memoryview of the unconsumed bytes provided by .view().
+
+    Class Attributes:
+        Compaction (int): minimum number of consumed bytes before compaction
+
+    Attributes:
+        compactions (int): number of bulk compactions performed
+
+    Properties:
+        consumed (int): number of bytes consumed but not yet compacted away
+
+    Hidden:
+        _buf (bytes | bytearray): underlying buffer
+        _pos (int): read cursor offset into ._buf of first unconsumed byte
+    """
+    Compaction = 65536
+
+    def __init__(self, ims=b''):
+        """
+        Initialize instance
+
+        Parameters:
+            ims (bytes | bytearray | memoryview): initial stream contents.
+                bytes is wrapped without copying, others are copied.
+        """
+        self._buf = ims if isinstance(ims, bytes) else bytearray(ims)
+        self._pos = 0
+        self.compactions = 0
+
+    def __len__(self):
+        return len(self._buf) - self._pos
+
+    def __bool__(self):
+        return len(self._buf) > self._pos
+
+    def __bytes__(self):
+        return bytes(self._buf[self._pos:])
+
+    def __getitem__(self, key):
+        size = len(self._buf) - self._pos
+        if isinstance(key, slice):
+            start, stop, step = key.indices(size)
+            if step != 1:
+                raise ValueError("Unsupported stepped slice of ViewStream.")
+            stop = max(start, stop)
+            with memoryview(self._buf) as view:  # like bytearray slice copy
+                return bytearray(view[self._pos + start:self._pos + stop])
+
+        if key < 0:
+            key += size
+        if not 0 <= key < size:
+            raise IndexError("ViewStream index out of range.")
+        return self._buf[self._pos + key]
+
+    def __delitem__(self, key):
+        """ Only deletion from the front of the stream i.e. del ims[:n] """
+        if (not isinstance(key, slice) or key.start not in (None, 0) or
+                key.step not in (None, 1)):
+            raise ValueError("ViewStream only supports deletion from front.")
+        size = len(self._buf) - self._pos
+        stop = size if key.stop is None else key.indices(size)[1]
+        self._pos += max(0, stop)
+        if self._pos >= len(self._buf):  # all consumed so reset cheaply
+            self._buf = b''
+            self._pos = 0
+        elif self._pos >= self.Compaction and self._pos * 2 >= len(self._buf):
+            self.compact()
+
+    @property
+    def consumed(self):
+        """ Returns number of consumed bytes not yet compacted away """
+        return self._pos
+
+    def extend(self, data):
+        """ Appends data to end of stream """
+        if not isinstance(self._buf, bytearray):  # copy on first write
+            self._buf = bytearray(self._buf[self._pos:])
+            self._pos = 0
+        self._buf.extend(data)
+
+    def compact(self):
+        """ Deletes consumed bytes from front of buffer in one bulk operation """
+        if self._pos:
+            if isinstance(self._buf, bytearray):
+                del self._buf[:self._pos]
+            else:
+                self._buf = self._buf[self._pos:]
+            self._pos = 0
+            self.compactions += 1
+
+    def view(self):
+        """
+        Returns memoryview of unconsumed bytes without copying.
+        Caller must release the view before the stream is extended or stripped.
+        """
+        return memoryview(self._buf)[self._pos:]
+
+
 class Parser:
     """
     Parser is stream parser that processes an incoming message stream.
@@ -89,15 +200,18 @@ class Parser:
                 whenever stream includes pipelined count codes.
         kvy (Kevery): route KEL message types to this instance
         tvy (Tevery): route TEL message types to this instance
+        viewed (bool): True means parse provided ims through a ViewStream
+                read cursor instead of stripping a bytearray copy
 
     """
 
-    def __init__(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
+    def __init__(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None,
+                 exc=None, rvy=None, vry=None, viewed=False):
         """
         Initialize instance:
 
         Parameters:
-            ims (bytearray): incoming message stream
+            ims (bytearray | ViewStream): incoming message stream
             framed (bool): True means ims contains only one msg body plus
                 its foot of attachments, not multiple sets of msg body plus foot
             pipeline (bool): True means use pipeline processor to process
@@ -107,8 +221,17 @@ class Parser:
             exc (Exchanger): route EXN message types to this instance
             rvy (Revery): reply (RPY) message handler
             vry (Verfifier): credential verifier with wallet storage
+            viewed (bool): True means wrap ims provided to the parse methods in
+                a ViewStream so that large replay streams such as those from
+                Baser.cloneAllPreIter are parsed in linear time. A provided
+                bytearray is copied once and its consumed prefix deleted when
+                parsing ends except by .parsator whose owner extends it live.
+                False means copy provided ims into a bytearray.
         """
-        self.ims = ims if ims is not None else bytearray()
+        self.viewed = True if viewed else False
+        if ims is None:
+            ims = ViewStream() if self.viewed else bytearray()
+        self.ims = ims
         self.framed = True if framed else False  # extract until end-of-stream
         self.pipeline = True if pipeline else False  # process as pipelined
         self.kvy = kvy
@@ -117,6 +240,40 @@ class Parser:
         self.rvy = rvy
         self.vry = vry
 
+    def _streamify(self, ims, live=False):
+        """
+        Returns ims as strippable stream. When .viewed then wraps ims in a
+        ViewStream. bytes is wrapped without copying and a bytearray is copied
+        once so stripping does not shift it. Use ._consume to delete the
+        consumed prefix from the provided bytearray. Otherwise copies ims into
+        a bytearray unless already a bytearray or ViewStream.
+
+        Parameters:
+            ims (bytes | bytearray | memoryview | ViewStream): incoming stream
+            live (bool): True means provided bytearray may be extended by its
+                owner while parsing so it is never wrapped
+        """
+        if isinstance(ims, ViewStream):
+            return ims
+        if isinstance(ims, bytearray) and (live or not self.viewed):
+            return ims
+        if self.viewed:
+            return ViewStream(bytes(ims) if isinstance(ims, bytearray) else ims)
+        return bytearray(ims)  # so make bytearray copy
+
+    @staticmethod
+    def _consume(src, ims):
+        """
+        Deletes from front of provided bytearray src the bytes consumed from
+        its stream ims returned by ._streamify in one bulk operation.
+
+        Parameters:
+            src (bytes | bytearray | memoryview | ViewStream): provided stream
+            ims (bytearray | ViewStream): stream parsed
+        """
+        if src is not ims and isinstance(src, bytearray):
+            del src[:len(src) - len(ims)]
+
     @staticmethod
     def sniff(ims):
         """
@@ -448,9 +605,9 @@ class Parser:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
+        src = ims
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
+            ims = self._streamify(ims)
         else:
             ims = self.ims  # use instance attribute by default
 
@@ -462,39 +619,42 @@ class Parser:
         rvy = rvy if rvy is not None else self.rvy
         vry = vry if vry is not None else self.vry
 
-        while ims:  # only process until ims empty
-            try:
-                done = yield from self.msgParsator(ims=ims,
-                                                   framed=framed,
-                                                   pipeline=pipeline,
-                                                   kvy=kvy,
-                                                   tvy=tvy,
-                                                   exc=exc,
-                                                   rvy=rvy,
-                                                   vry=vry)
-
-            except kering.SizedGroupError as ex:  # error inside sized group
-                # processOneIter already flushed group so do not flush stream
-                if logger.isEnabledFor(logging.ERROR):
-                    logger.exception("Parser msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Parser msg extraction error: %s\n", ex.args[0])
-
-            except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
-                if logger.isEnabledFor(logging.ERROR):
-                    logger.exception("Parser msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Parser msg extraction error: %s\n", ex.args[0])
-                del ims[:]  # delete rest of stream to force cold restart
+        try:
+            while ims:  # only process until ims empty
+                try:
+                    done = yield from self.msgParsator(ims=ims,
+                                                       framed=framed,
+                                                       pipeline=pipeline,
+                                                       kvy=kvy,
+                                                       tvy=tvy,
+                                                       exc=exc,
+                                                       rvy=rvy,
+                                                       vry=vry)
+
+                except kering.SizedGroupError as ex:  # error inside sized group
+                    # processOneIter already flushed group so do not flush stream
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Parser msg extraction error: %s\n", ex.args[0])
+                    else:
+                        logger.error("Parser msg extraction error: %s\n", ex.args[0])
 
-            except (kering.ValidationError, Exception) as ex:  # non Extraction Error
-                # Non extraction errors happen after successfully extracted from stream
-                # so we don't flush rest of stream just resume
-                if logger.isEnabledFor(logging.ERROR):
-                    logger.exception("Parser msg non-extraction error: %s\n", ex)
-                else:
-                    logger.error("Parser msg non-extraction error: %s\n", ex)
-            yield
+                except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Parser msg extraction error: %s\n", ex.args[0])
+                    else:
+                        logger.error("Parser msg extraction error: %s\n", ex.args[0])
+                    del ims[:]  # delete rest of stream to force cold restart
+
+                except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                    # Non extraction errors happen after successfully extracted from stream
+                    # so we don't flush rest of stream just resume
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Parser msg non-extraction error: %s\n", ex)
+                    else:
+                        logger.error("Parser msg non-extraction error: %s\n", ex)
+                yield
+        finally:  # delete consumed prefix from provided bytearray
+            self._consume(src, ims)
 
         return True
 
@@ -524,9 +684,9 @@ class Parser:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
+        src = ims
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
+            ims = self._streamify(ims)
         else:
             ims = self.ims  # use instance attribute by default
 
@@ -538,41 +698,44 @@ class Parser:
         rvy = rvy if rvy is not None else self.rvy
         vry = vry if vry is not None else self.vry
 
-        done = False
-        while not done:
-            try:
-                done = yield from self.msgParsator(ims=ims,
-                                                   framed=framed,
-                                                   pipeline=pipeline,
-                                                   kvy=kvy,
-                                                   tvy=tvy,
-                                                   exc=exc,
-                                                   rvy=rvy,
-                                                   vry=vry)
-
-            except kering.SizedGroupError as ex:  # error inside sized group
-                # processOneIter already flushed group so do not flush stream
-                if logger.isEnabledFor(logging.ERROR):
-                    logger.exception("Kevery msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Kevery msg extraction error: %s\n", ex.args[0])
-
-            except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
-                if logger.isEnabledFor(logging.ERROR):
-                    logger.exception("Kevery msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Kevery msg extraction error: %s\n", ex.args[0])
-                del ims[:]  # delete rest of stream to force cold restart
+        try:
+            done = False
+            while not done:
+                try:
+                    done = yield from self.msgParsator(ims=ims,
+                                                       framed=framed,
+                                                       pipeline=pipeline,
+                                                       kvy=kvy,
+                                                       tvy=tvy,
+                                                       exc=exc,
+                                                       rvy=rvy,
+                                                       vry=vry)
+
+                except kering.SizedGroupError as ex:  # error inside sized group
+                    # processOneIter already flushed group so do not flush stream
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Kevery msg extraction error: %s\n", ex.args[0])
+                    else:
+                        logger.error("Kevery msg extraction error: %s\n", ex.args[0])
 
-            except (kering.ValidationError, Exception) as ex:  # non Extraction Error
-                # Non extraction errors happen after successfully extracted from stream
-                # so we don't flush rest of stream just resume
-                if logger.isEnabledFor(logging.ERROR):
-                    logger.exception("Kevery msg non-extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Kevery msg non-extraction error: %s\n", ex.args[0])
-            finally:
-                done = True
+                except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Kevery msg extraction error: %s\n", ex.args[0])
+                    else:
+                        logger.error("Kevery msg extraction error: %s\n", ex.args[0])
+                    del ims[:]  # delete rest of stream to force cold restart
+
+                except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                    # Non extraction errors happen after successfully extracted from stream
+                    # so we don't flush rest of stream just resume
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Kevery msg non-extraction error: %s\n", ex.args[0])
+                    else:
+                        logger.error("Kevery msg non-extraction error: %s\n", ex.args[0])
+                finally:
+                    done = True
+        finally:  # delete consumed prefix from provided bytearray
+            self._consume(src, ims)
 
         return done
 
@@ -607,8 +770,7 @@ class Parser:
             attachments. So even when framed==True must still have counters.
         """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
+            ims = self._streamify(ims, live=True)  # owner may extend while parsing
         else:
             ims = self.ims  # use instance attribute by default
 
@@ -716,7 +878,14 @@ class Parser:
         # Otherwise its a message cold start
         while True:  # extract and deserialize message from ims
             try:
-                sadder = Sadder(raw=ims)
+                if isinstance(ims, ViewStream):
+                    raw = ims.view()  # deserialize in place without copying
+                    try:
+                        sadder = Sadder(raw=raw)
+                    finally:
+                        raw.release()  # so stream may be compacted
+                else:
+                    sadder = Sadder(raw=ims)
             except kering.ShortageError as ex:  # need more bytes
                 yield
             else:  # extracted successfully
@@ -5,6 +5,7 @@ keri.core.serdering module
 """
 import copy
 import json
+import re
 from collections import namedtuple
 
 import cbor2 as cbor
@@ -60,7 +61,7 @@ class Serdery:
 
     """
 
-    def reap(self, ims, *, version=Version):
+    def reap(self, ims, *, version=Version, lazy=False):
         """Extract and return Serder subclass based on protocol type reaped from
         version string inside serialized raw of Serder.
 
@@ -73,6 +74,7 @@ class Serdery:
                 of stream is raw Serder.
             version (Versionage | None): instance supported protocol version
                 None means do not enforce a supported version
+            lazy (bool): True means return lazy Serder. See Serder
         """
         if len(ims) < Serder.InhaleSize:
             raise ShortageError(f"Need more raw bytes for Serdery to reap.")
@@ -85,9 +87,11 @@ class Serdery:
         reaped = Reapage(*match.group("proto", "major", "minor", "kind", "size"))
 
         if reaped.proto == Protos.keri.encode("utf-8"):
-            return SerderKERI(raw=ims, strip=True, version=version, reaped=reaped)
+            return SerderKERI(raw=ims, strip=True, version=version, reaped=reaped,
+                              lazy=lazy)
         elif reaped.proto == Protos.acdc.encode("utf-8"):
-            return SerderACDC(raw=ims, strip=True, version=version, reaped=reaped)
+            return SerderACDC(raw=ims, strip=True, version=version, reaped=reaped,
+                              lazy=lazy)
         else:
             raise ProtocolError(f"Unsupported protocol type = {reaped.proto}.")
 
@@ -106,6 +110,14 @@ class Serder:
     Message saidification and verification may be dependent on protocol and
     optionally ilk specific field label(s) and digest code type for its SAID(s).
 
+    A lazy Serder only reaps the version string and, for JSON, the leading
+    top level ilk, said, prefix and sequence number fields up front. Loading
+    the full field map and verifying its said(s) are deferred until a field
+    that needs them is touched or .verify is called. This makes routing,
+    indexing, escrowing or forwarding a message cheap.
+
+    Derived primitive properties such as .verfers and .tholder are memoized.
+
     The base Serder class provides the common properties for all messages for
     all protocols. Each subclass is protocol based and adds properties that are
     required for all message ilks in a given protocol. Each protocol subclass
@@ -136,11 +148,14 @@ class Serder:
         said (str): qb64 said of .raw given by appropriate field
         saidb (bytes): qb64b of .said
         ilk (str | None): packet type for this Serder if any (may be None)
+        lazy (bool): True means .sad not yet loaded from .raw
 
 
     Hidden Attributes:
         ._raw is bytes of serialized event only
-        ._sad is key event dict
+        ._sad is key event dict loaded from ._raw on first access when lazy
+        ._heads (dict): leading top level fields reaped from ._raw when lazy
+        ._memo (dict): memoized derived properties
         ._proto (str):  Protocolage value as protocol type identifier
         ._version is Versionage instance of event version
         ._kind is serialization kind string value (see namedtuple coring.Serials)
@@ -171,6 +186,11 @@ class Serder:
     MaxVSOffset = 12
     InhaleSize = MaxVSOffset + VERFULLSIZE  # min buffer size to inhale
 
+    # leading top level fields of compact JSON serialization reaped when lazy
+    Heads = re.compile(rb'\A\{"v":"[^"\\]*"(?:,"t":"(?P<t>[^"\\]*)")?'
+                       rb'(?:,"d":"(?P<d>[^"\\]*)")?(?:,"i":"(?P<i>[^"\\]*)")?'
+                       rb'(?:,"s":"(?P<s>[^"\\]*)")?')
+
     Dummy = "#"  # dummy spaceholder char for said. Must not be a valid Base64 char
 
     # should be same set of codes as in coring.DigestCodex coring.DigDex so
@@ -338,7 +358,7 @@ class Serder:
 
 
     def __init__(self, *, raw=b'', sad=None, strip=False, version=Version,
-                 reaped=None, verify=True, makify=False,
+                 reaped=None, verify=True, makify=False, lazy=False,
                  proto=None, vrsn=None, kind=None, ilk=None, saids=None):
         """Deserialize raw if provided. Update properties from deserialized raw.
             Verifies said(s) embedded in sad as given by labels.
@@ -367,6 +387,9 @@ class Serder:
                 Ignore when raw not provided or when raw and saidify is True
             makify (bool): True means compute fields for sad including size and
                 saids.
+            lazy (bool): True means when raw provided defer loading sad from
+                raw until a field needs it. Then said(s) are not verified on
+                init whatever verify is so call .verify before relying on them.
             proto (str | None): desired protocol type str value of Protos
                 If None then its extracted from sad or uses default .Proto
             vrsn (Versionage | None): instance desired protocol version
@@ -387,7 +410,37 @@ class Serder:
 
         """
 
-        if raw:  # deserialize raw using property setter
+        self.__sad = None
+        self._heads = {}
+        self._memo = {}
+
+        if raw and lazy:  # reap only leading fields of raw
+            proto, vrsn, kind, size = self._reap(raw=raw,
+                                                 version=version,
+                                                 reaped=reaped)
+            self._raw = bytes(raw[:size])  # crypto ops require bytes not bytearray
+            self._proto = proto
+            self._vrsn = vrsn
+            self._kind = kind
+            self._size = size
+            if kind == Serials.json and (match := self.Heads.match(self._raw)):
+                self._heads = {label: value.decode("utf-8") for label, value
+                               in match.groupdict().items() if value is not None}
+                self._heads.setdefault("t", None)  # ilk when present is always second
+            # primary said field label
+            try:
+                label = list(self.Fields[self.proto][self.vrsn][self.ilk].saids.keys())[0]
+                self._said = self._get(label)  # not verified
+            except Exception:
+                self._said = None  # no saidive field
+
+            if strip:  #only when raw is bytearray
+                try:
+                    del raw[:self._size]
+                except TypeError:
+                    pass  # ignore if bytes
+
+        elif raw:  # deserialize raw using property setter
             # self._inhale works because it only references class attributes
             sad, proto, vrsn, kind, size = self._inhale(raw=raw,
                                                         version=version,
@@ -767,6 +820,35 @@ class Serder:
             Assumes only supports Version
 
         """
+        proto, vrsn, kind, size = clas._reap(raw=raw, version=version,
+                                             reaped=reaped)
+        sad = clas.loads(raw=raw, size=size, kind=kind)
+
+        if "v" not in sad:
+            raise FieldError(f"Missing version string field in {sad}.")
+
+        return sad, proto, version, kind, size
+
+
+    @classmethod
+    def _reap(clas, raw, version=Version, reaped=None):
+        """Reaps version string elements of raw without deserializing it.
+
+        Returns: tuple (proto, vrsn, kind, size) where:
+            proto (str): value of Protos (Protocolage) protocol type
+            vrsn (Versionage): tuple of (major, minor) version ints
+            kind (str): value of Serials (Serialage) serialization kind
+            size (int): number of bytes of serialization in raw
+
+        Parameters:
+            raw (bytes): serialized sad message
+            version (Versionage): instance supported protocol version
+                None means do not enforce version
+            reaped (Reapage | None): instance of deconstructed version string
+                elements. If none or empty ignore otherwise assume that raw
+                already had its version string extracted (reaped) into the
+                elements of reaped.
+        """
         if reaped:
             proto, major, minor, kind, size = reaped  # tuple unpack
         else:
@@ -801,12 +883,7 @@ class Serder:
         if len(raw) < size:
             raise ShortageError(f"Need more bytes.")
 
-        sad = clas.loads(raw=raw, size=size, kind=kind)
-
-        if "v" not in sad:
-            raise FieldError(f"Missing version string field in {sad}.")
-
-        return sad, proto, version, kind, size
+        return proto, vrsn, kind, size
 
 
     @staticmethod
@@ -971,6 +1048,64 @@ class Serder:
         return json.dumps(self._sad, indent=1)[:size]
 
 
+    @property
+    def _sad(self):
+        """_sad property getter loads field map from ._raw when not yet loaded
+        Returns:
+            sad (dict): serializable attribute dict (saidified data)
+        """
+        if self.__sad is None:
+            sad = self.loads(raw=self._raw, size=self._size, kind=self._kind)
+            if "v" not in sad:
+                raise FieldError(f"Missing version string field in {sad}.")
+            self.__sad = sad
+        return self.__sad
+
+
+    @_sad.setter
+    def _sad(self, sad):
+        """_sad property setter resets memoized properties"""
+        self.__sad = sad
+        self._heads = {}
+        self._memo = {}
+
+
+    def _get(self, label, default=None):
+        """Returns value of top level field label. Uses reaped leading fields
+        when lazy so does not load field map for them.
+
+        Parameters:
+            label (str): top level field label
+            default (any): value when label not in field map
+        """
+        if self.__sad is None and label in self._heads:
+            return self._heads[label]
+        return self._sad.get(label, default)
+
+
+    def _memoize(self, name, make):
+        """Returns memoized value of derived property name computed by make()
+
+        Parameters:
+            name (str): of derived property
+            make (Callable): makes value of property when not yet memoized
+        """
+        try:
+            return self._memo[name]
+        except KeyError:
+            value = self._memo[name] = make()
+            return value
+
+
+    @property
+    def lazy(self):
+        """lazy property getter
+        Returns:
+            lazy (bool): True means .sad not yet loaded from .raw
+        """
+        return self.__sad is None
+
+
     @property
     def raw(self):
         """raw property getter
@@ -1051,7 +1186,7 @@ class Serder:
         Returns:
             ilk (str): pracket type given by sad['t'] if any
         """
-        return self._sad.get('t')  # returns None if 't' not in sad
+        return self._get('t')  # returns None if 't' not in sad
 
 
 
@@ -1103,8 +1238,7 @@ class SerderKERI(Serder):
     @property
     def estive(self):  # establishative
         """ Returns True if Serder represents an establishment event """
-        return (self._sad["t"] in (Ilks.icp, Ilks.rot, Ilks.dip, Ilks.drt)
-                     if "t" in self._sad else False)
+        return self.ilk in (Ilks.icp, Ilks.rot, Ilks.dip, Ilks.drt)
 
 
     @property
@@ -1122,7 +1256,7 @@ class SerderKERI(Serder):
         Returns:
            pre (str): qb64  of .sad["i"] identifier prefix property getter
         """
-        return self._sad.get("i")
+        return self._get("i")
 
 
     @property
@@ -1142,7 +1276,8 @@ class SerderKERI(Serder):
             (Number): of ._sad["s"] hex number str converted
         """
         # auto converts hex num str to int
-        return Number(num=self._sad["s"]) if 's' in self._sad else None
+        return self._memoize("sner", lambda: Number(num=sn)
+                             if (sn := self._get("s")) is not None else None)
 
 
     @property
@@ -1182,7 +1317,8 @@ class SerderKERI(Serder):
         Returns Tholder instance as converted from ._sad['kt'] or None if missing.
 
         """
-        return Tholder(sith=self._sad["kt"]) if "kt" in self._sad else None
+        return self._memoize("tholder", lambda: Tholder(sith=self._sad["kt"])
+                             if "kt" in self._sad else None)
 
 
     @property
@@ -1192,8 +1328,9 @@ class SerderKERI(Serder):
         One for each key.
         verfers property getter
         """
-        keys = self._sad.get("k")
-        return [Verfer(qb64=key) for key in keys] if keys is not None else None
+        verfers = self._memoize("verfers", lambda: [Verfer(qb64=key) for key in keys]
+                                if (keys := self._sad.get("k")) is not None else None)
+        return list(verfers) if verfers is not None else None  # copy
 
 
     @property
@@ -1202,7 +1339,8 @@ class SerderKERI(Serder):
         Returns Tholder instance as converted from ._sad['nt'] or None if missing.
 
         """
-        return Tholder(sith=self._sad["nt"]) if "nt" in self._sad else None
+        return self._memoize("ntholder", lambda: Tholder(sith=self._sad["nt"])
+                             if "nt" in self._sad else None)
 
 
     @property
@@ -1215,8 +1353,9 @@ class SerderKERI(Serder):
         if self.vrsn.major < 2 and self.vrsn.minor < 1 and self.ilk == Ilks.vcp:
             return None
 
-        digs = self._sad.get("n")
-        return [Diger(qb64=dig) for dig in digs] if digs is not None else None
+        ndigers = self._memoize("ndigers", lambda: [Diger(qb64=dig) for dig in digs]
+                                if (digs := self._sad.get("n")) is not None else None)
+        return list(ndigers) if ndigers is not None else None  # copy
 
 
     @property
@@ -1227,7 +1366,8 @@ class SerderKERI(Serder):
             (Number): of ._sad["bt"] hex number str converted. Auto converts
             hex num str to int
         """
-        return Number(num=self._sad["bt"]) if 'bt' in self._sad else None
+        return self._memoize("bner", lambda: Number(num=self._sad["bt"])
+                             if 'bt' in self._sad else None)
 
 
     @property
@@ -1247,8 +1387,9 @@ class SerderKERI(Serder):
         One for each backer (witness).
         berfers property getter
         """
-        baks = self._sad.get("b")
-        return [Verfer(qb64=bak) for bak in baks] if baks is not None else None
+        berfers = self._memoize("berfers", lambda: [Verfer(qb64=bak) for bak in baks]
+                                if (baks := self._sad.get("b")) is not None else None)
+        return list(berfers) if berfers is not None else None  # copy
 
 
     #Properties for delegated Serders ilks in (dip, drt)
@@ -1280,7 +1421,8 @@ class SerderKERI(Serder):
             (Number): of ._sad["f"] hex number str converted  (state message)
         """
         # auto converts hex num str to int
-        return Number(num=self._sad["f"]) if "f" in self._sad else None
+        return self._memoize("fner", lambda: Number(num=self._sad["f"])
+                             if "f" in self._sad else None)
 
 
     @property
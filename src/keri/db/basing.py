@@ -19,8 +19,12 @@ So only need to set dupsort first time opened each other opening does not
 need to call it
 """
 
+import datetime
+import heapq
 import os
 import shutil
+import time
+import weakref
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 import json
@@ -50,17 +54,40 @@ class dbdict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     if not in memory as dict item
+
+    When .size is not None the cache is bounded and evicts least recently used
+    kevers once it holds more than .size of them. Eviction is safe because
+    every accepted key state is persisted to db.states from where an evicted
+    kever is reloaded on next access. Kevers of own local prefixes in
+    db.prefixes are pinned and never evicted since they are not reloaded as
+    local so the cache may hold more than .size pinned kevers. Order of items
+    is least to most recently used when bounded otherwise insertion order.
+
+    Attributes:
+        db (Baser | None): database of key states to read through
+        size (int | None): maximum number of kevers held unless pinned.
+            None means unbounded
+        hits (int): number of lookups found in memory
+        misses (int): number of lookups not found in memory
+        loads (int): number of misses reloaded from db
+        evictions (int): number of kevers evicted
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'size', 'hits', 'misses', 'loads', 'evictions')  # no .__dict__
 
     def __init__(self, *pa, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.size = None
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            kever = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (ksr := self.db.states.get(keys=k)) is None:
@@ -69,9 +96,23 @@ class dbdict(dict):
                 kever = eventing.Kever(state=ksr, db=self.db)
             except kering.MissingEntryError:  # no kel event for keystate
                 raise ex  # reraise KeyError
+            self.loads += 1
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.size is not None:  # move to most recently used
+            super(dbdict, self).__delitem__(k)
+            super(dbdict, self).__setitem__(k, kever)
+        return kever
+
+    def __setitem__(self, k, v):
+        if self.size is not None and super(dbdict, self).__contains__(k):
+            super(dbdict, self).__delitem__(k)  # so becomes most recently used
+        super(dbdict, self).__setitem__(k, v)
+        if self.size is not None and len(self) > self.size:
+            self.evict()
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -88,8 +129,317 @@ class dbdict(dict):
         else:
             return self.__getitem__(k)
 
+    def evict(self):
+        """
+        Evicts least recently used unpinned kevers until no more than .size
+        kevers are held or only pinned kevers are left. Nothing is evicted without a .db to reload
+        from. Returns number of kevers evicted.
+        """
+        if not self.db or self.size is None:
+            return 0
+
+        pinned = self.db.prefixes
+        excess = len(self) - self.size
+        evicts = []
+        for k in self:  # least recently used first
+            if len(evicts) >= excess:
+                break
+            if k not in pinned:
+                evicts.append(k)
 
-@dataclass
+        for k in evicts:
+            super(dbdict, self).__delitem__(k)
+        self.evictions += len(evicts)
+        return len(evicts)
+
+    def stats(self):
+        """
+        Returns dict of cache metrics
+        """
+        return dict(entries=len(self),
+                    size=self.size,
+                    hits=self.hits,
+                    misses=self.misses,
+                    loads=self.loads,
+                    evictions=self.evictions)
+
+
+class EscrowScheduler:
+    """
+    EscrowScheduler tracks which escrowed events may have been unblocked so
+    that Kevery.processEscrows reattempts only the escrows of those prefixes
+    instead of walking every escrow table on every pass.
+
+    A prefix is made ready when one of its events is accepted, when new
+    material such as signatures or receipts is escrowed for it, when an event
+    it waits on, such as its delegator's or its validator's, is accepted, or
+    when its earliest escrow expiry comes due so stale escrows get removed.
+    Expiries are kept in a date ordered heap. Escrow state is not persisted
+    here so the first pass after (re)start walks all escrows which rebuilds
+    the schedule from the escrow tables.
+
+    Each reader, such as each Kevery of a Baser, has its own ready set so that
+    every reader reattempts every ready escrow as when all escrows are walked.
+    The first pull of a new reader walks all escrows.
+
+    Attributes:
+        full (bool): True means next pass of default reader must walk all escrows
+        busy (bool): True while escrows are being processed. Escrows made then
+            are reattempts of existing escrows not new material so do not make
+            their prefix ready.
+        ready (set): of bytes prefixes whose escrows are to be reattempted by
+            default reader
+        readers (WeakKeyDictionary): ready sets keyed by reader
+        waits (dict): of sets of bytes prefixes waiting on keyed bytes prefix
+        expiries (dict): earliest escrow expiry datetime keyed by bytes prefix
+        deadlines (list): heap of (expiry, prefix) tuples in date order
+
+    """
+
+    def __init__(self):
+        """ Initialize instance """
+        self.full = True
+        self.busy = False
+        self.ready = set()
+        self.readers = weakref.WeakKeyDictionary()
+        self.waits = dict()
+        self.expiries = dict()
+        self.deadlines = []
+
+    @staticmethod
+    def _preb(pre):
+        """ Returns pre as bytes """
+        return pre.encode("utf-8") if hasattr(pre, "encode") else bytes(pre)
+
+    def _readies(self):
+        """ Returns list of ready sets of all readers """
+        return [self.ready, *self.readers.values()]
+
+    def signal(self, pre):
+        """
+        Make prefix pre ready and also all prefixes waiting on pre such as
+        when an event of pre has been accepted
+
+        Parameters:
+            pre (str | bytes): identifier prefix
+        """
+        pre = self._preb(pre)
+        waiters = self.waits.pop(pre, ())
+        for ready in self._readies():
+            ready.add(pre)
+            ready.update(waiters)
+
+    def escrowed(self, pre, deps=()):
+        """
+        Note escrow of new event or receipt material for prefix pre
+
+        Parameters:
+            pre (str | bytes): identifier prefix of escrowed event
+            deps (Iterable): of identifier prefixes whose next accepted event
+                may unblock escrow of pre such as delegator or validator
+        """
+        pre = self._preb(pre)
+        for dep in deps:
+            self.waits.setdefault(self._preb(dep), set()).add(pre)
+        if not self.busy:
+            for ready in self._readies():
+                ready.add(pre)
+
+    def expire(self, pre, timeout, dts=None):
+        """
+        Schedule reattempt of escrows of prefix pre when they time out.
+        Only earliest expiry per prefix is kept. The reattempt reschedules
+        any escrows that remain.
+
+        Parameters:
+            pre (str | bytes): identifier prefix of escrowed event
+            timeout (float): seconds from dts to expiry of escrow
+            dts (str | bytes | None): iso8601 datetime of escrow. None means now
+        """
+        pre = self._preb(pre)
+        if dts:
+            dts = dts.decode("utf-8") if hasattr(dts, "decode") else dts
+            dte = helping.fromIso8601(dts)
+        else:
+            dte = helping.nowUTC()
+        expiry = dte + datetime.timedelta(seconds=timeout)
+        if (earliest := self.expiries.get(pre)) is None or expiry < earliest:
+            self.expiries[pre] = expiry
+            heapq.heappush(self.deadlines, (expiry, pre))
+
+    def pull(self, now=None, reader=None):
+        """
+        Returns sorted list of bytes prefixes for reader to reattempt which are
+        its ready ones plus those whose earliest expiry has come due. Clears
+        them. Returns None when all escrows must be walked.
+
+        Parameters:
+            now (datetime | None): current datetime. None means now
+            reader (object | None): weak referenceable reader such as Kevery.
+                None means default reader
+        """
+        if reader is None:
+            if self.full:
+                self.full = False
+                self.ready.clear()
+                return None
+            ready = self.ready
+        elif (ready := self.readers.get(reader)) is None:  # new reader
+            self.readers[reader] = set()
+            return None
+
+        now = now if now is not None else helping.nowUTC()
+        while self.deadlines and self.deadlines[0][0] <= now:
+            expiry, pre = heapq.heappop(self.deadlines)
+            if self.expiries.get(pre) == expiry:  # otherwise superseded
+                del self.expiries[pre]
+                for other in self._readies():
+                    other.add(pre)
+
+        pres = sorted(ready)
+        ready.clear()
+        return pres
+
+    def clear(self):
+        """ Forget schedule so next pass walks all escrows """
+        self.__init__()
+
+
+EscrowAgeBuckets = (60, 300, 900, 3600, 21600, 86400)  # upper bounds in seconds
+
+
+def ageHistogram(dtes, now=None, buckets=EscrowAgeBuckets):
+    """
+    Returns tuple (counts, total) histogram of ages of escrowed entries where
+    counts is list of cumulative counts of ages not greater than each bound
+    in buckets followed by count of all ages and total is sum of ages seconds.
+
+    Parameters:
+        dtes (Iterable): of datetimes of escrowed entries
+        now (datetime | None): current datetime. None means now
+        buckets (Iterable): of increasing upper bounds in seconds
+    """
+    now = now if now is not None else helping.nowUTC()
+    counts = [0] * (len(buckets) + 1)
+    total = 0.0
+    for dte in dtes:
+        age = (now - dte).total_seconds()
+        total += age
+        for i, bound in enumerate(buckets):
+            if age <= bound:
+                counts[i] += 1
+        counts[-1] += 1
+    return counts, total
+
+
+class WigNotifier:
+    """
+    WigNotifier calls back watchers of an event whenever indexed witness
+    signatures (wigs) are stored for that event so that waiting for witness
+    receipts is driven by their arrival instead of reading .wigs every tock.
+    A callback may be made for wigs written in a transaction that is later
+    aborted so watchers must confirm with the database.
+
+    Attributes:
+        watches (dict): lists of callbacks keyed by dgKey bytes of event.
+            Each callback is called with the key bytes.
+    """
+
+    def __init__(self):
+        """ Initialize instance """
+        self.watches = dict()
+
+    @staticmethod
+    def _keyb(key):
+        """ Returns bytes of key """
+        return key.encode("utf-8") if isinstance(key, str) else bytes(key)
+
+    def watch(self, key, callback):
+        """
+        Calls callback(key) whenever wigs are stored at dgKey key
+
+        Parameters:
+            key (str | bytes): dgKey of event
+            callback (Callable): called with key bytes
+        """
+        self.watches.setdefault(self._keyb(key), []).append(callback)
+
+    def unwatch(self, key, callback):
+        """
+        Stops calling callback for wigs stored at dgKey key
+
+        Parameters:
+            key (str | bytes): dgKey of event
+            callback (Callable): as provided to .watch
+        """
+        keyb = self._keyb(key)
+        if (callbacks := self.watches.get(keyb)) is not None:
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                del self.watches[keyb]
+
+    def notify(self, key):
+        """
+        Calls callbacks watching dgKey key
+
+        Parameters:
+            key (str | bytes): dgKey of event at which wigs were stored
+        """
+        if not self.watches:
+            return
+        keyb = self._keyb(key)
+        for callback in list(self.watches.get(keyb, ())):
+            callback(keyb)
+
+
+class EscrowMeter:
+    """
+    EscrowMeter accumulates durations of escrow processing passes by name of
+    escrow processor.
+
+    Attributes:
+        passes (dict): of lists [count, total, last, max] keyed by processor
+            name where count is number of passes and total, last and max are
+            durations in seconds
+
+    """
+
+    def __init__(self):
+        """ Initialize instance """
+        self.passes = dict()
+
+    def record(self, name, elapsed):
+        """
+        Record one pass of processor name that took elapsed seconds
+
+        Parameters:
+            name (str): name of escrow processor
+            elapsed (float): duration of pass in seconds
+        """
+        if (meter := self.passes.get(name)) is None:
+            meter = self.passes[name] = [0, 0.0, 0.0, 0.0]
+        meter[0] += 1
+        meter[1] += elapsed
+        meter[2] = elapsed
+        meter[3] = max(meter[3], elapsed)
+
+    @contextmanager
+    def timed(self, name):
+        """
+        Context manager that records duration of its block as pass of name
+
+        Parameters:
+            name (str): name of escrow processor
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+
+@dataclass(slots=True)
 class RawRecord:
     """RawRecord is base class for dataclasses that provides private utility
     methods for representing the dataclass as some other format like dict,
@@ -130,7 +480,7 @@ class RawRecord:
         return msgpack.dumps(self._asdict())
 
 
-@dataclass
+@dataclass(slots=True)
 class StateEERecord(RawRecord):
     """
     Corresponds to StateEstEvent namedtuple used as sub record in KeyStateRecord
@@ -148,7 +498,7 @@ class StateEERecord(RawRecord):
     ba: list = field(default_factory=list)  # backer AID qb64 add list
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyStateRecord(RawRecord):  # baser.state
     """
     Key State information keyed by Identifier Prefix of associated KEL.
@@ -502,6 +852,10 @@ class Baser(dbing.LMDBer):
 
         kevers (dict): Kever instances indexed by identifier prefix qb64
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+        scheduler (EscrowScheduler): of escrows shared by all Keverys of this db
+        escrowMeter (EscrowMeter): durations of escrow processing passes
+        wigNotifier (WigNotifier): calls back watchers when witness signatures
+            of an event are stored
 
         .evts is named sub DB whose values are serialized events
             dgKey
@@ -662,9 +1016,11 @@ class Baser(dbing.LMDBer):
             the associated event. So one can lookup event digest, get its fn here
             and then use fn to fetch event by fn from .fels.
 
-        .states (stts) is named subDB instance of SerderSuber that maps a prefix
+        .states (stts) is named subDB instance of Komer that maps a prefix
             to the latest keystate for that prefix. Used by ._kevers.db for read
             through cache of key state to reload kevers in memory
+            value is CBOR serialized KeyStateRecord dataclass. Values written
+            as JSON by prior versions are still read
 
         .habs is named subDB instance of Komer that maps habitat names to habitat
             application state. Includes habitat identifier prefix
@@ -740,12 +1096,17 @@ class Baser(dbing.LMDBer):
             key is group identifier prefix
             value is serialized GroupIdentifier dataclass
 
+    Class Attributes:
+        KeverCacheSize (int): default maximum number of kevers held in memory
+            by .kevers besides own local ones
+
     Properties:
         kevers (dbdict): read through cache of kevers of states for KELs in db
 
     """
+    KeverCacheSize = 65536
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    def __init__(self, headDirPath=None, reopen=False, keverCacheSize=None, **kwa):
         """
         Setup named sub databases.
 
@@ -760,12 +1121,18 @@ class Baser(dbing.LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            keverCacheSize (int | None): maximum number of kevers held in
+                memory besides own local ones. None means use .KeverCacheSize
 
 
         """
         self.prefixes = oset()
         self._kevers = dbdict()
         self._kevers.db = self  # assign db for read through cache of kevers
+        self._kevers.size = keverCacheSize if keverCacheSize is not None else self.KeverCacheSize
+        self.scheduler = EscrowScheduler()
+        self.escrowMeter = EscrowMeter()
+        self.wigNotifier = WigNotifier()
 
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -823,7 +1190,8 @@ class Baser(dbing.LMDBer):
         # Kever state made of KeyStateRecord
         self.states = koming.Komer(db=self,
                                    schema=KeyStateRecord,
-                                   subkey='stts.')
+                                   subkey='stts.',
+                                   kind=coring.Serials.cbor)
         #self.states = subing.SerderSuber(db=self, subkey='stts.')  # key states
 
         self.wits = subing.CesrIoSetSuber(db=self, subkey="wits.", klas=coring.Prefixer)
@@ -1006,6 +1374,13 @@ class Baser(dbing.LMDBer):
         # Field values for contact information for remote identifiers.  Keyed by prefix/field
         self.cfld = subing.Suber(db=self,
                                  subkey="cfld.")
+        # Contact field value index. Keyed by field/value/prefix, value is prefix
+        self.cfvx = subing.Suber(db=self,
+                                 subkey="cfvx.")
+        # Contact field value substring index of casefolded value suffixes.
+        # Keyed by field/suffix/prefix, value is prefix
+        self.cfsx = subing.Suber(db=self,
+                                 subkey="cfsx.")
 
         # Global settings for the Habery environment
         self.hbys = subing.Suber(db=self, subkey='hbys.')
@@ -1038,6 +1413,65 @@ class Baser(dbing.LMDBer):
 
         return self.env
 
+    def escrowStats(self, ages=True, now=None):
+        """
+        Returns dict of statistics of event escrows keyed by escrow name.
+        Each is dict with count of entries read from lmdb stats without
+        iterating and when ages then also buckets and total of ageHistogram
+        of escrow datetimes which does iterate.
+
+        Parameters:
+            ages (bool): True means include age histogram
+            now (datetime | None): current datetime. None means now
+        """
+        stats = dict()
+        for name, db, receipt in (("ooes", self.ooes, False),
+                                  ("pses", self.pses, False),
+                                  ("pwes", self.pwes, False),
+                                  ("ldes", self.ldes, False),
+                                  ("uwes", self.uwes, True),
+                                  ("ures", self.ures, True),
+                                  ("vres", self.vres, True),
+                                  ("qnfs", self.qnfs, False)):
+            stat = stats[name] = dict(count=self.cntEntries(db))
+            if ages:
+                stat["buckets"], stat["total"] = ageHistogram(
+                    self._escrowDtesIter(db, receipt=receipt, keyed=(name == "qnfs")),
+                    now=now)
+
+        stat = stats["rpes"] = dict(count=self.cntEntries(self.rpes.sdb))
+        if ages:
+            daters = (self.sdts.get(keys=(saider.qb64,))
+                      for _, saider in self.rpes.getIoItemIter())
+            stat["buckets"], stat["total"] = ageHistogram(
+                (dater.datetime for dater in daters if dater is not None), now=now)
+
+        return stats
+
+    def _escrowDtesIter(self, db, receipt=False, keyed=False):
+        """
+        Returns iterator of escrow datetimes from .dts of entries of escrow db
+        whose values are proem prefixed event digests. Entries without
+        datetime are skipped.
+
+        Parameters:
+            db (lmdb._Database): escrow sub db with dupsort=True
+            receipt (bool): True means value is receipt whose first field is
+                receipted event digest
+            keyed (bool): True means key is itself the dgKey of datetime
+        """
+        with self._trans(db=db, write=False) as txn:
+            for key, val in txn.cursor():
+                if keyed:
+                    dgkey = bytes(key)
+                else:
+                    dig = bytes(val[33:])  # slice off prepended ordering proem
+                    if receipt:
+                        dig = coring.Saider(qb64b=dig).qb64b
+                    dgkey = dbing.dgKey(dbing.splitKey(bytes(key))[0], dig)
+                if (dtsb := self.getDts(dgkey)) is not None:
+                    yield helping.fromIso8601(bytes(dtsb).decode("utf-8"))
+
     def reload(self):
         """
         Reload stored prefixes and Kevers from .habs
@@ -1111,7 +1545,7 @@ class Baser(dbing.LMDBer):
                 # need new method cloneObjAllPreIter()
                 # process event doesn't capture exceptions so we can more easily
                 # detect in the cloning that some events did not make it through
-                psr = parsing.Parser(kvy=kvy)
+                psr = parsing.Parser(kvy=kvy, viewed=True)
                 for msg in self.cloneAllPreIter():  # clone into copy
                     psr.parseOne(ims=msg)
 
@@ -1171,11 +1605,18 @@ class Baser(dbing.LMDBer):
         """
         Returns iterator of first seen event messages with attachments for the
         identifier prefix pre starting at first seen order number, fn.
-        Essentially a replay in first seen order with attachments
+        Essentially a replay in first seen order with attachments.
+        The whole replay reads from one read transaction snapshot.
         """
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
+        return self.snapshotIter(self._clonePreGen(pre=pre, fn=fn))
+
+    def _clonePreGen(self, pre, fn=0):
+        """
+        Generator for .clonePreIter
+        """
         for fn, dig in self.getFelItemPreIter(pre, fn=fn):
             try:
                 msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
@@ -1189,11 +1630,17 @@ class Baser(dbing.LMDBer):
         identifier prefixes starting at key. If key == b'' then rstart at first
         key in databse. Use key to resume replay.
         Essentially a replay in first seen order with attachments of entire
-        set of FELs.
+        set of FELs. The whole replay reads from one read transaction snapshot.
 
         Parameters:
             key (bytes): fnKey(pre, fn)
         """
+        return self.snapshotIter(self._cloneAllPreGen(key=key))
+
+    def _cloneAllPreGen(self, key=b''):
+        """
+        Generator for .cloneAllPreIter
+        """
         for pre, fn, dig in self.getFelItemAllPreIter(key=key):
             try:
                 msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
@@ -1203,7 +1650,8 @@ class Baser(dbing.LMDBer):
 
     def cloneEvtMsg(self, pre, fn, dig):
         """
-        Clones Event as Serialized CESR Message with Body and attached Foot
+        Clones Event as Serialized CESR Message with Body and attached Foot.
+        Reads event and attachments from one read transaction snapshot.
 
         Parameters:
             pre (bytes): identifier prefix of event
@@ -1213,66 +1661,7 @@ class Baser(dbing.LMDBer):
         Returns:
             bytearray: message body with attachments
         """
-        msg = bytearray()  # message
-        atc = bytearray()  # attachments
-        dgkey = dbing.dgKey(pre, dig)  # get message
-        if not (raw := self.getEvt(key=dgkey)):
-            raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-        msg.extend(raw)
-
-        # add indexed signatures to attachments
-        if not (sigs := self.getSigs(key=dgkey)):
-            raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-        atc.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
-                                  count=len(sigs)).qb64b)
-        for sig in sigs:
-            atc.extend(sig)
-
-        # add indexed witness signatures to attachments
-        if wigs := self.getWigs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
-                                      count=len(wigs)).qb64b)
-            for wig in wigs:
-                atc.extend(wig)
-
-        # add authorizer (delegator/issure) source seal event couple to attachments
-        couple = self.getAes(dgkey)
-        if couple is not None:
-            atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
-                                      count=1).qb64b)
-            atc.extend(couple)
-
-        # add trans receipts quadruples to attachments
-        if quads := self.getVrcs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.TransReceiptQuadruples,
-                                      count=len(quads)).qb64b)
-            for quad in quads:
-                atc.extend(quad)
-
-        # add nontrans receipts couples to attachments
-        if coups := self.getRcts(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples,
-                                      count=len(coups)).qb64b)
-            for coup in coups:
-                atc.extend(coup)
-
-        # add first seen replay couple to attachments
-        if not (dts := self.getDts(key=dgkey)):
-            raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-        atc.extend(coring.Counter(code=coring.CtrDex.FirstSeenReplayCouples,
-                                  count=1).qb64b)
-        atc.extend(coring.Seqner(sn=fn).qb64b)
-        atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
-
-        # prepend pipelining counter to attachments
-        if len(atc) % 4:
-            raise ValueError("Invalid attachments size={}, nonintegral"
-                             " quadlets.".format(len(atc)))
-        pcnt = coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
-                              count=(len(atc) // 4)).qb64b
-        msg.extend(pcnt)
-        msg.extend(atc)
-        return msg
+        return Replayer(db=self, size=0).clone(pre=pre, fn=fn, dig=dig)
 
     def cloneDelegation(self, kever):
         """
@@ -1701,8 +2090,11 @@ class Baser(dbing.LMDBer):
         Returns True If no error
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
+        Notifies .wigNotifier watchers of key
         """
-        return self.putVals(self.wigs, key, vals)
+        result = self.putVals(self.wigs, key, vals)
+        self.wigNotifier.notify(key)
+        return result
 
     def addWig(self, key, val):
         """
@@ -1711,8 +2103,11 @@ class Baser(dbing.LMDBer):
         Adds to existing values at key if any
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
+        Notifies .wigNotifier watchers of key when written
         """
-        return self.addVal(self.wigs, key, val)
+        if result := self.addVal(self.wigs, key, val):
+            self.wigNotifier.notify(key)
+        return result
 
     def cntWigs(self, key):
         """
@@ -2868,6 +3263,227 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.ldes, key, val)
 
 
+class Replayer:
+    """
+    Replayer assembles first seen replay messages of events with attachments
+    from a Baser. All the tables for an event are read in one read transaction
+    snapshot and written in a single pass into a preallocated buffer that is
+    reused from message to message. Counters use the precomputed Counter.Interns.
+    Use .clone for a standalone bytearray per message or .cloneIter,
+    .cloneAllIter or .chunkIter for memoryviews into the reused buffer.
+
+    Attributes:
+        db (Baser): database of events and attachments
+        buf (bytearray): reusable preallocated buffer
+        size (int): size of latest message or chunk in .buf
+
+    """
+    def __init__(self, db, size=4096):
+        """
+        Initialize instance
+
+        Parameters:
+            db (Baser): database of events and attachments
+            size (int): initial size of .buf in bytes
+        """
+        self.db = db
+        self.buf = bytearray(size)
+        self.size = 0
+
+    @staticmethod
+    def counter(code, count):
+        """
+        Returns qb64b of Counter with code and count
+        """
+        return coring.Counter.trusted(code=code, count=count).qb64b
+
+    def _gather(self, pre, fn, dig):
+        """
+        Returns list of parts of message for event at dig in order. Must be
+        called inside a snapshot as parts may be buffers into it.
+        """
+        db = self.db
+        dgkey = dbing.dgKey(pre, dig)  # get message
+        if not (raw := db.getEvt(key=dgkey)):
+            raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
+        parts = [raw, None]  # None is placeholder of pipelining counter
+
+        # add indexed signatures to attachments
+        if not (sigs := db.getSigs(key=dgkey)):
+            raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
+        parts.append(self.counter(coring.CtrDex.ControllerIdxSigs, len(sigs)))
+        parts.extend(sigs)
+
+        # add indexed witness signatures to attachments
+        if wigs := db.getWigs(key=dgkey):
+            parts.append(self.counter(coring.CtrDex.WitnessIdxSigs, len(wigs)))
+            parts.extend(wigs)
+
+        # add authorizer (delegator/issure) source seal event couple to attachments
+        if (couple := db.getAes(dgkey)) is not None:
+            parts.append(self.counter(coring.CtrDex.SealSourceCouples, 1))
+            parts.append(couple)
+
+        # add trans receipts quadruples to attachments
+        if quads := db.getVrcs(key=dgkey):
+            parts.append(self.counter(coring.CtrDex.TransReceiptQuadruples, len(quads)))
+            parts.extend(quads)
+
+        # add nontrans receipts couples to attachments
+        if coups := db.getRcts(key=dgkey):
+            parts.append(self.counter(coring.CtrDex.NonTransReceiptCouples, len(coups)))
+            parts.extend(coups)
+
+        # add first seen replay couple to attachments
+        if not (dts := db.getDts(key=dgkey)):
+            raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
+        parts.append(self.counter(coring.CtrDex.FirstSeenReplayCouples, 1))
+        parts.append(coring.Seqner.trusted(sn=fn).qb64b)
+        parts.append(coring.Dater(dts=bytes(dts)).qb64b)
+
+        # pipelining counter of attachments
+        size = sum(len(part) for part in parts[2:])
+        if size % 4:
+            raise ValueError("Invalid attachments size={}, nonintegral"
+                             " quadlets.".format(size))
+        parts[1] = self.counter(coring.CtrDex.AttachedMaterialQuadlets, size // 4)
+        return parts
+
+    @staticmethod
+    def _fill(buf, parts, offset=0):
+        """
+        Writes parts into buf starting at offset. Returns offset after end.
+        """
+        for part in parts:
+            end = offset + len(part)
+            buf[offset:end] = part
+            offset = end
+        return offset
+
+    def _reserve(self, size):
+        """
+        Ensures .buf holds at least size bytes. A larger buffer is allocated
+        rather than resizing in place since memoryviews of .buf may be held.
+        Keeps contents of .buf up to .size.
+        """
+        if len(self.buf) < size:
+            buf = bytearray(max(size, 2 * len(self.buf)))
+            buf[:self.size] = memoryview(self.buf)[:self.size]
+            self.buf = buf
+
+    def clone(self, pre, fn, dig):
+        """
+        Returns bytearray message of event at dig with attachments
+        allocated once at its exact size
+
+        Parameters:
+            pre (bytes): identifier prefix of event
+            fn (int): first seen number (ordinal) of event
+            dig (bytes): digest of event
+        """
+        with self.db.snapshot():
+            parts = self._gather(pre=pre, fn=fn, dig=dig)
+            msg = bytearray(sum(len(part) for part in parts))
+            self._fill(msg, parts)
+        return msg
+
+    def assemble(self, pre, fn, dig):
+        """
+        Returns memoryview of message of event at dig with attachments
+        assembled in .buf. Only valid until next use of this Replayer.
+
+        Parameters:
+            pre (bytes): identifier prefix of event
+            fn (int): first seen number (ordinal) of event
+            dig (bytes): digest of event
+        """
+        with self.db.snapshot():
+            parts = self._gather(pre=pre, fn=fn, dig=dig)
+            self.size = 0
+            self._reserve(sum(len(part) for part in parts))
+            self.size = self._fill(self.buf, parts)
+        return memoryview(self.buf)[:self.size]
+
+    def cloneIter(self, pre, fn=0):
+        """
+        Returns iterator of memoryview of each first seen event message with
+        attachments for the identifier prefix pre starting at first seen order
+        number, fn. Each memoryview is only valid until the next is yielded.
+        The whole replay reads from one read transaction snapshot.
+
+        Parameters:
+            pre (str | bytes): identifier prefix
+            fn (int): first seen number to start at
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+        return self.db.snapshotIter(self._msgGen(self.db.getFelItemPreIter(pre, fn=fn),
+                                                 pre=pre))
+
+    def cloneAllIter(self, key=b''):
+        """
+        Returns iterator of memoryview of each first seen event message with
+        attachments for all identifier prefixes starting at key. Each
+        memoryview is only valid until the next is yielded.
+        The whole replay reads from one read transaction snapshot.
+
+        Parameters:
+            key (bytes): fnKey(pre, fn)
+        """
+        return self.db.snapshotIter(self._msgGen(self.db.getFelItemAllPreIter(key=key)))
+
+    def chunkIter(self, pre, fn=0, size=65536):
+        """
+        Returns iterator of memoryview chunks of the first seen replay of pre
+        from fn. Each chunk holds whole messages packed up to size bytes. A
+        message larger than size is its own chunk. Each memoryview is only
+        valid until the next is yielded.
+
+        Parameters:
+            pre (str | bytes): identifier prefix
+            fn (int): first seen number to start at
+            size (int): target chunk size in bytes
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+        return self.db.snapshotIter(self._chunkGen(pre=pre, fn=fn, size=size))
+
+    def _msgGen(self, items, pre=None):
+        """
+        Generator of memoryview of message for each (fn, dig) or
+        (pre, fn, dig) in items. Skips events that fail to assemble.
+        """
+        for item in items:
+            ipre, fn, dig = item if pre is None else (pre, *item)
+            try:
+                msg = self.assemble(pre=ipre, fn=fn, dig=dig)
+            except Exception:
+                continue  # skip this event
+            yield msg
+
+    def _chunkGen(self, pre, fn, size):
+        """
+        Generator for .chunkIter
+        """
+        self._reserve(size)
+        self.size = 0
+        for fn, dig in self.db.getFelItemPreIter(pre, fn=fn):
+            try:
+                parts = self._gather(pre=pre, fn=fn, dig=dig)
+            except Exception:
+                continue  # skip this event
+            length = sum(len(part) for part in parts)
+            if self.size and self.size + length > size:  # chunk full
+                yield memoryview(self.buf)[:self.size]
+                self.size = 0
+            self._reserve(self.size + length)
+            self.size = self._fill(self.buf, parts, offset=self.size)
+
+        if self.size:
+            yield memoryview(self.buf)[:self.size]
+            self.size = 0
+
+
 class BaserDoer(doing.Doer):
     """
     Basic Baser Doer ( LMDB Database )
@@ -48,6 +48,7 @@ l
 import os
 import shutil
 import stat
+import threading
 from collections import abc
 from contextlib import contextmanager
 from typing import Union
@@ -256,6 +257,44 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+class Joiner:
+    """
+    Joiner binds a named sub db to an ambient transaction opened by
+    LMDBer.transact so that LMDBer methods join it instead of beginning their
+    own. Used as a context manager like lmdb.Transaction but exiting it
+    neither commits nor aborts. The outermost LMDBer.transact does that.
+
+    Attributes:
+        txn (lmdb.Transaction): ambient transaction
+        db (lmdb._Database): named sub db used by every operation
+    """
+
+    def __init__(self, txn, db):
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False  # reraise any exception so ambient transaction aborts
+
+    def put(self, key, value, **kwa):
+        return self.txn.put(key, value, db=self.db, **kwa)
+
+    def get(self, key, default=None):
+        return self.txn.get(key, default=default, db=self.db)
+
+    def delete(self, key, value=b'', **kwa):
+        return self.txn.delete(key, value, db=self.db, **kwa)
+
+    def cursor(self):
+        return self.txn.cursor(db=self.db)
+
+    def stat(self, db):
+        return self.txn.stat(db)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -281,6 +320,9 @@ class LMDBer(filing.Filer):
         readonly (bool): True means open LMDB env as readonly
 
     Properties:
+        txn (lmdb.Transaction | None): ambient transaction of this thread
+            opened by .transact or .snapshot if any
+        writable (bool): True means ambient transaction is a write one
 
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
@@ -346,6 +388,7 @@ class LMDBer(filing.Filer):
         """
         self.env = None
         self.readonly = True if readonly else False
+        self._ambient = threading.local()  # lmdb txns are thread bound
         super(LMDBer, self).__init__(**kwa)
 
 
@@ -403,6 +446,138 @@ class LMDBer(filing.Filer):
         return(super(LMDBer, self).close(clear=clear))
 
 
+    @property
+    def txn(self):
+        """ Returns ambient transaction of this thread if any else None """
+        return getattr(self._ambient, "txn", None)
+
+
+    @property
+    def writable(self):
+        """ Returns True if ambient transaction of this thread is a write one """
+        return getattr(self._ambient, "write", False)
+
+
+    @contextmanager
+    def _bind(self, txn, write=False):
+        """
+        Context manager that makes txn the ambient transaction of this thread
+        for the with block and restores the prior one, if any, on exit.
+        """
+        prior = (self.txn, self.writable)
+        self._ambient.txn, self._ambient.write = txn, write
+        try:
+            yield txn
+        finally:
+            self._ambient.txn, self._ambient.write = prior
+
+
+    @contextmanager
+    def transact(self):
+        """
+        Context manager for one atomic write transaction spanning many
+        operations. Every LMDBer method and so every Suber, Komer and friends
+        sub db method called on this thread inside the with block joins the
+        transaction instead of beginning and committing its own. Reads inside
+        the block see the writes made earlier in the block. Commits once on
+        normal exit. Aborts all the writes when an exception escapes.
+        Nested use joins the outermost transaction.
+
+        Iterators begun inside the block must be exhausted inside it.
+
+        Usage:
+            with baser.transact():
+                baser.putEvt(key, raw)
+                baser.states.pin(keys=pre, val=ksr)
+
+        Yields:
+            txn (lmdb.Transaction): ambient write transaction
+        """
+        if self.writable:  # nested so join outer
+            yield self.txn
+            return
+
+        with self.env.begin(write=True, buffers=True) as txn:
+            with self._bind(txn, write=True):
+                yield txn
+
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Context manager for one read transaction spanning many reads. Every
+        LMDBer method and so every Suber, Komer and friends sub db method
+        called on this thread inside the with block reads from the same
+        consistent MVCC snapshot instead of beginning its own transaction.
+        Values read inside the block stay valid until the block exits.
+        Writes inside the block commit on their own and are not seen by the
+        snapshot. Inside .transact or another snapshot joins that transaction.
+
+        Do not yield from inside the block. Use .snapshotIter for generators.
+
+        Usage:
+            with baser.snapshot():
+                raw = baser.getEvt(dgkey)
+                sigs = baser.getSigs(dgkey)
+
+        Yields:
+            txn (lmdb.Transaction): ambient transaction
+        """
+        if (txn := self.txn) is not None:  # join ambient
+            yield txn
+            return
+
+        with self.env.begin(write=False, buffers=True) as txn:
+            with self._bind(txn):
+                yield txn
+
+
+    def snapshotIter(self, iterable):
+        """
+        Returns iterator over iterable, such as a generator that reads many
+        times from this db, where all of its reads come from one read
+        transaction snapshot. The snapshot is ambient only while the iterable
+        is running so reads made by the consumer between items are not
+        affected. Joins the ambient transaction if any when begun.
+
+        Parameters:
+            iterable (Iterable): whose iteration reads from this db
+        """
+        if self.txn is not None:  # join ambient
+            yield from iterable
+            return
+
+        with self.env.begin(write=False, buffers=True) as txn:
+            it = iter(iterable)
+            try:
+                while True:
+                    with self._bind(txn):
+                        try:
+                            item = next(it)
+                        except StopIteration:
+                            return
+                    yield item
+            finally:
+                if hasattr(it, "close"):  # release cursors before snapshot ends
+                    with self._bind(txn):
+                        it.close()
+
+
+    def _trans(self, db, write=False):
+        """
+        Returns context manager transaction for db. Joins ambient transaction
+        of .transact or .snapshot when there is one otherwise begins its own
+        that commits on exit. Writes do not join a read only snapshot.
+
+        Parameters:
+            db (lmdb._Database): named sub db
+            write (bool): True means write transaction
+        """
+        if (txn := self.txn) is not None and (self.writable or not write):
+            return Joiner(txn=txn, db=db)
+        return self.env.begin(db=db, write=write, buffers=True)
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     def putVal(self, db, key, val):
         """
@@ -416,7 +591,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             return (txn.put(key, val, overwrite=False))
 
 
@@ -431,7 +606,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             return (txn.put(key, val))
 
 
@@ -445,7 +620,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             return( txn.get(key))
 
 
@@ -458,10 +633,76 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             return (txn.delete(key))
 
 
+    def putManyVals(self, db, items):
+        """
+        Write each serialized bytes val at its key in db in one write
+        transaction with a single cursor putmulti. Does not overwrite.
+        Returns count of items written. Items whose key already exists are
+        skipped.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            items is iterable of (key, val) duples of bytes
+        """
+        with self._trans(db=db, write=True) as txn:
+            cursor = txn.cursor()
+            _, added = cursor.putmulti(items, dupdata=False, overwrite=False)
+            return added
+
+
+    def setManyVals(self, db, items):
+        """
+        Write each serialized bytes val at its key in db in one write
+        transaction with a single cursor putmulti. Overwrites existing vals.
+        Returns count of items written.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            items is iterable of (key, val) duples of bytes
+        """
+        with self._trans(db=db, write=True) as txn:
+            cursor = txn.cursor()
+            _, added = cursor.putmulti(items, dupdata=False, overwrite=True)
+            return added
+
+
+    def getManyValsIter(self, db, keys):
+        """
+        Returns iterator of val at each key in keys in order all read in one
+        read transaction. Yields None for each key with no entry.
+        Yielded vals are buffers into the read transaction so deserialize
+        each one before the iterator is exhausted.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            keys is iterable of bytes keys within sub db's keyspace
+        """
+        with self._trans(db=db, write=False) as txn:
+            for key in keys:
+                yield txn.get(key)
+
+
+    def delManyVals(self, db, keys):
+        """
+        Deletes value at each key in keys in db in one write transaction.
+        Returns count of keys that existed and so were deleted.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            keys is iterable of bytes keys within sub db's keyspace
+        """
+        count = 0
+        with self._trans(db=db, write=True) as txn:
+            for key in keys:
+                if txn.delete(key):
+                    count += 1
+            return count
+
+
     def cnt(self, db):
         """
         Return count of values in db, or zero otherwise
@@ -469,7 +710,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:
@@ -477,6 +718,18 @@ class LMDBer(filing.Filer):
             return count
 
 
+    def cntEntries(self, db):
+        """
+        Return count of all entries in db including duplicates. Unlike .cnt
+        does not iterate but reads count maintained by lmdb in db stats.
+
+        Parameters:
+            db is opened named sub db
+        """
+        with self._trans(db=db, write=False) as txn:
+            return txn.stat(db)["entries"]
+
+
     def getAllItemIter(self, db, key=b'', split=True, sep=b'.'):
         """
         Returns iterator of item duple (key, val), at each key over all
@@ -495,7 +748,7 @@ class LMDBer(filing.Filer):
             split (bool): True means split key at sep before returning
             sep (bytes): separator char for key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -530,7 +783,7 @@ class LMDBer(filing.Filer):
                         from multiple branches of the key space. If top key is
                         empty then gets all items in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -564,7 +817,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
@@ -599,7 +852,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(key):  # max is past end of database
@@ -646,7 +899,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
@@ -674,7 +927,7 @@ class LMDBer(filing.Filer):
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -711,7 +964,7 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
@@ -751,7 +1004,7 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
@@ -790,7 +1043,7 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
@@ -814,7 +1067,7 @@ class LMDBer(filing.Filer):
         """
         ion = 0  # default is zeroth insertion at key
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -864,7 +1117,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -892,7 +1145,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -904,6 +1157,33 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    def getManyIoSetValsIter(self, db, keys, *, sep=b'.'):
+        """
+        Returns:
+            iterator of list of the insertion ordered set of values at each
+            apparent effective key in keys in order all read in one read
+            transaction. Yields empty list for each key with no entry.
+            Yielded vals are buffers into the read transaction so deserialize
+            each list before the iterator is exhausted.
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            keys (abc.Iterable): of apparent effective keys as bytes
+        """
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor()
+            for key in keys:
+                vals = []
+                iokey = suffix(key, 0, sep=sep)  # zeroth value for key
+                if cursor.set_range(iokey):  # move to val at key >= iokey if any
+                    for iokey, val in cursor.iternext():  # get key, val at cursor
+                        ckey, cion = unsuffix(iokey, sep=sep)
+                        if ckey != key:  # prev entry if any was the last entry for key
+                            break  # done
+                        vals.append(val)  # another entry at key
+                yield vals
+
+
     def getIoSetValLast(self, db, key, *, sep=b'.'):
         """
         Returns:
@@ -920,7 +1200,7 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -986,7 +1266,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1029,7 +1309,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1055,7 +1335,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             items = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -1083,7 +1363,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1107,7 +1387,7 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             return txn.delete(iokey)
 
 
@@ -1128,7 +1408,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             result = True
             for val in vals:
                 result = result and txn.put(key, val, dupdata=True)
@@ -1157,7 +1437,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self._trans(db=db, write=True) as txn:
                 result = txn.put(key, val, dupdata=True)
         return result
 
@@ -1174,7 +1454,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1193,7 +1473,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             if cursor.set_key(key):  # move to first_dup
@@ -1213,7 +1493,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1229,7 +1509,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             if cursor.set_key(key):  # moves to first_dup
@@ -1248,7 +1528,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             count = 0
@@ -1274,7 +1554,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             return (txn.delete(key, val))
 
 
@@ -1306,7 +1586,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             idx = 0
             cursor = txn.cursor()
             if cursor.set_key(key): # move to key if any
@@ -1350,7 +1630,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1371,7 +1651,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1391,7 +1671,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             if cursor.set_key(key):  # move to first_dup
@@ -1421,7 +1701,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
@@ -1455,7 +1735,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -1476,7 +1756,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             if cursor.set_key(key):  # moves to first_dup
@@ -1494,7 +1774,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             return (txn.delete(key))
 
 
@@ -1527,7 +1807,7 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             cursor = txn.cursor()
             if cursor.set_key(key):  # move to first_dup
                 for proval in cursor.iternext_dup():  #  value with proem
@@ -1554,7 +1834,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
@@ -1583,7 +1863,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             fn is first
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt := fn)
             # set_key returns True if exact key else false
@@ -1613,7 +1893,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
@@ -1645,7 +1925,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_range(key):  #  moves to first dup of key >= key
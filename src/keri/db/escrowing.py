@@ -11,11 +11,92 @@ from keri.core import coring
 from keri import help
 from keri import kering
 from keri.core import eventing
-from keri.db import subing
+from keri.db import basing, subing
 from keri.help import helping
 
 logger = help.ogler.getLogger()
 
+MetricsContentType = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def metricsText(db, reger=None, ages=True, now=None):
+    """
+    Returns str of escrow backlog and escrow processing metrics of db and
+    optional reger in Prometheus text exposition format.
+
+    Metrics:
+        keri_escrow_entries (gauge): entries per escrow
+        keri_escrow_age_seconds (histogram): ages of escrowed entries per escrow
+        keri_escrow_pass_seconds (summary): durations of escrow processing passes
+        keri_escrow_pass_last_seconds (gauge): duration of last pass
+        keri_escrow_pass_max_seconds (gauge): longest pass
+        keri_kever_cache_entries (gauge): kevers held in memory
+        keri_kever_cache_lookups_total (counter): kever lookups by result
+        keri_kever_cache_evictions_total (counter): kevers evicted from memory
+
+    Parameters:
+        db (Baser): event database
+        reger (Reger | None): credential database
+        ages (bool): True means include age histograms which iterate escrows
+        now (datetime | None): current datetime. None means now
+    """
+    stats = [("kel", db.escrowStats(ages=ages, now=now))]
+    meters = [db.escrowMeter]
+    if reger is not None:
+        stats.append(("tel", reger.escrowStats(ages=ages, now=now)))
+        meters.append(reger.escrowMeter)
+
+    lines = ["# HELP keri_escrow_entries Number of entries in escrow.",
+             "# TYPE keri_escrow_entries gauge"]
+    for log, escrows in stats:
+        for name, stat in escrows.items():
+            lines.append(f'keri_escrow_entries{{log="{log}",escrow="{name}"}} {stat["count"]}')
+
+    if ages:
+        lines.extend(["# HELP keri_escrow_age_seconds Age of escrowed entries.",
+                      "# TYPE keri_escrow_age_seconds histogram"])
+        for log, escrows in stats:
+            for name, stat in escrows.items():
+                if "buckets" not in stat:
+                    continue
+                labels = f'log="{log}",escrow="{name}"'
+                bounds = [str(bound) for bound in basing.EscrowAgeBuckets] + ["+Inf"]
+                for bound, count in zip(bounds, stat["buckets"]):
+                    lines.append(f'keri_escrow_age_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'keri_escrow_age_seconds_sum{{{labels}}} {stat["total"]:.3f}')
+                lines.append(f'keri_escrow_age_seconds_count{{{labels}}} {stat["buckets"][-1]}')
+
+    passes = [(name, meter) for escrowMeter in meters
+              for name, meter in sorted(escrowMeter.passes.items())]
+    lines.extend(["# HELP keri_escrow_pass_seconds Duration of escrow processing passes.",
+                  "# TYPE keri_escrow_pass_seconds summary"])
+    for name, (count, total, last, most) in passes:
+        lines.append(f'keri_escrow_pass_seconds_sum{{processor="{name}"}} {total:.6f}')
+        lines.append(f'keri_escrow_pass_seconds_count{{processor="{name}"}} {count}')
+    lines.extend(["# HELP keri_escrow_pass_last_seconds Duration of last escrow processing pass.",
+                  "# TYPE keri_escrow_pass_last_seconds gauge"])
+    for name, (count, total, last, most) in passes:
+        lines.append(f'keri_escrow_pass_last_seconds{{processor="{name}"}} {last:.6f}')
+    lines.extend(["# HELP keri_escrow_pass_max_seconds Longest escrow processing pass.",
+                  "# TYPE keri_escrow_pass_max_seconds gauge"])
+    for name, (count, total, last, most) in passes:
+        lines.append(f'keri_escrow_pass_max_seconds{{processor="{name}"}} {most:.6f}')
+
+    cache = db.kevers.stats()
+    lines.extend(["# HELP keri_kever_cache_entries Number of kevers held in memory.",
+                  "# TYPE keri_kever_cache_entries gauge",
+                  f'keri_kever_cache_entries {cache["entries"]}',
+                  "# HELP keri_kever_cache_lookups_total Kever lookups by result.",
+                  "# TYPE keri_kever_cache_lookups_total counter",
+                  f'keri_kever_cache_lookups_total{{result="hit"}} {cache["hits"]}',
+                  f'keri_kever_cache_lookups_total{{result="load"}} {cache["loads"]}',
+                  f'keri_kever_cache_lookups_total{{result="miss"}} {cache["misses"] - cache["loads"]}',
+                  "# HELP keri_kever_cache_evictions_total Kevers evicted from memory.",
+                  "# TYPE keri_kever_cache_evictions_total counter",
+                  f'keri_kever_cache_evictions_total {cache["evictions"]}'])
+
+    return "\n".join(lines) + "\n"
+
 
 class Broker:
 
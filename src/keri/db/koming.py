@@ -165,6 +165,8 @@ class KomerBase:
 
     def __deserializeMGPK(self, val):
         if val is not None:
+            if val[:1] == b'{':  # JSON written before kind changed
+                return self.__deserializeJSON(val)
             val = helping.datify(self.schema, msgpack.loads(bytes(val)))
             if not isinstance(val, self.schema):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
@@ -174,6 +176,8 @@ class KomerBase:
 
     def __deserializeCBOR(self, val):
         if val is not None:
+            if val[:1] == b'{':  # JSON written before kind changed
+                return self.__deserializeJSON(val)
             val = helping.datify(self.schema, cbor2.loads(bytes(val)))
             if not isinstance(val, self.schema):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
@@ -315,6 +319,92 @@ class Komer(KomerBase):
         return (self.db.delVal(db=self.sdb, key=self._tokey(keys)))
 
 
+    def putMany(self, items: Iterable):
+        """
+        Puts each val at key made from its keys in one write transaction
+        using a single cursor putmulti. Does not overwrite.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is instance of
+                dataclass of type self.schema. May be an iterator.
+
+        Returns:
+            count (int): number of items put. Items whose key is already in
+                database are skipped.
+        """
+        return (self.db.putManyVals(db=self.sdb,
+                                    items=((self._tokey(keys), self.serializer(val))
+                                           for keys, val in items)))
+
+
+    def pinMany(self, items: Iterable):
+        """
+        Pins (sets) each val at key made from its keys in one write
+        transaction using a single cursor putmulti. Overwrites.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is instance of
+                dataclass of type self.schema. May be an iterator.
+
+        Returns:
+            count (int): number of items pinned
+        """
+        return (self.db.setManyVals(db=self.sdb,
+                                    items=((self._tokey(keys), self.serializer(val))
+                                           for keys, val in items)))
+
+
+    def getManyIter(self, keys: Iterable):
+        """
+        Gets val at key made from each element of keys all in one read
+        transaction.
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key. May be an iterator.
+
+        Returns:
+            vals (Iterator): of dataclass in order of keys. None where no
+                entry at keys.
+        """
+        for val in self.db.getManyValsIter(db=self.sdb,
+                                           keys=(self._tokey(k)
+                                                 for k in keys)):
+            yield self.deserializer(val)
+
+
+    def getMany(self, keys: Iterable):
+        """
+        Gets val at key made from each element of keys all in one read
+        transaction.
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key
+
+        Returns:
+            vals (list): of dataclass in order of keys. None where no entry
+                at keys.
+        """
+        return list(self.getManyIter(keys))
+
+
+    def remMany(self, keys: Iterable):
+        """
+        Removes entry at key made from each element of keys in one write
+        transaction
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key. May be an iterator.
+
+        Returns:
+           count (int): number of entries removed
+        """
+        return (self.db.delManyVals(db=self.sdb,
+                                    keys=(self._tokey(k) for k in keys)))
+
+
     def trim(self, keys: Union[str, Iterable]=b""):
         """
         Removes all entries whose keys startswith keys. Enables removal of whole
@@ -272,6 +272,89 @@ class Suber(SuberBase):
         return(self.db.delVal(db=self.sdb, key=self._tokey(keys)))
 
 
+    def putMany(self, items: Iterable):
+        """
+        Puts each val at key made from its keys in one write transaction
+        using a single cursor putmulti. Does not overwrite.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples. May be an iterator.
+
+        Returns:
+            count (int): number of items put. Items whose key is already in
+                database are skipped.
+        """
+        return (self.db.putManyVals(db=self.sdb,
+                                    items=((self._tokey(keys), self._ser(val))
+                                           for keys, val in items)))
+
+
+    def pinMany(self, items: Iterable):
+        """
+        Pins (sets) each val at key made from its keys in one write
+        transaction using a single cursor putmulti. Overwrites.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples. May be an iterator.
+
+        Returns:
+            count (int): number of items pinned
+        """
+        return (self.db.setManyVals(db=self.sdb,
+                                    items=((self._tokey(keys), self._ser(val))
+                                           for keys, val in items)))
+
+
+    def getManyIter(self, keys: Iterable):
+        """
+        Gets val at key made from each element of keys all in one read
+        transaction.
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key. May be an iterator.
+
+        Returns:
+            vals (Iterator): of val in order of keys. None where no entry
+                at keys.
+        """
+        for val in self.db.getManyValsIter(db=self.sdb,
+                                           keys=(self._tokey(k)
+                                                 for k in keys)):
+            yield (self._des(val) if val is not None else None)
+
+
+    def getMany(self, keys: Iterable):
+        """
+        Gets val at key made from each element of keys all in one read
+        transaction.
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key
+
+        Returns:
+            vals (list): of val in order of keys. None where no entry at keys.
+        """
+        return list(self.getManyIter(keys))
+
+
+    def remMany(self, keys: Iterable):
+        """
+        Removes entry at key made from each element of keys in one write
+        transaction
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key. May be an iterator.
+
+        Returns:
+           count (int): number of entries removed
+        """
+        return (self.db.delManyVals(db=self.sdb,
+                                    keys=(self._tokey(k) for k in keys)))
+
+
 
 class CesrSuberBase(SuberBase):
     """
@@ -635,6 +718,88 @@ class IoSetSuber(SuberBase):
                                        sep=self.sep)
 
 
+    def putMany(self, items: Iterable):
+        """
+        Puts all vals at effective key made from keys for each (keys, vals)
+        in items that are not already in set of vals at key. Does not overwrite.
+        All in one write transaction.
+
+        Parameters:
+            items (Iterable): of (keys, vals) duples where vals is Iterable of
+                serializations. May be an iterator.
+
+        Returns:
+            count (int): number of effective keys to which any val was added
+        """
+        count = 0
+        with self.db.transact():
+            for keys, vals in items:
+                if self.db.putIoSetVals(db=self.sdb,
+                                        key=self._tokey(keys),
+                                        vals=[self._ser(val) for val in vals],
+                                        sep=self.sep):
+                    count += 1
+        return count
+
+
+    def getManyIter(self, keys: Iterable):
+        """
+        Gets vals set list at effective key made from each element of keys
+        all in one read transaction.
+
+        Parameters:
+            keys (Iterable): of keys for each effective key each of key strs
+                to be combined in order to form key. May be an iterator.
+
+        Returns:
+            valses (Iterator): of vals list in order of keys. Empty list where
+                no entry at keys.
+        """
+        for vals in self.db.getManyIoSetValsIter(db=self.sdb,
+                                                 keys=(self._tokey(k)
+                                                       for k in keys),
+                                                 sep=self.sep):
+            yield [self._des(val) for val in vals]
+
+
+    def getMany(self, keys: Iterable):
+        """
+        Gets vals set list at effective key made from each element of keys
+        all in one read transaction.
+
+        Parameters:
+            keys (Iterable): of keys for each effective key each of key strs
+                to be combined in order to form key
+
+        Returns:
+            valses (list): of vals list in order of keys. Empty list where no
+                entry at keys.
+        """
+        return list(self.getManyIter(keys))
+
+
+    def remMany(self, keys: Iterable):
+        """
+        Removes all vals at effective key made from each element of keys in
+        one write transaction.
+
+        Parameters:
+            keys (Iterable): of keys for each effective key each of key strs
+                to be combined in order to form key. May be an iterator.
+
+        Returns:
+           count (int): number of effective keys with vals removed
+        """
+        count = 0
+        with self.db.transact():
+            for k in keys:
+                if self.db.delIoSetVals(db=self.sdb,
+                                        key=self._tokey(k),
+                                        sep=self.sep):
+                    count += 1
+        return count
+
+
     def getItemIter(self, keys: Union[str, Iterable]=b""):
         """
         Return iterator over all the items in top branch defined by keys where
@@ -915,6 +1080,29 @@ class SignerSuber(CesrSuber):
                                    transferable=verfer.transferable))
 
 
+    def getManyIter(self, keys: Iterable):
+        """
+        Gets Signer instance at key made from each element of keys all in one
+        read transaction.
+        Last element of each keys is verkey used to determine .transferable
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key
+
+        Returns:
+            signers (Iterator): of Signer in order of keys. None where no
+                entry at keys.
+        """
+        keys = [self._tokey(k) for k in keys]
+        for key, val in zip(keys, self.db.getManyValsIter(db=self.sdb, keys=keys)):
+            if val is None:
+                yield None
+                continue
+            verfer = coring.Verfer(qb64b=self._tokeys(key)[-1])  # last split
+            yield (self.klas(qb64b=bytes(val), transferable=verfer.transferable))
+
+
 class CryptSignerSuber(SignerSuber):
     """
     Sub class of SignerSuber where data is Signer subclass instance .qb64b property
@@ -971,6 +1159,47 @@ class CryptSignerSuber(SignerSuber):
                                val=val.qb64b))
 
 
+    def putMany(self, items: Iterable, encrypter: coring.Encrypter = None):
+        """
+        Puts qb64 of each Matter instance val at key made from its keys in one
+        write transaction. Does not overwrite.
+        If encrypter provided then encrypts each first
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is Signer
+            encrypter (coring.Encrypter): optional
+
+        Returns:
+            count (int): number of items put. Items whose key is already in
+                database are skipped.
+        """
+        return (self.db.putManyVals(db=self.sdb,
+                                    items=((self._tokey(keys),
+                                            (encrypter.encrypt(matter=val)
+                                             if encrypter else val).qb64b)
+                                           for keys, val in items)))
+
+
+    def pinMany(self, items: Iterable, encrypter: coring.Encrypter = None):
+        """
+        Pins (sets) qb64 of each Matter instance val at key made from its keys
+        in one write transaction. Overwrites.
+        If encrypter provided then encrypts each first
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is Signer
+            encrypter (coring.Encrypter): optional
+
+        Returns:
+            count (int): number of items pinned
+        """
+        return (self.db.setManyVals(db=self.sdb,
+                                    items=((self._tokey(keys),
+                                            (encrypter.encrypt(matter=val)
+                                             if encrypter else val).qb64b)
+                                           for keys, val in items)))
+
+
 
     def get(self, keys: Union[str, Iterable], decrypter: coring.Decrypter = None):
         """
@@ -1008,6 +1237,52 @@ class CryptSignerSuber(SignerSuber):
         return (self.klas(qb64b=bytes(val), transferable=verfer.transferable))
 
 
+    def getManyIter(self, keys: Iterable, decrypter: coring.Decrypter = None):
+        """
+        Gets Signer instance at key made from each element of keys all in one
+        read transaction. If decrypter then assumes values in db were encrypted
+        and so decrypts each before converting to Signer.
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key. Last element of each keys is
+                verkey used to determine .transferable
+            decrypter (coring.Decrypter): optional. If provided assumes values
+                in db were encrypted and so decrypts before converting to Signer.
+
+        Returns:
+            signers (Iterator): of Signer in order of keys. None where no
+                entry at keys.
+        """
+        keys = [self._tokey(k) for k in keys]
+        for key, val in zip(keys, self.db.getManyValsIter(db=self.sdb, keys=keys)):
+            if val is None:
+                yield None
+                continue
+            verfer = coring.Verfer(qb64b=self._tokeys(key)[-1])  # last split
+            if decrypter:
+                yield (decrypter.decrypt(ser=bytes(val),
+                                         transferable=verfer.transferable))
+            else:
+                yield (self.klas(qb64b=bytes(val), transferable=verfer.transferable))
+
+
+    def getMany(self, keys: Iterable, decrypter: coring.Decrypter = None):
+        """
+        Gets Signer instance at key made from each element of keys all in one
+        read transaction. If decrypter then decrypts each.
+
+        Parameters:
+            keys (Iterable): of keys for each entry each of key strs to be
+                combined in order to form key
+            decrypter (coring.Decrypter): optional
+
+        Returns:
+            signers (list): of Signer in order of keys. None where no entry at keys.
+        """
+        return list(self.getManyIter(keys, decrypter=decrypter))
+
+
 
     def getItemIter(self, keys: Union[str, Iterable]=b"",
                        decrypter: coring.Decrypter = None):
@@ -1055,6 +1330,20 @@ class SerderSuber(Suber):
         super(SerderSuber, self).__init__(*pa, **kwa)
 
 
+    def _ser(self, val: coring.Serder):
+        """
+        Serialize instance val to bytes to store in db
+        """
+        return val.raw
+
+
+    def _des(self, val: Union[str, memoryview, bytes]):
+        """
+        Deserialize val to Serder instance
+        """
+        return coring.Serder(raw=bytes(val))
+
+
     def put(self, keys: Union[str, Iterable], val: coring.Serder):
         """
         Puts val at key made from keys. Does not overwrite
@@ -1157,6 +1446,20 @@ class SchemerSuber(Suber):
         """
         super(SchemerSuber, self).__init__(*pa, **kwa)
 
+
+    def _ser(self, val: scheming.Schemer):
+        """
+        Serialize instance val to bytes to store in db
+        """
+        return val.raw
+
+
+    def _des(self, val: Union[str, memoryview, bytes]):
+        """
+        Deserialize val to Schemer instance
+        """
+        return scheming.Schemer(raw=bytes(val))
+
     def put(self, keys: Union[str, Iterable], val: scheming.Schemer):
         """
         Puts val at key made from keys. Does not overwrite
@@ -5,6 +5,7 @@ keri.end.ending module
 ReST API endpoints
 
 """
+import itertools
 import json
 import os
 import re
@@ -59,6 +60,8 @@ WOOBI_RE = re.compile('\\A/.well-known/keri/oobi/(?P<cid>[^/]+)\\Z')
 
 OOBI_AID_HEADER = "KERI-AID"
 
+StreamChunkSize = 65536  # bytes per chunk of streamed response body
+
 
 def signature(signages):
     """
@@ -392,6 +395,51 @@ def desiginput(value):
     return siginputs
 
 
+def streamChunks(parts, size=StreamChunkSize):
+    """
+    Returns iterator of bytes chunks of at least size bytes, except the last,
+    made by joining consecutive bytes parts so a streamed response body is
+    written in chunks of about size no matter how small or many the parts.
+    Memory held is bounded by size plus the largest part.
+
+    Parts from a clone iterator run through LMDBer.snapshotIter are read in
+    one read transaction that stays open until the body is fully sent, so a
+    slow client pins that snapshot and LMDB cannot reuse pages freed by
+    writes meanwhile, growing the map file. That is the cost of a
+    consistent body in bounded memory. Responses are bounded by the KEL or
+    credential chain streamed so the pin lasts one response.
+
+    Parameters:
+        parts (Iterable): of bytes like parts of body in order
+        size (int): minimum bytes per chunk
+    """
+    chunk = bytearray()
+    for part in parts:
+        chunk.extend(part)
+        if len(chunk) >= size:
+            yield bytes(chunk)
+            chunk.clear()
+    if chunk:
+        yield bytes(chunk)
+
+
+def primeStream(chunks):
+    """
+    Returns (first, chunks) duple where first is the first non empty chunk of
+    chunks or None when there is none and chunks is iterator of all chunks
+    including first. Pulling the first chunk before the response starts lets
+    errors and empty bodies be reported with a proper status.
+
+    Parameters:
+        chunks (Iterable): of bytes chunks
+    """
+    chunks = iter(chunks)
+    for first in chunks:
+        if first:
+            return first, itertools.chain((first,), chunks)
+    return None, iter(())
+
+
 # Falcon reource endpoints
 
 class PointEnd(base.Tymee):
@@ -591,16 +639,17 @@ class OOBIEnd:
         if eid:
             eids.append(eid)
 
-        msgs = hab.replyToOobi(aid=aid, role=role, eids=eids)
-        if not msgs and role is None:
-            msgs = hab.replyToOobi(aid=aid, role=kering.Roles.witness, eids=eids)
-            msgs.extend(hab.replay(aid))
+        first, chunks = primeStream(streamChunks(hab.replyToOobiIter(aid=aid, role=role, eids=eids)))
+        if first is None and role is None:
+            first, chunks = primeStream(streamChunks(itertools.chain(
+                hab.replyToOobiIter(aid=aid, role=kering.Roles.witness, eids=eids),
+                hab.replayIter(aid))))
 
-        if msgs:
+        if first is not None:
             rep.status = falcon.HTTP_200  # This is the default status
             rep.set_header(OOBI_AID_HEADER, aid)
             rep.content_type = "application/json+cesr"
-            rep.data = bytes(msgs)
+            rep.stream = chunks
 
         else:
             rep.status = falcon.HTTP_NOT_FOUND
@@ -4,9 +4,11 @@ keri.help.helping module
 
 """
 import base64
+import collections
 import dataclasses
 import datetime
 import re
+import threading
 from collections.abc import Iterable, Sequence, Mapping
 
 import pysodium
@@ -293,3 +295,88 @@ def fromIso8601(dts):
     if hasattr(dts, "decode"):
         dts = dts.decode("utf-8")
     return (datetime.datetime.fromisoformat(dts))
+
+
+class LRUCache:
+    """
+    LRUCache is a bounded thread safe least recently used cache. Inserting
+    into a full cache evicts the least recently used entry. Counts hits, misses
+    and evictions so the cache may be sized in production.
+
+    Attributes:
+        maxsize (int): maximum number of entries before eviction
+        hits (int): number of lookups that found an entry
+        misses (int): number of lookups that did not find an entry
+        evictions (int): number of entries evicted to make room
+
+    Properties:
+        stats (dict): snapshot of size and counters
+
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Initialize instance
+
+        Parameters:
+            maxsize (int): maximum number of entries. Must be at least 1.
+        """
+        if maxsize < 1:
+            raise ValueError(f"Invalid maxsize={maxsize} for LRUCache.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """
+        Returns value at key and marks it most recently used.
+        Returns default if no entry at key.
+        """
+        with self._lock:
+            try:
+                self._items.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return self._items[key]
+
+    def put(self, key, val):
+        """
+        Inserts or replaces val at key as most recently used and evicts least
+        recently used entries when full.
+        """
+        with self._lock:
+            self._items[key] = val
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        """
+        Returns and removes value at key. Returns default if no entry at key.
+        """
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def clear(self):
+        """ Removes all entries. Counters are not reset. """
+        with self._lock:
+            self._items.clear()
+
+    @property
+    def stats(self):
+        """ Returns dict snapshot of size and counters """
+        return dict(size=len(self._items), maxsize=self.maxsize,
+                    hits=self.hits, misses=self.misses,
+                    evictions=self.evictions)
@@ -2051,8 +2051,10 @@ class Tevery:
         """ Loop through escrows and process and events that may now be finalized """
 
         try:
-            self.processEscrowAnchorless()
-            self.processEscrowOutOfOrders()
+            with self.reger.escrowMeter.timed("Tevery.processEscrowAnchorless"):
+                self.processEscrowAnchorless()
+            with self.reger.escrowMeter.timed("Tevery.processEscrowOutOfOrders"):
+                self.processEscrowOutOfOrders()
             self.reger.txnsb.processEscrowState(typ="credential-mre", processReply=self.processReplyCredentialTxnState,
                                                 extype=kering.MissingRegistryError)
             self.reger.txnsb.processEscrowState(typ="credential-mae", processReply=self.processReplyCredentialTxnState,
@@ -298,11 +298,14 @@ class Verifier:
 
         """
 
-        self._processEscrow(self.reger.mce, self.TimeoutMRI, kering.MissingChainError)
-        self._processEscrow(self.reger.mse, self.TimeoutMRI, kering.MissingSchemaError)
-        self._processEscrow(self.reger.pse, self.TimeoutPSE, kering.MissingSignatureError)
-        self._processEscrow(self.reger.mie, self.TimeoutMRI, kering.MissingIssuerError)
-        self._processEscrow(self.reger.mre, self.TimeoutMRE, kering.MissingRegistryError)
+        for name, db, timeout, etype in (
+                ("mce", self.reger.mce, self.TimeoutMRI, kering.MissingChainError),
+                ("mse", self.reger.mse, self.TimeoutMRI, kering.MissingSchemaError),
+                ("pse", self.reger.pse, self.TimeoutPSE, kering.MissingSignatureError),
+                ("mie", self.reger.mie, self.TimeoutMRI, kering.MissingIssuerError),
+                ("mre", self.reger.mre, self.TimeoutMRE, kering.MissingRegistryError)):
+            with self.reger.escrowMeter.timed(f"Verifier.processEscrow.{name}"):
+                self._processEscrow(db, timeout, etype)
 
     def _processEscrow(self, db, timeout, etype: Type[Exception]):
         """ Generic credential escrow processing
@@ -358,18 +361,10 @@ class Verifier:
         """
         self.reger.logCred(creder, sadsigers, sadcigars)
 
-        schema = creder.schema.encode("utf-8")
-        issuer = creder.issuer.encode("utf-8")
-
         # Look up indicies
         saider = creder.saider
         self.reger.saved.pin(keys=saider.qb64b, val=saider)
-        self.reger.issus.add(keys=issuer, val=saider)
-        self.reger.schms.add(keys=schema, val=saider)
-
-        if 'i' in creder.subject:
-            subject = creder.subject["i"].encode("utf-8")
-            self.reger.subjs.add(keys=subject, val=saider)
+        self.reger.indexCred(creder)
 
     def query(self, pre, regk, vcid, *, dt=None, dta=None, dtb=None, **kwa):
         """ Returns query message for querying registry
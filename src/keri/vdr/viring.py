@@ -11,7 +11,7 @@ A special purpose Verifiable Data Registry (VDR)
 from dataclasses import dataclass
 from  ordered_set import OrderedSet as oset
 
-from ..db import koming, subing, escrowing
+from ..db import basing, koming, subing, escrowing
 
 from .. import kering
 from ..app import signing
@@ -167,11 +167,19 @@ class Reger(dbing.LMDBer):
             key is habitat name str
             value is serialized RegistryRecord dataclass
 
+        .credCache is helping.LRUCache of cloned credentials with status keyed by
+            qb64 SAID used by .cloneCreds. Entry is dropped when TEL of credential
+            changes.
+
+        .escrowMeter is basing.EscrowMeter of durations of TEL and credential
+            escrow processing passes
+
 
     """
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
+    CredCacheSize = 4096  # cloned credentials cached by .cloneCreds
 
     def __init__(self, headDirPath=None, reopen=True, **kwa):
         """
@@ -203,6 +211,8 @@ class Reger(dbing.LMDBer):
         """
 
         self.registries = oset()
+        self.credCache = helping.LRUCache(maxsize=self.CredCacheSize)
+        self.escrowMeter = basing.EscrowMeter()
         if "db" in kwa:
             self._tevers = RegerDict()
             self._tevers.reger = self  # assign db for read thorugh cache of kevers
@@ -213,6 +223,39 @@ class Reger(dbing.LMDBer):
         super(Reger, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
 
+    def escrowStats(self, ages=True, now=None):
+        """
+        Returns dict of statistics of TEL and credential escrows keyed by
+        escrow name. Same form as Baser.escrowStats. Escrows whose entries
+        carry no datetime have count only.
+
+        Parameters:
+            ages (bool): True means include age histogram where available
+            now (datetime | None): current datetime. None means now
+        """
+        stats = dict()
+        for name, db in (("oots", self.oots), ("twes", self.twes), ("taes", self.taes)):
+            stats[name] = dict(count=self.cntEntries(db))
+
+        for name, suber in (("tpwe", self.tpwe), ("tmse", self.tmse), ("tede", self.tede)):
+            stats[name] = dict(count=self.cntEntries(suber.sdb))
+
+        for name, suber in (("pse", self.pse), ("mre", self.mre), ("mie", self.mie),
+                            ("mce", self.mce), ("mse", self.mse)):
+            stat = stats[name] = dict(count=self.cntEntries(suber.sdb))
+            if ages:
+                stat["buckets"], stat["total"] = basing.ageHistogram(
+                    (dater.datetime for _, dater in suber.getItemIter()), now=now)
+
+        stat = stats["txn"] = dict(count=self.cntEntries(self.txnsb.escrowdb.sdb))
+        if ages:
+            daters = (self.txnsb.daterdb.get(keys=(saider.qb64,))
+                      for _, saider in self.txnsb.escrowdb.getIoItemIter())
+            stat["buckets"], stat["total"] = basing.ageHistogram(
+                (dater.datetime for dater in daters if dater is not None), now=now)
+
+        return stats
+
     @property
     def tevers(self):
         """ Returns .db.kevers
@@ -267,6 +310,10 @@ class Reger(dbing.LMDBer):
         self.subjs = subing.CesrDupSuber(db=self, subkey='subjs.', klas=coring.Saider)
         # Index of credentials by schema
         self.schms = subing.CesrDupSuber(db=self, subkey='schms.', klas=coring.Saider)
+        # Index of credentials by issuer then schema, keys (issuer, schema, said)
+        self.isch = subing.CesrSuber(db=self, subkey='isch.', klas=coring.Saider)
+        # Index of credentials by subject then schema, keys (subject, schema, said)
+        self.ssch = subing.CesrSuber(db=self, subkey='ssch.', klas=coring.Saider)
 
         # Partially signed credential escrow
         self.pse = subing.CesrSuber(db=self, subkey='pse.', klas=coring.Dater)
@@ -315,52 +362,149 @@ class Reger(dbing.LMDBer):
         # Completed Credentials
         self.ccrd = proving.CrederSuber(db=self, subkey="ccrd.")
 
+        with self.env.begin() as txn:  # saved before composite indices existed
+            reindex = (not txn.stat(self.isch.sdb)["entries"] and
+                       txn.stat(self.saved.sdb)["entries"])
+        if reindex and not self.readonly:
+            self.reindexCreds()
+
         return self.env
 
-    def cloneCreds(self, saids):
+    def indexCred(self, creder):
+        """ Add saved credential creder to the issuer, subject and schema indices
+
+        Parameters:
+            creder (Creder): saved credential
+
+        """
+        saider = creder.saider
+        self.issus.add(keys=creder.issuer, val=saider)
+        self.schms.add(keys=creder.schema, val=saider)
+        self.isch.pin(keys=(creder.issuer, creder.schema, saider.qb64), val=saider)
+
+        if 'i' in creder.subject:
+            subject = creder.subject["i"]
+            self.subjs.add(keys=subject, val=saider)
+            self.ssch.pin(keys=(subject, creder.schema, saider.qb64), val=saider)
+
+    def reindexCreds(self):
+        """ Rebuild credential indices from all saved credentials in one transaction
+
+        Returns:
+            int: number of credentials indexed
+
+        """
+        count = 0
+        with self.transact():
+            for (said,), saider in self.saved.getItemIter():
+                if (creder := self.creds.get(keys=(said,))) is None:
+                    continue
+                self.indexCred(creder)
+                count += 1
+        return count
+
+    def credsIter(self, pre, *, issued=True, schema=None, after=None):
+        """ Returns iterator of Saider of saved credentials of pre in index order
+
+        Credentials are ordered by schema then SAID so listing may resume after
+        the last SAID returned by a previous page without rescanning.
+
+        Parameters:
+            pre (str): qb64 identifier prefix of issuer or subject
+            issued (bool): True means credentials issued by pre. False means
+                credentials with pre as subject
+            schema (str | None): qb64 SAID of schema to filter by
+            after (str | None): qb64 SAID of credential to resume listing after
+
+        Raises:
+            MissingEntryError: when after is not a saved credential
+
+        """
+        suber = self.isch if issued else self.ssch
+        keys = (pre, schema, "") if schema is not None else (pre, "")
+        top = suber._tokey(keys)
+        start = top
+        if after is not None:
+            creder = self.creds.get(keys=(after,))
+            if creder is None:
+                raise kering.MissingEntryError(f"Missing credential said={after}.")
+            start = suber._tokey((pre, creder.schema, after)) + b'\x00'  # just past after
+
+        with self._trans(db=suber.sdb) as txn:
+            cursor = txn.cursor()
+            if cursor.set_range(start):
+                for key, val in cursor.iternext():
+                    if not bytes(key).startswith(top):
+                        break
+                    yield coring.Saider(qb64b=bytes(val))
+
+    def cloneCreds(self, saids, expand=True):
         """ Returns fully expanded credential with chained credentials attached.
 
+        Chains form a DAG so a credential shared by many descendants, such as the
+        QVI credential of every vLEI credential it issued, is expanded once per
+        call and read from the database once while it stays in .credCache.
+
         Parameters:
            saids (list): of Saider objects:
+           expand (bool): True means expand chained credentials in full. False
+               means chains is list of qb64 SAIDs of chained credentials
 
         Returns:
             list: fully hydrated credentials with full chains provided
 
         """
-        creds = []
-        for saider in saids:
-            key = saider.qb64
-            creder, sadsigers, sadcigars = self.cloneCred(said=key)
+        memo = dict()  # expanded credentials of this call keyed by SAID
+        return [self._expandCred(saider.qb64, memo, expand) for saider in saids]
 
-            chainSaids = []
-            for k, p in creder.chains.items():
-                if k == "d":
-                    continue
+    def _expandCred(self, said, memo, expand):
+        """ Returns credential dict of said with chains expanded using memo """
+        if said in memo:
+            return memo[said]
 
-                if not isinstance(p, dict):
-                    continue
+        cred = dict(self._loadCred(said))
+        if expand:
+            cred["chains"] = [self._expandCred(csaid, memo, expand) for csaid in cred["chains"]]
+        else:
+            cred["chains"] = list(cred["chains"])
+        memo[said] = cred
+        return cred
+
+    def _loadCred(self, said):
+        """ Returns cached credential dict of said with SAIDs of its chains """
+        if (cred := self.credCache.get(said)) is not None:
+            return cred
 
-                chainSaids.append(coring.Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids)
-
-            regk = creder.status
-            status = self.tevers[regk].vcState(saider.qb64)
-            cred = dict(
-                sad=creder.crd,
-                pre=creder.issuer,
-                sadsigers=[dict(
-                    path=pather.bext,
-                    pre=prefixer.qb64,
-                    sn=seqner.sn,
-                    d=saider.qb64
-                ) for (pather, prefixer, seqner, saider, sigers) in sadsigers],
-                sadcigars=[dict(path=pather.bext, cigar=cigar.qb64) for (pather, cigar) in sadcigars],
-                chains=chains,
-                status=status.ked,
-            )
-
-            creds.append(cred)
-        return creds
+        creder, sadsigers, sadcigars = self.cloneCred(said=said)
+
+        chains = []
+        for k, p in creder.chains.items():
+            if k == "d":
+                continue
+
+            if not isinstance(p, dict):
+                continue
+
+            chains.append(p["n"])
+
+        regk = creder.status
+        status = self.tevers[regk].vcState(said)
+        cred = dict(
+            sad=creder.crd,
+            pre=creder.issuer,
+            sadsigers=[dict(
+                path=pather.bext,
+                pre=prefixer.qb64,
+                sn=seqner.sn,
+                d=saider.qb64
+            ) for (pather, prefixer, seqner, saider, sigers) in sadsigers],
+            sadcigars=[dict(path=pather.bext, cigar=cigar.qb64) for (pather, cigar) in sadcigars],
+            chains=tuple(chains),
+            status=status.ked,
+        )
+
+        self.credCache.put(said, cred)
+        return cred
 
     def logCred(self, creder, sadsigers=None, sadcigars=None):
         """ Save the base credential and seals (est evt+sigs quad) with no indices.
@@ -483,17 +627,20 @@ class Reger(dbing.LMDBer):
             msg.extend(atc)
             yield msg
 
-    def sources(self, db, creder):
+    def sources(self, db, creder, memo=None):
         """ Returns raw bytes of any source ('e') credential that is in our database
 
         Parameters:
             db (LMDBer): table to search
             creder (Creder): root credential
+            memo (dict | None): sources already resolved keyed by SAID so that
+                a source shared by many chains is read once
 
         Returns:
             list: credential sources as resolved from `e` in creder.crd
 
         """
+        memo = memo if memo is not None else dict()
         chains = creder.chains
         saids = []
         for key, source in chains.items():
@@ -507,12 +654,13 @@ class Reger(dbing.LMDBer):
 
         sources = []
         for said in saids:
-            screder, sadsigers, sadcigars = self.cloneCred(said=said)
+            if said not in memo:
+                screder, sadsigers, sadcigars = self.cloneCred(said=said)
 
-            craw = signing.provision(serder=screder, sadsigers=sadsigers, sadcigars=sadcigars)
-            del craw[screder.size:]
-            sources.append((screder, craw))
-            sources.extend(self.sources(db, screder))
+                craw = signing.provision(serder=screder, sadsigers=sadsigers, sadcigars=sadcigars)
+                del craw[screder.size:]
+                memo[said] = [(screder, craw)] + self.sources(db, screder, memo=memo)
+            sources.extend(memo[said])
 
         return sources
 
@@ -551,6 +699,11 @@ class Reger(dbing.LMDBer):
         """
         return self.delVal(self.tvts, key)
 
+    def _dropCred(self, key):
+        """ Drop cached clone of credential whose TEL changes at snKey key """
+        pre, _ = dbing.splitKeyON(key)
+        self.credCache.pop(pre.decode("utf-8") if hasattr(pre, "decode") else pre)
+
     def putTel(self, key, val):
         """
         Use snKey()
@@ -559,6 +712,7 @@ class Reger(dbing.LMDBer):
         Returns True If val successfully written Else False
         Return False if key already exists
         """
+        self._dropCred(key)
         return self.putVal(self.tels, key, val)
 
     def setTel(self, key, val):
@@ -568,6 +722,7 @@ class Reger(dbing.LMDBer):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
+        self._dropCred(key)
         return self.setVal(self.tels, key, val)
 
     def getTel(self, key):
@@ -584,6 +739,7 @@ class Reger(dbing.LMDBer):
         Deletes value at key.
         Returns True If key exists in database Else False
         """
+        self._dropCred(key)
         return self.delVal(self.tels, key)
 
     def getTelItemPreIter(self, pre, fn=0):
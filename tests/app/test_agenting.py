@@ -5,13 +5,15 @@ tests.app.agenting module
 """
 import time
 
+import falcon
 from hio.base import doing, tyming
+from hio.core import http
 
 from keri import kering
 from keri.core import coring
 from keri.core.coring import Counter, CtrDex, Seqner
 from keri.help import nowIso8601
-from keri.app import habbing, indirecting, agenting, directing
+from keri.app import habbing, indirecting, agenting, directing, httping
 from keri.db import dbing
 from keri.vdr import eventing, viring
 
@@ -84,6 +86,14 @@ class ReceiptDoer(doing.DoDoer):
                 break
             yield self.tock
 
+        # receipted event driven by stored wigs with latencies of each witness
+        while not witDoer.cues:
+            yield self.tock
+        assert witDoer.cues.popleft() == dict(pre=palHab.pre)
+        assert set(witDoer.latencies) == {self.wanHab.pre, self.wilHab.pre}
+        assert all(meter[0] == 1 for meter in witDoer.latencies.values())
+        assert not self.hby.db.wigNotifier.watches
+
         # Controller should send endpoints between witnesses.  Check for Endpoints for each other:
         keys = (self.wanHab.pre, kering.Schemes.tcp)
         said = self.wilHab.db.lans.get(keys=keys)
@@ -108,10 +118,96 @@ class ReceiptDoer(doing.DoDoer):
                 break
             yield self.tock
 
+        assert self.wesHab.pre in witDoer.latencies
+        assert not witDoer.failed
+
         self.remove([witDoer])
         return True
 
 
+def test_witness_receiptor_timeout(seeder):
+    with habbing.openHby(name="wan", salt=coring.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
+            habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+
+        wanHab = wanHby.makeHab(name="wan", transferable=False)  # witness not running
+        seeder.seedWitEnds(palHby.db, witHabs=[wanHab], protocols=[kering.Schemes.tcp])
+        palHab = palHby.makeHab(name="pal", wits=[wanHab.pre], transferable=True)
+
+        assert agenting.WitnessReceiptor(hby=palHby).timeout is None  # callers only watch cues
+        witDoer = agenting.WitnessReceiptor(hby=palHby, timeout=0.25)
+        witDoer.msgs.append(dict(pre=palHab.pre))
+
+        tock = 0.03125
+        doist = doing.Doist(limit=2.0, tock=tock, real=True)
+        doist.do(doers=[witDoer])
+
+        assert not witDoer.cues
+        assert witDoer.failed.popleft() == dict(pre=palHab.pre)
+        assert witDoer.timeouts == {wanHab.pre: 1}
+        assert witDoer.latencies == {}
+        assert not witDoer.witers  # pool released after linger
+        assert not palHby.db.wigNotifier.watches
+
+
+def test_receiptor_batch_fallback():
+    class UnbatchedEnd:  # accepts only one message per request
+        def __init__(self):
+            self.refused = 0
+            self.msgs = []
+
+        def on_post(self, req, rep):
+            if req.content_type != httping.CESR_CONTENT_TYPE:
+                self.refused += 1
+                rep.status = falcon.HTTP_406
+                return
+            cr = httping.parseCesrHttpRequest(req=req)
+            self.msgs.append(cr.payload["s"])
+            rep.status = falcon.HTTP_204
+
+    with habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+        palHab = palHby.makeHab(name="pal")
+        palHab.interact()
+        msgs = bytearray()
+        for fmsg in palHby.db.clonePreIter(pre=palHab.pre):
+            msgs.extend(fmsg)
+
+        end = UnbatchedEnd()
+        app = falcon.App()
+        app.add_route("/", end)
+        server = http.Server(port=5678, app=app)
+        serverDoer = http.ServerDoer(server=server)
+
+        receiptor = agenting.Receiptor(hby=palHby, batched=True)
+        client, clientDoer = palHby.pool.lease("http://127.0.0.1:5678/")
+        reps = []
+
+        def postDo(tymth=None, tock=0.0):
+            yield tock
+            reps.extend((yield from receiptor.post(client, "wit", msgs)))
+            reps.extend((yield from receiptor.post(client, "wit", msgs)))
+            return True
+
+        doist = doing.Doist(limit=2.0, tock=0.03125, real=True)
+        doist.do(doers=[serverDoer, clientDoer, receiptor, doing.doify(postDo)])
+
+        assert end.refused == 1  # one batch then one request per message
+        assert not receiptor.batched
+        assert end.msgs == ["0", "1", "0", "1"]
+        assert [rep.status for rep in reps] == [204, 204, 204, 204]
+
+        # batching configured for habery
+        assert not agenting.Receiptor(hby=palHby).batched
+        palHby.cf.put(dict(batched=True))
+        palHby.reconfigure()
+        assert palHby.batched
+        assert agenting.Receiptor(hby=palHby).batched
+        witDoer = agenting.WitnessReceiptor(hby=palHby)
+        assert witDoer.batched
+        witer = agenting.messengerFrom(hab=palHab, pre=palHab.pre, batched=witDoer.batched,
+                                       urls={kering.Schemes.http: "http://127.0.0.1:5678/"})
+        assert witer.batched
+
+
 def test_witness_sender(seeder):
     with habbing.openHby(name="wan", salt=coring.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
             habbing.openHby(name="wil", salt=coring.Salter(raw=b'will-the-witness').qb64) as wilHby, \
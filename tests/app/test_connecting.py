@@ -143,6 +143,49 @@ def test_organizer():
                      'state': 'NJ',
                      'zip': '08807'}
 
+        # indexed substring and case insensitive search
+        assert set(org.search(field="company", val="gle")) == {jen, ken, sal, wil}
+        assert set(org.search(field="company", val="EIF")) == {jen, ken, sal, wil}
+        assert set(org.search(field="address", val="ave.")) == {ken}
+        assert set(org.search(field="address", val="st")) == {joe, bob, jen}
+        assert set(org.search(field="company")) == {ken, jen, wil, sal, joe, bob}
+        assert org.search(field="company", val="GLEIFX") == []
+        assert org.values(field="address", val="st.") == ["9934 Glen Creek St.", "37 East Shadow Brook St."]
+        assert org.values(field="city") == ["Bridgewater", "Henderson", "Lake Charles", "Lawrence", "Norwich",
+                                            "Sebastian"]
+
+        org.set(pre=ken, field="company", val="Provenant")
+        assert set(org.search(field="company", val="gleif")) == {jen, sal, wil}
+        assert set(org.search(field="company", val="nant")) == {ken}
+        org.unset(pre=ken, field="company")
+        assert org.search(field="company", val="nant") == []
+        long = "x" * 300 + "Needle"
+        org.update(pre=ken, data=dict(note=long))
+        assert set(org.search(field="note", val="X" * 40)) == {ken}
+        assert set(org.search(field="note", val="x" * 40 + "needle")) == {ken}
+        assert org.search(field="note", val="x" * 40 + "pin") == []
+        assert org.values(field="note") == [long]
+
+        # scan does not match across separator into next key segment
+        org.update(pre=ken, data=dict(tag="x"))
+        assert org.search(field="tag", val="x") == [ken]
+        assert org.search(field="tag", val="x.") == []
+        org.unset(pre=ken, field="tag")
+        assert org.search(field="tag") == []
+
+        # rebuild indices only when not marked current
+        hby.db.cfvx.trim()
+        hby.db.cfsx.trim()
+        assert org.search(field="company") == []
+        org = connecting.Organizer(hby=hby)
+        assert org.search(field="company") == []
+        hby.db.hbys.rem(connecting.Organizer.IndexKey)  # saved before indices existed
+        org = connecting.Organizer(hby=hby)
+        assert hby.db.hbys.get(connecting.Organizer.IndexKey) == connecting.Organizer.IndexVersion
+        assert set(org.search(field="company", val="gleif")) == {jen, sal, wil}
+        org.update(pre=ken, data=dict(company="GLEIF"))
+        org.unset(pre=ken, field="note")
+
         # Update the Jen's data signature by signing garbage
         nonce = coring.randomNonce()
         cigar = hby.signator.sign(ser=nonce.encode("utf-8"))
@@ -425,6 +425,7 @@ def test_make_load_hab_with_habery():
         assert bobHab.pre in hby.prefixes
 
         assert len(hby.habs) == 2
+        assert sueHab.pool is bobHab.pool is hby.pool  # connections shared
 
 
     assert not hby.cf.opened
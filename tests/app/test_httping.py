@@ -8,6 +8,7 @@ import falcon
 import pytest
 from falcon.testing import helpers
 
+from keri import kering
 from keri.app import habbing, httping
 from keri.core import coring
 from keri.vdr import credentialing, verifying
@@ -195,5 +196,65 @@ def test_stream_cesr_request(mockHelpingNowUTC):
                                               b'jIu5ZwJILbL2bcID')
 
 
+def test_batch_cesr_request(mockHelpingNowUTC):
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
+        wit = "BGKVzj4ve0VSd8z_AmvhLg4lqcC_9WYX90k03q-R_Ydo"
+
+        msgs = hab.query(pre=hab.pre, src=wit, route="logs", query=dict(s=0))
+        msgs.extend(hab.makeOwnEvent(sn=0))
+        for sn in range(1, 4):
+            msgs.extend(hab.interact())
+        stream = bytes(msgs)
+
+        bounds = list(httping.splitCESRStream(stream))
+        assert len(bounds) == 5
+        assert bounds[0][0] == 0
+        assert bounds[-1][2] == len(stream)
+        for start, split, end in bounds:
+            serder = coring.Sadder(raw=stream[start:split])
+            assert serder.size == split - start
+            assert stream[split:end].startswith(b'-')  # attachments follow body
+
+        client = MockClient()
+        assert httping.batchCESRRequests(client, msgs, dest=wit) == 1
+        assert not msgs  # consumed
+        args = client.args.pop()
+        assert args["method"] == "POST"
+        assert args["path"] == "/"
+        assert args["body"] == stream
+        headers = args["headers"]
+        assert headers["Content-Type"] == "application/cesr"
+        assert headers["Content-Length"] == len(stream)
+        assert headers["CESR-DESTINATION"] == wit
+        assert "CESR-ATTACHMENT" not in headers
+
+        # batches split on message boundaries only
+        size = bounds[2][2]  # first three messages fit in a batch
+        client = MockClient()
+        assert httping.batchCESRRequests(client, bytearray(stream), dest=wit, size=size) == 2
+        assert [args["body"] for args in client.args] == [stream[:size], stream[size:]]
+
+        client = MockClient()
+        assert httping.batchCESRRequests(client, bytearray(stream), dest=wit, size=1) == 5
+        assert b"".join(args["body"] for args in client.args) == stream
+
+        with pytest.raises(kering.ExtractionError):
+            httping.batchCESRRequests(client, bytearray(stream[:-len(stream) // 2]), dest=wit)
+
+        req = helpers.create_req(headers=dict(Content_Type=httping.CESR_BATCH_CONTENT_TYPE),
+                                 body=stream)
+        assert httping.parseCesrHttpBatch(req=req) == stream
+
+        req = helpers.create_req(headers=dict(Content_Type=httping.CESR_BATCH_CONTENT_TYPE),
+                                 body=b'')
+        with pytest.raises(falcon.HTTPError):
+            httping.parseCesrHttpBatch(req=req)
+
+        req = helpers.create_req(headers=dict(Content_Type=httping.CESR_CONTENT_TYPE),
+                                 body=stream)
+        with pytest.raises(falcon.HTTPError):
+            httping.parseCesrHttpBatch(req=req)
+
+
 if __name__ == '__main__':
     test_parse_cesr_request()
@@ -5,11 +5,14 @@ tests.app.indirecting module
 """
 import json
 
+import falcon
 import pytest
+from falcon import testing
 from hio.help import decking
 
-from keri.app import indirecting, storing, habbing
-from keri.core import coring
+from keri.app import indirecting, storing, habbing, httping
+from keri.core import coring, eventing, parsing
+from keri.db import basing
 
 
 def test_mailbox_iter():
@@ -61,10 +64,25 @@ def test_mailbox_iter():
     val = next(mbi)
     assert val == b''
 
+    # Unchanged topics are not rescanned
+    scanned = []
+    cloneTopicIter = mbx.cloneTopicIter
+    mbx.cloneTopicIter = lambda topic, fn=0: scanned.append(topic) or cloneTopicIter(topic, fn)
+    val = next(mbi)
+    assert val == b''
+    assert scanned == []
+    mbx.storeMsg(topic=f"{pre}/multisig", msg=json.dumps(msg).encode("utf-8"))
+    val = next(mbi)
+    assert val.startswith(b'id: 1\nevent: /multisig\n')
+    assert scanned == [f"{pre}/multisig"]
+    del mbx.cloneTopicIter
+
     mb.TimeoutMBX = 0  # Force the iter to timeout
 
     with pytest.raises(StopIteration):
         next(mbi)
+    assert mb.sub is None
+    assert mbx.subs == {}
 
 
 def test_mailbox_multiple_iter():
@@ -149,6 +167,111 @@ def test_qrymailbox_iter():
             next(mbi)
 
 
+
+def test_http_end_batch():
+    with habbing.openHab(name="ctrl", transferable=True, temp=True) as (ctrlHby, ctrlHab), \
+            habbing.openHab(name="wit", transferable=False, temp=True) as (witHby, witHab):
+        for _ in range(3):
+            ctrlHab.interact()
+        msgs = bytearray()
+        for msg in ctrlHab.db.clonePreIter(pre=ctrlHab.pre):
+            msgs.extend(msg)
+        stream = bytes(msgs)
+
+        kvy = eventing.Kevery(db=witHab.db, lax=False, local=False)
+        parser = parsing.Parser(framed=True, kvy=kvy)
+        app = falcon.App()
+        app.add_route("/", indirecting.HttpEnd(rxbs=parser.ims))
+        client = testing.TestClient(app=app)
+
+        rep = client.simulate_post("/", body=stream,
+                                   headers={"Content-Type": httping.CESR_BATCH_CONTENT_TYPE})
+        assert rep.status == falcon.HTTP_204
+        assert parser.ims == stream  # fed as is to parser
+
+        parser.parse()
+        assert ctrlHab.pre in kvy.kevers
+        assert kvy.kevers[ctrlHab.pre].sn == 3
+
+        rep = client.simulate_post("/", body=b'\x00garbage',
+                                   headers={"Content-Type": httping.CESR_BATCH_CONTENT_TYPE})
+        assert rep.status == falcon.HTTP_400
+        assert not parser.ims
+
+
+def test_witness_viewed():
+    with habbing.openHab(name="ctrl", transferable=True, temp=True) as (ctrlHby, ctrlHab), \
+            habbing.openHby(name="wyatt", salt=coring.Salter(raw=b'wess-the-witness').qb64, temp=True) as hby:
+        for _ in range(3):
+            ctrlHab.interact()
+        msgs = bytearray()
+        for msg in ctrlHab.db.clonePreIter(pre=ctrlHab.pre):
+            msgs.extend(msg)
+
+        doers = indirecting.setupWitness(alias="wyatt", hby=hby, tcpPort=None, httpPort=5644)
+        witStart = [doer for doer in doers if isinstance(doer, indirecting.WitnessStart)][0]
+        parser = witStart.parser
+        assert parser.viewed
+        assert isinstance(parser.ims, parsing.ViewStream)
+
+        app = falcon.App()
+        app.add_route("/", indirecting.HttpEnd(rxbs=parser.ims))
+        client = testing.TestClient(app=app)
+        rep = client.simulate_post("/", body=bytes(msgs),
+                                   headers={"Content-Type": httping.CESR_BATCH_CONTENT_TYPE})
+        assert rep.status == falcon.HTTP_204
+        assert len(parser.ims) == len(msgs)
+
+        parser.parse()
+        assert not parser.ims
+        assert witStart.kvy.kevers[ctrlHab.pre].sn == 3
+
+        mbd = indirecting.MailboxDirector(hby=hby, topics=["/receipt"])
+        assert mbd.parser.viewed
+        assert mbd.parser.ims is mbd.ims
+        assert isinstance(mbd.ims, parsing.ViewStream)
+
+        for doer in doers:
+            if isinstance(doer, basing.BaserDoer):
+                doer.baser.close(clear=True)
+
+
+def test_witness_mailbox_config():
+    with habbing.openHby(name="wendy", salt=coring.Salter(raw=b'wess-the-witness').qb64, temp=True) as hby:
+        hby.cf.put(dict(mailbox=dict(count=10, topics={"/receipt": dict(count=1)})))
+        doers = indirecting.setupWitness(alias="wendy", hby=hby, tcpPort=None, httpPort=5644)
+        compactors = [doer for doer in doers if isinstance(doer, storing.MailboxCompactor)]
+        assert len(compactors) == 1
+        mbx = compactors[0].mbx
+        assert mbx.policy == storing.RetentionPolicy(count=10)
+        assert mbx.policyFor(b"pre/receipt") == storing.RetentionPolicy(count=1)
+
+        for i in range(3):
+            mbx.storeMsg(topic=b"pre/receipt", msg=f"r{i}".encode("utf-8"))
+        mbx.compact()
+
+        app = falcon.App()
+        app.add_route("/mailboxes/metrics", indirecting.MailboxEnd(mbx=mbx, compactor=compactors[0]),
+                      suffix="metrics")
+        client = testing.TestClient(app=app)
+        rep = client.simulate_get("/mailboxes/metrics")
+        assert rep.status == falcon.HTTP_200
+        assert rep.headers["Content-Type"].startswith("text/plain")
+        assert 'keri_mailbox_messages{pre="pre"} 1\n' in rep.text
+        assert "keri_mailbox_removed_total 0\n" in rep.text
+        mbx.close(clear=True)
+        for doer in doers:
+            if isinstance(doer, basing.BaserDoer):
+                doer.baser.close(clear=True)
+
+    with habbing.openHby(name="wanda", salt=coring.Salter(raw=b'wann-the-witness').qb64, temp=True) as hby:
+        doers = indirecting.setupWitness(alias="wanda", hby=hby, tcpPort=None, httpPort=5642)
+        assert not [doer for doer in doers if isinstance(doer, storing.MailboxCompactor)]
+        for doer in doers:
+            if isinstance(doer, basing.BaserDoer):
+                doer.baser.close(clear=True)
+
+
 if __name__ == "__main__":
     test_mailbox_iter()
     test_qrymailbox_iter()
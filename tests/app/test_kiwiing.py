@@ -134,6 +134,22 @@ def test_credential_handlers(mockHelpingNowUTC, seeder):
         state = result.json[0]["status"]
         assert state["et"] == coring.Ilks.rev
 
+        # paginated
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", schema=schema, limit="1",
+                                                                           chains="refs"))
+        assert result.status == falcon.HTTP_200
+        assert [cred["sad"]["d"] for cred in result.json] == [creder.said]
+        assert result.json[0]["chains"] == []
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", after=creder.said))
+        assert result.status == falcon.HTTP_200
+        assert result.json == []
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", after=schema))
+        assert result.status == falcon.HTTP_400  # not a credential
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", limit="many"))
+        assert result.status == falcon.HTTP_400
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", limit="-1"))
+        assert result.status == falcon.HTTP_400
+
 
 def test_identifier_ends():
     with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
@@ -825,6 +841,20 @@ def test_keystate_end():
         kel = result.json["kel"]
         assert len(kel) == 1
 
+        # escrowed event missing is rejected before response starts
+        key = dbing.snKey(pre=hab.pre, sn=1)
+        dig = coring.Diger(ser=b"missing").qb64b
+        hby.db.addPse(key, dig)
+        result = client.simulate_get(path=f"/keystate/{hab.pre}")
+        assert result.status == falcon.HTTP_400
+
+        # and ends streamed KEL well formed once response started
+        ksEnd = kiwiing.KeyStateEnd(hby=hby, counselor=counselor)
+        body = json.loads(b"".join(ksEnd.keyStateIter(hab.kever)))
+        assert len(body["kel"]) == 1
+        assert body["error"] == f"Missing event for dig={dig}."
+        hby.db.delPse(key, dig)
+
         # Ask for event with a bad public key
         result = client.simulate_get(path=f"/keystate/pubkey/{state['n'][0]}")
         assert result.status == falcon.HTTP_404
@@ -1070,6 +1100,24 @@ def test_escrow_end(mockHelpingNowUTC):
         assert len(response.json) == 1
         assert len(response.json['likely-duplicitous-events']) == 0
 
+        response = client.simulate_get("/escrows/metrics")
+        assert response.status == falcon.HTTP_200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        lines = response.text.splitlines()
+        assert 'keri_escrow_entries{log="kel",escrow="ldes"} 1' in lines
+        assert 'keri_escrow_entries{log="kel",escrow="pses"} 0' in lines
+        assert 'keri_escrow_entries{log="tel",escrow="mre"} 0' in lines
+        assert 'keri_escrow_age_seconds_count{log="kel",escrow="ldes"} 1' in lines
+        assert f'keri_kever_cache_entries {len(hby.db.kevers)}' in lines
+        assert f'keri_kever_cache_evictions_total {hby.db.kevers.evictions}' in lines
+
+        kvy.processEscrows()
+        response = client.simulate_get("/escrows/metrics?ages=false")
+        assert response.status == falcon.HTTP_200
+        assert "keri_escrow_age_seconds" not in response.text
+        lines = response.text.splitlines()
+        assert 'keri_escrow_pass_seconds_count{processor="Kevery.processEscrowDuplicitous"} 1' in lines
+
 
 def test_presentation_ends(seeder, mockCoringRandomNonce, mockHelpingNowIso8601):
     with habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby, \
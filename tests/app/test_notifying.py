@@ -166,6 +166,61 @@ def test_noter():
     assert len(res) == 5
 
 
+def test_noter_indices():
+    cig = coring.Cigar(qb64="AABr1EJXI1sTuI51TXo4F1JjxIJzwPeCxa-Cfbboi7F4Y4GatPEvK629M7G_5c86_Ssvwg8POZWNMV-WreVqBECw")
+    noter = notifying.Noter(temp=True)
+    dt = helping.fromIso8601("2022-07-08T15:01:05.453632")
+
+    rids = []
+    for i in range(6):
+        route = "/multisig/icp" if i % 2 else "/multisig/rot"
+        note = notifying.notice(attrs=dict(r=route, i=i), dt=dt + datetime.timedelta(seconds=i))
+        assert noter.add(note, cig) is True
+        rids.append(note.rid)
+
+    assert noter.cntNotes() == 6
+    assert noter.cntNotes(unread=True) == 6
+
+    # keyset pagination
+    page = noter.getNotes(limit=4)
+    assert [note.attrs["i"] for note, _ in page] == [0, 1, 2, 3]
+    page = noter.getNotes(limit=4, after=page[-1][0].rid)
+    assert [note.attrs["i"] for note, _ in page] == [4, 5]
+
+    # mark as read updates unread index
+    for rid in rids[:3]:
+        note, _ = noter.get(rid)
+        note.read = True
+        assert noter.update(note, cig) is True
+    assert noter.cntNotes() == 6
+    assert noter.cntNotes(unread=True) == 3
+    assert [note.attrs["i"] for note, _ in noter.getNotes(unread=True)] == [3, 4, 5]
+    assert [note.attrs["i"] for note, _ in noter.getNotes(unread=True, limit=1,
+                                                           after=rids[3])] == [4]
+
+    # route index
+    assert [note.attrs["i"] for note, _ in noter.getNotes(route="/multisig/icp")] == [1, 3, 5]
+    assert [note.attrs["i"] for note, _ in noter.getNotes(route="/multisig/icp",
+                                                           after=rids[1])] == [3, 5]
+    assert [note.attrs["i"] for note, _ in noter.getNotes(route="/multisig/icp",
+                                                           unread=True)] == [3, 5]
+    assert noter.getNotes(route="/multisig") == []
+
+    assert noter.rem(rids[5]) is True
+    assert noter.cntNotes() == 5
+    assert noter.cntNotes(unread=True) == 2
+    assert [note.attrs["i"] for note, _ in noter.getNotes(route="/multisig/icp")] == [1, 3]
+
+    # indices rebuilt from notes
+    noter.nurd.trim()
+    noter.nrte.trim()
+    assert noter.reindex() == 5
+    assert noter.cntNotes(unread=True) == 2
+    assert [note.attrs["i"] for note, _ in noter.getNotes(route="/multisig/rot")] == [0, 2, 4]
+
+    noter.close(clear=True)
+
+
 def test_notifier():
     with habbing.openHby(name="test") as hby:
         notifier = notifying.Notifier(hby=hby)
@@ -173,6 +228,8 @@ def test_notifier():
         assert notifier.noter is not None
 
         assert notifier.add(attrs=dict(a=1, b=2, c=3)) is True
+        assert notifier.cntNotes() == 1
+        assert notifier.cntNotes(unread=True) == 1
         notes = notifier.getNotes()
         assert len(notes) == 1
         note = notes[0]
@@ -191,6 +248,8 @@ def test_notifier():
         assert notifier.mar(note.rid) is True
         note = notifier.getNotes()[0]
         assert note.read is True
+        assert notifier.cntNotes(unread=True) == 0
+        assert notifier.getNotes(unread=True) == []
         assert notifier.mar(note.rid) is False
 
         assert notifier.rem('ABC') is False
@@ -0,0 +1,97 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.pooling module
+
+"""
+import falcon
+from hio.base import doing
+from hio.core import http
+
+from keri.app import pooling
+
+
+def test_client_pool():
+    class EchoEnd:
+        def on_get(self, req, rep):
+            rep.status = falcon.HTTP_200
+            rep.data = req.get_param("name").encode("utf-8")
+
+    app = falcon.App()
+    app.add_route("/echo", EchoEnd())
+    server = http.Server(port=5677, app=app)
+    serverDoer = http.ServerDoer(server=server)
+
+    pool = pooling.ClientPool(maxConnections=1)
+    assert pool.timeout == pooling.ClientPool.TimeoutIdle
+    url = "http://127.0.0.1:5677/echo"
+    assert pool.keyed(url) == ("http", "127.0.0.1", 5677)
+    assert pool.keyed("https://witness.example.com/receipts") == ("https", "witness.example.com", 443)
+
+    class Getter(doing.DoDoer):
+        def __init__(self):
+            self.clients = []
+            self.bodies = []
+            super(Getter, self).__init__(doers=[doing.doify(self.getDo)])
+
+        def get(self, client, name):
+            client.request(method="GET", path="/echo", qargs=dict(name=name))
+            while not client.responses:
+                yield self.tock
+            self.bodies.append(bytes(client.respond().body))
+
+        def getDo(self, tymth=None, tock=0.0):
+            self.wind(tymth)
+            self.tock = tock
+            yield self.tock
+
+            client, clientDoer = pool.lease(url)  # new pooled connection
+            assert isinstance(clientDoer, pooling.PooledClientDoer)
+            self.extend([clientDoer])
+            yield from self.get(client, "one")
+
+            other, otherDoer = pool.lease(url)  # over limit so not pooled
+            assert not isinstance(otherDoer, pooling.PooledClientDoer)
+            self.extend([otherDoer])
+            yield from self.get(other, "two")
+            self.remove([clientDoer, otherDoer])
+            self.clients.append(client)
+
+            client, clientDoer = pool.lease(url)  # reuses open connection
+            assert clientDoer.reused
+            self.extend([clientDoer])
+            yield from self.get(client, "three")
+            self.remove([clientDoer])
+            self.clients.append(client)
+
+            client, clientDoer = pool.lease(url)
+            for ca in list(server.reqs):  # far side closes reused connection
+                server.closeConnection(ca)
+            self.extend([clientDoer])
+            yield from self.get(client, "four")  # sent again on new connection
+            self.remove([clientDoer])
+            self.clients.append(client)
+            return True
+
+    getter = Getter()
+    doist = doing.Doist(limit=2.0, tock=0.03125, real=True)
+    doist.do(doers=[serverDoer, getter])
+
+    assert getter.bodies == [b"one", b"two", b"three", b"four"]
+    assert getter.clients[0] is getter.clients[1] is getter.clients[2]
+    assert pool.created == 1
+    assert pool.reused == 2
+    assert pool.counts == {("http", "127.0.0.1", 5677): 1}
+    assert len(pool.idles[("http", "127.0.0.1", 5677)]) == 1
+
+    pool.timeout = 0.0  # idle connections evicted
+    pool.evict()
+    assert pool.evicted == 1
+    assert pool.idles == {}
+    assert pool.counts == {}
+
+    client, clientDoer = pool.lease(url)
+    client.request(method="GET", path="/echo")
+    pool.release(client)  # request in progress so closed not kept
+    assert pool.idles == {}
+    assert pool.counts == {}
+    pool.close()
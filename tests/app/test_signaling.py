@@ -7,6 +7,7 @@ import datetime
 import time
 
 import falcon
+import pytest
 from falcon import testing
 from hio.base import doing, tyming
 
@@ -100,6 +101,60 @@ def test_signaler():
     assert len(signaler.signals) == 2
 
 
+def test_signals():
+    signals = signaling.Signals(topicSize=3)
+    cursor = signals.cursor()
+    other = signals.cursor(topics=["/b"])
+
+    for i in range(5):
+        signals.append(signaling.signal(attrs=dict(a=i), topic="/a"))
+    signals.append(signaling.signal(attrs=dict(b=0), topic="/b", ckey="b"))
+    signals.append(signaling.signal(attrs=dict(b=1), topic="/b", ckey="b"))
+
+    # bounded per topic and coalesced by ckey
+    assert len(signals) == 4
+    assert [sig.attrs for sig in signals] == [dict(a=2), dict(a=3), dict(a=4), dict(b=1)]
+    assert signals.stats() == dict(signals=4, topics={"/a": 3, "/b": 1},
+                                   dropped=2, coalesced=1, expired=0)
+
+    # cursors read without consuming
+    assert [sig.attrs for sig in cursor.read()] == [dict(a=2), dict(a=3), dict(a=4), dict(b=1)]
+    assert cursor.missed == 2
+    assert cursor.read() == []
+    assert [sig.attrs for sig in other.read()] == [dict(b=1)]
+    assert len(signals) == 4
+
+    assert signals.popleft().attrs == dict(a=2)
+    signals.append(signaling.signal(attrs=dict(b=2), topic="/b", ckey="b"))
+    assert signals[-1].attrs == dict(b=2)
+    assert [sig.attrs for sig in cursor.read()] == []  # coalesced keeps position
+
+    # expire in date order
+    old = datetime.datetime.now() - datetime.timedelta(minutes=20)
+    signals.append(signaling.signal(attrs=dict(c=0), topic="/c", dt=old))
+    assert signals.expire(datetime.datetime.now() - datetime.timedelta(minutes=10)) == 1
+    assert signals.expired == 1
+    assert [sig.attrs for sig in signals] == [dict(a=3), dict(a=4), dict(b=2)]
+    assert cursor.read() == []
+    assert cursor.missed == 3
+
+    signals.clear()
+    assert not signals
+    with pytest.raises(IndexError):
+        signals.popleft()
+
+    # coalesce only within same topic
+    signals.append(signaling.signal(attrs=dict(a=0), topic="/a", ckey="k"))
+    signals.append(signaling.signal(attrs=dict(b=0), topic="/b", ckey="k"))
+    assert signals.coalesced == 2
+    assert signals.stats()["topics"] == {"/a": 1, "/b": 1}
+    assert signals.popleft().attrs == dict(a=0)
+    signals.append(signaling.signal(attrs=dict(b=1), topic="/b", ckey="k"))
+    assert signals.coalesced == 3
+    assert signals.popleft().attrs == dict(b=1)
+    assert not signals
+
+
 def test_signal_ends():
     app = falcon.App()
     signaler = signaling.Signaler()
@@ -3,15 +3,19 @@
 tests.peer.mailboxing
 
 """
+import datetime
 import os
 
 import lmdb
+from hio.base import doing
 
 from keri.app import keeping
 from keri.core import coring
 from keri.db import dbing, basing
 from keri.peer import exchanging
-from keri.app.storing import Mailboxer
+from keri.app.storing import (Mailboxer, MailboxCompactor, RetentionPolicy,
+                              retentionFrom, metricsText)
+from keri.help import helping
 
 
 def test_mailboxing():
@@ -109,6 +113,162 @@ def test_mailboxing():
         assert msgs[0][0] == 4
 
 
+def test_mailbox_subscription():
+    """
+    Test Mailboxer topic change subscriptions
+    """
+    mber = Mailboxer(temp=True)
+    sub = mber.subscribe(["pre/receipt", b"pre/challenge"])
+    assert sub.topics == {b"pre/receipt", b"pre/challenge"}
+    assert sub.pull() == {b"pre/receipt", b"pre/challenge"}  # backlog read first
+    assert sub.pull() == set()
+
+    mber.storeMsg(topic="pre/receipt", msg=b"a")
+    mber.storeMsg(topic="pre/receipt", msg=b"b")
+    mber.storeMsg(topic="pre/replay", msg=b"c")  # not subscribed
+    assert sub.pull() == {b"pre/receipt"}
+    assert sub.pull() == set()
+
+    other = mber.subscribe(["pre/challenge"])
+    other.pull()
+    mber.storeMsg(topic="pre/challenge", msg=b"d")
+    assert sub.pull() == {b"pre/challenge"}
+    assert other.pull() == {b"pre/challenge"}
+
+    sub.close()
+    assert b"pre/receipt" not in mber.subs
+    mber.storeMsg(topic="pre/challenge", msg=b"e")
+    assert sub.pull() == set()
+    assert other.pull() == {b"pre/challenge"}
+
+    del other  # abandoned subscriptions are dropped
+    mber.storeMsg(topic="pre/challenge", msg=b"f")
+    assert mber.subs == {}
+
+    mber.close(clear=True)
+
+
+
+def test_mailbox_retention():
+    """
+    Test Mailboxer retention policies, compaction and size metrics
+    """
+    mber = Mailboxer(temp=True)
+    for i in range(5):
+        mber.storeMsg(topic="pre/receipt", msg=f"r{i}".encode("utf-8"))
+    mber.storeMsg(topic="pre/challenge", msg=b"r0")  # same body as receipt 0
+    mber.storeMsg(topic="other/receipt", msg=b"o0")
+    assert mber.refs.get(keys=coring.Diger(ser=b"r0").qb64b) == "2"
+
+    assert mber.sizes() == {"pre": dict(topics=2, msgs=6, bytes=12),
+                            "other": dict(topics=1, msgs=1, bytes=2)}
+    assert list(mber.topicsIter()) == [b"other/receipt", b"pre/challenge", b"pre/receipt"]
+
+    assert mber.compact() == 0  # no policy retains forever
+
+    # by count keeps newest
+    mber.policies["/receipt"] = RetentionPolicy(count=2)
+    assert mber.compact(batch=2) == 3
+    assert [fn for fn, _, _ in mber.cloneTopicIter("pre/receipt")] == [3, 4]
+    assert mber.getTopicMsgs("pre/challenge") == [b"r0"]  # still referenced
+    assert mber.refs.get(keys=coring.Diger(ser=b"r0").qb64b) == "1"
+    assert mber.msgs.get(keys=coring.Diger(ser=b"r1").qb64b) is None
+
+    # by acknowledged index always retains newest
+    mber.policies["/receipt"] = RetentionPolicy(acked=True)
+    assert mber.ackTopic("pre/receipt", 10)
+    assert not mber.ackTopic("pre/receipt", 4)
+    assert mber.compact() == 1
+    assert [fn for fn, _, _ in mber.cloneTopicIter("pre/receipt")] == [4]
+    mber.storeMsg(topic="pre/receipt", msg=b"r5")  # index keeps increasing
+    assert [fn for fn, _, _ in mber.cloneTopicIter("pre/receipt")] == [4, 5]
+
+    # by age
+    mber.policy = RetentionPolicy(age=60.0)
+    mber.policies.clear()
+    assert mber.compact() == 0
+    later = helping.nowUTC() + datetime.timedelta(seconds=120)
+    assert list(mber.compactIter(now=later, batch=1)) == [1]  # pre/receipt
+    assert mber.msgs.get(keys=coring.Diger(ser=b"r0").qb64b) == "r0"
+    assert mber.sizes() == {"pre": dict(topics=2, msgs=2, bytes=4),
+                            "other": dict(topics=1, msgs=1, bytes=2)}
+
+    mber.close(clear=True)
+
+
+def test_mailbox_backfill():
+    """
+    Test Mailboxer backfills retention indices of messages stored without them
+    """
+    mber = Mailboxer(temp=True, policy=RetentionPolicy(age=60.0))
+    mber.storeMsg(topic="pre/receipt", msg=b"r0")
+    mber.storeMsg(topic="pre/receipt", msg=b"r1")
+    mber.storeMsg(topic="pre/challenge", msg=b"r0")
+    r0 = coring.Diger(ser=b"r0").qb64b
+    r1 = coring.Diger(ser=b"r1").qb64b
+
+    # stored before retention indices existed
+    assert mber.refs.remMany([r0, r1]) == 2
+    assert mber.dts.remMany([r0, r1]) == 2
+    mber.reopen(reuse=True)
+    assert mber.refs.get(keys=r0) == "2"
+    assert mber.refs.get(keys=r1) == "1"
+    assert mber.dts.get(keys=r0) is not None
+    assert mber.backfill() == 2  # idempotent
+
+    # unknown datetime is expired and unknown references keep message
+    mber.dts.rem(keys=r0)
+    mber.refs.rem(keys=r0)
+    assert mber.compact() == 1  # newest always retained
+    assert mber.getTopicMsgs("pre/receipt") == [b"r1"]
+    assert mber.getTopicMsgs("pre/challenge") == [b"r0"]  # body kept
+
+    mber.close(clear=True)
+
+
+def test_mailbox_compactor():
+    """
+    Test MailboxCompactor Doer
+    """
+    mber = Mailboxer(temp=True, policy=RetentionPolicy(count=1))
+    for i in range(3):
+        mber.storeMsg(topic="pre/receipt", msg=f"r{i}".encode("utf-8"))
+
+    compactor = MailboxCompactor(mbx=mber, batch=1)
+    doist = doing.Doist(limit=1.0, tock=0.03125, real=False)
+    doist.do(doers=[compactor])
+    assert compactor.removed == 2
+    assert compactor.metrics == {"pre": dict(topics=1, msgs=1, bytes=2)}
+
+    mber.close(clear=True)
+
+
+def test_mailbox_retention_config():
+    """
+    Test retentionFrom mailbox config parsing and mailbox metricsText
+    """
+    assert retentionFrom({}) == (None, {})
+
+    policy, policies = retentionFrom(dict(age=3600, count=10, topics={"/receipt": dict(count=1, acked=True)}))
+    assert policy == RetentionPolicy(age=3600, count=10)
+    assert policies == {"/receipt": RetentionPolicy(count=1, acked=True)}
+
+    policy, policies = retentionFrom(dict(topics={"/receipt": dict(age=60)}))
+    assert policy is None
+    assert policies == {"/receipt": RetentionPolicy(age=60)}
+
+    text = metricsText({"pre": dict(topics=1, msgs=2, bytes=4)}, removed=3)
+    assert 'keri_mailbox_topics{pre="pre"} 1\n' in text
+    assert 'keri_mailbox_messages{pre="pre"} 2\n' in text
+    assert 'keri_mailbox_bytes{pre="pre"} 4\n' in text
+    assert "keri_mailbox_removed_total 3\n" in text
+    assert "removed" not in metricsText({})
+
 
 if __name__ == '__main__':
     test_mailboxing()
+    test_mailbox_subscription()
+    test_mailbox_retention()
+    test_mailbox_backfill()
+    test_mailbox_compactor()
+    test_mailbox_retention_config()
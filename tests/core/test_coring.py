@@ -2743,6 +2743,58 @@ def test_counter():
 
 
 
+def test_counter_interns():
+    """
+    Test Counter precomputed interns and trusted fast path constructor
+    """
+    assert len(Counter.Interns) == len(Counter.Externs)
+    for (code, count), qb64b in Counter.Interns.items():
+        counter = Counter(code=code, count=count)
+        assert counter._infil() == qb64b  # same as computed
+        assert Counter(qb64b=qb64b).code == code
+        assert Counter(qb64b=qb64b).count == count
+
+    counter = Counter.trusted(code=CtrDex.ControllerIdxSigs, count=3)
+    assert counter.code == CtrDex.ControllerIdxSigs
+    assert counter.count == 3
+    assert counter.qb64b == b'-AAD'
+    assert counter.qb64b is Counter.Interns[(CtrDex.ControllerIdxSigs, 3)]
+    assert counter.qb2 == Counter(qb64b=b'-AAD').qb2
+
+    counter = Counter.trusted(code=CtrDex.ControllerIdxSigs, count=Counter.InternSize)
+    assert counter.qb64b == Counter(code=CtrDex.ControllerIdxSigs,
+                                    count=Counter.InternSize).qb64b  # not interned
+    with pytest.raises(InvalidVarIndexError):  # trusted still validates
+        Counter.trusted(code=CtrDex.ControllerIdxSigs, count=64 ** 2).qb64b
+
+    # fast path extraction from stream
+    ims = bytearray(b'-AAD-0VAAAAB')
+    counter = Counter(qb64b=ims, strip=True)
+    assert (counter.code, counter.count) == (CtrDex.ControllerIdxSigs, 3)
+    counter = Counter(qb64b=ims, strip=True)  # big code not interned
+    assert (counter.code, counter.count) == (CtrDex.BigAttachedMaterialQuadlets, 1)
+    assert not ims
+    assert Counter(qb64='-AAD').count == 3  # str
+    with pytest.raises(ShortageError):
+        Counter(qb64b=b'-AA')
+    """ Done Test """
+
+
+def test_seqner_interns():
+    """
+    Test Seqner precomputed interns and trusted fast path constructor
+    """
+    assert len(Seqner.Interns) == Seqner.InternSize
+    for sn in (0, 1, 255, Seqner.InternSize - 1, Seqner.InternSize, 2 ** 64):
+        seqner = Seqner.trusted(sn=sn)
+        assert seqner.sn == sn
+        assert seqner.qb64b == Seqner(sn=sn)._infil()
+        assert seqner.qb64 == Seqner(sn=sn).qb64
+        assert Seqner(qb64b=seqner.qb64b).sn == sn
+    assert Seqner(sn=5).qb64b is Seqner.Interns[5]
+    """ Done Test """
+
+
 def test_seqner():
     """
     Test Seqner sequence number subclass of CryMat
@@ -3924,6 +3976,48 @@ def test_cigar():
     """ Done Test """
 
 
+def test_verfer_cache():
+    """
+    Test memoization of successful verifications in Verfer.Cache
+    """
+    cache = Verfer.Cache
+    try:
+        Verfer.Cache = helping.LRUCache(maxsize=2)
+        seed = pysodium.randombytes(pysodium.crypto_sign_SEEDBYTES)
+        verkey, sigkey = pysodium.crypto_sign_seed_keypair(seed)
+        verfer = Verfer(raw=verkey, code=MtrDex.Ed25519)
+
+        ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+        sig = pysodium.crypto_sign_detached(ser, seed + verkey)
+
+        assert verfer.verify(sig, ser)
+        assert Verfer.Cache.stats == dict(size=1, maxsize=2, hits=0, misses=1,
+                                          evictions=0)
+        assert verfer.verify(sig, ser)  # memoized
+        assert Verfer.Cache.hits == 1
+
+        # new instance for same key shares the memo
+        assert Verfer(qb64=verfer.qb64).verify(sig, ser)
+        assert Verfer.Cache.hits == 2
+
+        # failures are never memoized
+        assert not verfer.verify(sig, b'ABC')
+        assert not verfer.verify(sig, b'ABC')
+        assert len(Verfer.Cache) == 1
+        assert Verfer.Cache.misses == 3
+
+        # different serialization with same signature misses
+        assert not verfer.verify(sig, ser + b'0')
+
+        Verfer.Cache = None  # disabled
+        assert verfer.verify(sig, ser)
+        assert not verfer.verify(sig, b'ABC')
+    finally:
+        Verfer.Cache = cache
+
+    """ Done Test """
+
+
 def test_signer():
     """
     Test the support functionality for signer subclass of crymat
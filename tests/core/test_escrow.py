@@ -1399,6 +1399,145 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+
+def test_escrow_scheduler():
+    """
+    Test escrow scheduler only reattempts escrows of prefixes that may have
+    been unblocked since last pass
+    """
+    scheduler = basing.EscrowScheduler()
+    assert scheduler.pull() is None  # first pass walks all
+    assert scheduler.pull() == []
+
+    scheduler.escrowed("B", deps=["A"])
+    scheduler.escrowed("C")
+    assert scheduler.pull() == [b"B", b"C"]
+    assert scheduler.pull() == []
+
+    scheduler.busy = True  # reattempt is not new material
+    scheduler.escrowed("C")
+    scheduler.busy = False
+    assert scheduler.pull() == []
+
+    scheduler.signal("A")  # dependency accepted so its waiters are ready
+    assert scheduler.pull() == [b"A", b"B"]
+    assert "A" not in scheduler.waits
+
+    now = helping.nowUTC()
+    scheduler.expire("C", timeout=60, dts=helping.toIso8601(now))
+    scheduler.expire("C", timeout=30, dts=helping.toIso8601(now))  # earlier kept
+    scheduler.expire("C", timeout=90, dts=helping.toIso8601(now))
+    assert scheduler.expiries[b"C"] == now + datetime.timedelta(seconds=30)
+    assert scheduler.pull(now=now) == []
+    assert scheduler.pull(now=now + datetime.timedelta(seconds=30)) == [b"C"]
+    assert not scheduler.expiries
+    assert scheduler.pull(now=now + datetime.timedelta(seconds=90)) == []  # superseded
+
+    with basing.openDB(name="edy") as db:
+        kvy = eventing.Kevery(db=db)
+        signers = coring.Salter(raw=b'0123456789abcdef').signers(count=4, temp=True)
+
+        msgs = []
+        for signer, nxt in ((signers[0], signers[1]), (signers[2], signers[3])):
+            icp = eventing.incept(keys=[signer.verfer.qb64],
+                                  ndigs=[coring.Diger(ser=nxt.verfer.qb64b).qb64])
+            ixn = eventing.interact(pre=icp.pre, dig=icp.said, sn=1)
+            msgs.append([icp.raw + coring.Counter(code=coring.CtrDex.ControllerIdxSigs).qb64b
+                         + signer.sign(icp.raw, index=0).qb64b,
+                         ixn.raw + coring.Counter(code=coring.CtrDex.ControllerIdxSigs).qb64b
+                         + signer.sign(ixn.raw, index=0).qb64b, icp.pre])
+
+        (icpA, ixnA, preA), (icpB, ixnB, preB) = msgs
+        parsing.Parser().parse(ims=bytearray(ixnA + ixnB), kvy=kvy)  # out of order
+        assert db.cntOoes(dbing.snKey(preA, 1)) == 1
+        assert db.cntOoes(dbing.snKey(preB, 1)) == 1
+
+        kvy.processEscrows()  # first pass walks all and schedules expiries
+        assert set(db.scheduler.expiries) == {preA.encode(), preB.encode()}
+        assert not db.scheduler.readers[kvy]
+
+        # only escrows of ready prefixes are visited
+        items = list(kvy._escrowItemsIter(db.getOoeItemsNextIter, b'',
+                                          [preB.encode()], kvy.TimeoutOOE))
+        assert len(items) == 1
+        assert dbing.splitKey(items[0][0])[0] == preB.encode()
+        assert not list(kvy._escrowItemsIter(db.getOoeItemsNextIter, b'', [],
+                                             kvy.TimeoutOOE))
+
+        parsing.Parser().parse(ims=bytearray(icpA), kvy=kvy)
+        assert preA in kvy.kevers
+        assert db.scheduler.readers[kvy] == {preA.encode()}
+        kvy.processEscrows()
+        assert kvy.kevers[preA].sn == 1  # unblocked escrow reattempted
+        assert db.cntOoes(dbing.snKey(preA, 1)) == 0
+        assert db.cntOoes(dbing.snKey(preB, 1)) == 1  # not ready so untouched
+
+        # expired escrow of prefix never made ready is removed when due
+        db.scheduler.expiries[preB.encode()] = helping.nowUTC()
+        db.scheduler.deadlines = [(db.scheduler.expiries[preB.encode()], preB.encode())]
+        db.delDts(dbing.dgKey(preB, eventing.Serder(raw=ixnB).said))
+        db.putDts(dbing.dgKey(preB, eventing.Serder(raw=ixnB).said),
+                  helping.toIso8601(helping.nowUTC()
+                                    - datetime.timedelta(seconds=kvy.TimeoutOOE + 1)).encode())
+        kvy.processEscrows()
+        assert db.cntOoes(dbing.snKey(preB, 1)) == 0
+
+        # each Kevery of db has own ready set
+        other = eventing.Kevery(db=db)
+        assert db.scheduler.pull(reader=other) is None  # new reader walks all
+        db.scheduler.escrowed(preB)
+        assert db.scheduler.pull(reader=kvy) == [preB.encode()]
+        assert db.scheduler.pull(reader=other) == [preB.encode()]
+
+    """End Test"""
+
+
+def test_escrow_scheduler_validator():
+    """
+    Test escrowed transferable receipt keeps waiting on its validator until
+    the validator's establishment event named by the receipt seal arrives
+    """
+    with basing.openDB(name="edy") as db:
+        kvy = eventing.Kevery(db=db)
+        signers = coring.Salter(raw=b'0123456789abcdef').signers(count=4, temp=True)
+        ctr = coring.Counter(code=coring.CtrDex.ControllerIdxSigs).qb64b
+
+        icpA = eventing.incept(keys=[signers[0].verfer.qb64],
+                               ndigs=[coring.Diger(ser=signers[0].verfer.qb64b).qb64])
+        icpV = eventing.incept(keys=[signers[1].verfer.qb64],
+                               ndigs=[coring.Diger(ser=signers[2].verfer.qb64b).qb64])
+        ixnV = eventing.interact(pre=icpV.pre, dig=icpV.said, sn=1)
+        rotV = eventing.rotate(pre=icpV.pre, keys=[signers[2].verfer.qb64], dig=ixnV.said,
+                               ndigs=[coring.Diger(ser=signers[3].verfer.qb64b).qb64], sn=2)
+        seal = eventing.SealEvent(i=icpV.pre, s=rotV.ked["s"], d=rotV.said)
+        rct = eventing.messagize(serder=eventing.receipt(pre=icpA.pre, sn=0, said=icpA.said),
+                                 sigers=[signers[2].sign(icpA.raw, index=0)], seal=seal)
+
+        parsing.Parser().parse(ims=bytearray(icpA.raw + ctr + signers[0].sign(icpA.raw, index=0).qb64b
+                                             + rct), kvy=kvy)
+        assert db.cntVres(dbing.snKey(icpA.pre, 0)) == 1
+        kvy.processEscrows()  # first pass walks all
+        assert db.cntVres(dbing.snKey(icpA.pre, 0)) == 1
+
+        # validator inception does not establish receipt seal so keeps waiting
+        parsing.Parser().parse(ims=bytearray(icpV.raw + ctr + signers[1].sign(icpV.raw, index=0).qb64b),
+                               kvy=kvy)
+        kvy.processEscrows()
+        assert db.cntVres(dbing.snKey(icpA.pre, 0)) == 1
+        assert icpA.preb in db.scheduler.waits[icpV.preb]
+
+        # validator rotation named by seal arrives on later pass
+        parsing.Parser().parse(ims=bytearray(ixnV.raw + ctr + signers[1].sign(ixnV.raw, index=0).qb64b
+                                             + rotV.raw + ctr + signers[2].sign(rotV.raw, index=0).qb64b),
+                               kvy=kvy)
+        assert kvy.kevers[icpV.pre].sn == 2
+        kvy.processEscrows()
+        assert db.cntVres(dbing.snKey(icpA.pre, 0)) == 0
+        assert len(db.getVrcs(dbing.dgKey(icpA.pre, icpA.said))) == 1
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_unverified_receipt_escrow()
 
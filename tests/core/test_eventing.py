@@ -4,6 +4,7 @@ tests.core.test_eventing module
 
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import blake3
 import pysodium
@@ -674,6 +675,44 @@ def test_seals_states():
     """End Test """
 
 
+def test_verify_sigs_batch():
+    """
+    Test verifySigs and verifySigsBatch with and without executor
+    """
+    salt = b'0123456789abcdef'
+    signers = coring.Salter(raw=salt).signers(count=4, transferable=True, temp=True)
+    verfers = [signer.verfer for signer in signers]
+    rawa = b'abcdefghijklmnopqrstuvwxyz'
+    rawb = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+    sigersa = [signer.sign(rawa, index=i) for i, signer in enumerate(signers)]
+    sigersb = [signer.sign(rawb, index=i) for i, signer in enumerate(signers[:2])]
+
+    # duplicates, bad signature and out of range index are all dropped
+    dupers = sigersa + [Siger(qb64=sigersa[0].qb64)]  # duplicate
+    dupers.append(sigersb[0])  # signature on wrong raw at index 0 also duplicate index
+    dupers.append(signers[0].sign(rawa, index=7))  # index out of range
+    vsigers, vindices = eventing.verifySigs(raw=rawa, sigers=dupers, verfers=verfers)
+    assert vindices == [0, 1, 2, 3]
+    assert [siger.qb64 for siger in vsigers] == [siger.qb64 for siger in sigersa]
+    assert [siger.verfer for siger in vsigers] == verfers
+    assert vsigers[0] is not sigersa[0]  # callers sigers not modified
+
+    assert eventing.verifySigs(raw=rawa, sigers=None, verfers=verfers) == ([], [])
+
+    batch = [(rawa, sigersa, verfers), (rawb, sigersb, verfers), (rawb, sigersa, verfers)]
+    results = eventing.verifySigsBatch(batch=batch)
+    assert [vindices for _, vindices in results] == [[0, 1, 2, 3], [0, 1], []]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        presults = eventing.verifySigsBatch(batch=batch, executor=executor)
+    assert [vindices for _, vindices in presults] == [[0, 1, 2, 3], [0, 1], []]
+    assert ([[siger.qb64 for siger in vsigers] for vsigers, _ in presults] ==
+            [[siger.qb64 for siger in vsigers] for vsigers, _ in results])
+
+    """End Test"""
+
+
 def test_keyeventfuncs(mockHelpingNowUTC):
     """
     Test the support functionality for key event generation functions
@@ -0,0 +1,111 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.test_ingesting module
+
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from keri.app import habbing
+from keri.core import ingesting
+from keri.core.coring import Verfer
+from keri.core.eventing import Kevery
+from keri.db.basing import openDB
+from keri.help import helping
+
+
+def test_prevalidate():
+    """
+    Test prevalidate worker function
+    """
+    with habbing.openHby(name="nat", base="test") as natHby:
+        natHab = natHby.makeHab(name="nat", isith='2', icount=3)
+        natHab.interact()
+        natHab.rotate()
+        msgs = [bytes(msg) for msg in natHab.db.clonePreIter(pre=natHab.pre)]
+        assert len(msgs) == 3
+
+        icp, ixn, rot = [ingesting.prevalidate(msg) for msg in msgs]
+        assert icp.valid and icp.reason is None
+        assert len(icp.memos) == 3  # all three sigs on keys in event
+        assert ixn.valid and ixn.memos == []  # no keys claimed by ixn
+        assert rot.valid and len(rot.memos) == 3
+        assert icp.msg == msgs[0]
+
+        # tampered event body fails SAID check
+        tampered = msgs[0].replace(b'"kt":"2"', b'"kt":"3"', 1)
+        result = ingesting.prevalidate(tampered)
+        assert not result.valid
+        assert result.reason.startswith("Invalid prefix")
+        tampered = msgs[1].replace(b'"s":"1"', b'"s":"2"', 1)
+        result = ingesting.prevalidate(tampered)
+        assert not result.valid
+        assert result.reason.startswith("Invalid SAID")
+
+        # truncated
+        result = ingesting.prevalidate(msgs[0][:20])
+        assert not result.valid
+
+        # non event passes through
+        result = ingesting.prevalidate(b'not a message' * 4)
+        assert result.valid
+
+    """ Done Test """
+
+
+def test_ingester():
+    """
+    Test Ingester parallel ingestion pipeline
+    """
+    with habbing.openHby(name="nat", base="test") as natHby:
+        natHab = natHby.makeHab(name="nat", isith='2', icount=3)
+        for i in range(3):
+            natHab.interact()
+        natHab.rotate()
+        natHab.interact()
+        msgs = [bytes(msg) for msg in natHab.db.clonePreIter(pre=natHab.pre)]
+        tampered = msgs[1].replace(b'"s":"1"', b'"s":"2"', 1)
+
+        cache = Verfer.Cache
+        try:
+            Verfer.Cache = helping.LRUCache(maxsize=64)
+            with openDB(name="val", temp=True) as valDB:
+                kvy = Kevery(db=valDB, lax=False, local=False, cloned=True)
+                ingester = ingesting.Ingester(kvy=kvy)
+                assert ingester.ingest([tampered]) == 0
+                assert ingester.rejected == 1
+                assert ingester.ingest(msgs) == 6
+                assert kvy.kevers[natHab.pre].sn == 5
+                # writer verified seeded signatures from cache
+                assert Verfer.Cache.hits == 6
+
+            Verfer.Cache = helping.LRUCache(maxsize=64)
+            with openDB(name="val", temp=True) as valDB, \
+                    ProcessPoolExecutor(max_workers=2) as executor:
+                kvy = Kevery(db=valDB, lax=False, local=False, cloned=True)
+                ingester = ingesting.Ingester(kvy=kvy, executor=executor,
+                                              chunksize=2)
+                assert ingester.ingest(msgs) == 6
+                assert ingester.accepted == 6 and ingester.rejected == 0
+                assert kvy.kevers[natHab.pre].sn == 5
+                assert kvy.kevers[natHab.pre].serder.said == natHab.kever.serder.said
+                assert Verfer.Cache.hits == 6
+
+                # bounded window of chunks in flight consumes msgs lazily
+                consumed = []
+
+                def feed():
+                    for msg in msgs:
+                        consumed.append(msg)
+                        yield msg
+
+                ingester = ingesting.Ingester(kvy=kvy, executor=executor,
+                                              chunksize=2, window=1)
+                results = ingester.prevalidateIter(feed())
+                assert next(results).msg == msgs[0]
+                assert len(consumed) == 2
+                assert [result.msg for result in results] == msgs[1:]
+                assert len(consumed) == 6
+        finally:
+            Verfer.Cache = cache
+
+    """ Done Test """
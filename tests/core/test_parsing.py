@@ -246,6 +246,96 @@ def test_parser():
     """ Done Test """
 
 
+def test_viewstream():
+    """
+    Test ViewStream read cursor stream buffer
+    """
+    ims = parsing.ViewStream(b'abcdef')
+    assert len(ims) == 6 and ims
+    assert ims[0] == ord(b'a') and ims[-1] == ord(b'f')
+    assert ims[:2] == b'ab' and ims[4:10] == b'ef' and ims[5:2] == b''
+    with pytest.raises(IndexError):
+        ims[6]
+
+    del ims[:2]  # advances cursor only
+    assert ims.consumed == 2
+    assert len(ims) == 4 and ims[:] == b'cdef' and bytes(ims) == b'cdef'
+    assert ims[0] == ord(b'c')
+    with pytest.raises(ValueError):
+        del ims[1:2]
+
+    ims.extend(b'gh')  # copy on first write
+    assert ims.consumed == 0
+    assert ims[:] == bytearray(b'cdefgh')
+
+    view = ims.view()
+    assert view.tobytes() == b'cdefgh'
+    view.release()
+
+    del ims[:]
+    assert not ims and len(ims) == 0
+
+    ims = parsing.ViewStream()
+    ims.Compaction = 4  # compact in bulk after at least 4 consumed bytes
+    ims.extend(b'0123456789')
+    del ims[:3]
+    assert ims.consumed == 3 and ims.compactions == 0
+    del ims[:3]  # 6 consumed of 10 so compact
+    assert ims.consumed == 0 and ims.compactions == 1
+    assert ims[:] == b'6789'
+    del ims[:10]  # clamps
+    assert not ims
+
+    """ Done Test """
+
+
+def test_parser_viewed():
+    """
+    Test Parser in viewed mode replaying cloned KEL stream
+    """
+    with habbing.openHby(name="nat", base="test") as natHby, \
+            openDB(name="val", temp=True) as valDB:
+        natHab = natHby.makeHab(name="nat", isith='2', icount=3)
+        natHab.interact()
+        natHab.rotate()
+        natHab.interact()
+
+        msgs = bytearray()
+        for msg in natHab.db.clonePreIter(pre=natHab.pre):
+            msgs.extend(msg)
+        msgs = bytes(msgs)  # immutable so wrapped without copy
+
+        kevery = Kevery(db=valDB, lax=False, local=False)
+        parser = parsing.Parser(kvy=kevery, viewed=True)
+        assert isinstance(parser.ims, parsing.ViewStream)
+        parser.parse(ims=msgs)
+        assert natHab.pre in kevery.kevers
+        assert kevery.kevers[natHab.pre].sn == 3
+        assert kevery.kevers[natHab.pre].serder.said == natHab.kever.serder.said
+
+        # provided bytearray is viewed and its consumed prefix deleted
+        assert isinstance(parser._streamify(bytearray(msgs)), parsing.ViewStream)
+        assert parser._streamify(bytearray(), live=True) == bytearray()
+        ims = bytearray(msgs)
+        parser.parseOne(ims=ims)
+        assert 0 < len(ims) < len(msgs)
+        assert msgs.endswith(ims)
+        parser.parse(ims=ims)
+        assert not ims
+
+        # incrementally fed stream same as bytearray mode
+        kevery = Kevery(db=valDB)  # idempotent replay
+        parser = parsing.Parser(kvy=kevery, viewed=True)
+        parsator = parser.parsator()
+        for i in range(0, len(msgs), 100):
+            parser.ims.extend(msgs[i:i + 100])
+            next(parsator)
+        for i in range(8):
+            next(parsator)
+        assert not parser.ims
+        assert kevery.kevers[natHab.pre].sn == 3
+
+    """ Done Test """
 
 
 if __name__ == "__main__":
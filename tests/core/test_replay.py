@@ -9,6 +9,7 @@ import os
 from keri import help
 from keri.app import habbing
 from keri.core import coring, eventing, parsing
+from keri.db import basing
 from keri.help import helping
 
 logger = help.ogler.getLogger()
@@ -628,5 +629,51 @@ def test_replay_all():
     """End Test"""
 
 
+def test_replayer():
+    """
+    Test Replayer single pass assembly of first seen replay messages
+    """
+    with habbing.openHby(name="deb", base="test") as debHby:
+        debHab = debHby.makeHab(name="deb", isith="2", icount=3)
+        debHab.interact()
+        debHab.rotate()
+        debHab.interact()
+
+        pre = debHab.pre.encode("utf-8")
+        clones = [bytes(msg) for msg in debHab.db.clonePreIter(pre=pre)]
+        assert len(clones) == 4
+        fels = list(debHab.db.getFelItemPreIter(pre))
+        for (fn, dig), clone in zip(fels, clones):
+            assert debHab.db.cloneEvtMsg(pre=pre, fn=fn, dig=dig) == clone
+            serder = coring.Serder(raw=clone)
+            assert clone[serder.size:serder.size+4] == coring.Counter(
+                code=coring.CtrDex.AttachedMaterialQuadlets,
+                count=(len(clone) - serder.size - 4) // 4).qb64b
+
+        replayer = basing.Replayer(db=debHab.db, size=16)  # grows as needed
+        assert [bytes(msg) for msg in replayer.cloneIter(pre=debHab.pre)] == clones
+        assert len(replayer.buf) >= max(len(clone) for clone in clones)
+        assert [bytes(msg) for msg in replayer.cloneIter(pre=pre, fn=2)] == clones[2:]
+        alls = [bytes(msg) for msg in debHab.db.cloneAllPreIter()]
+        assert len(alls) > len(clones)  # includes signator hab
+        assert [bytes(msg) for msg in replayer.cloneAllIter()] == alls
+        msg = replayer.assemble(pre=pre, fn=0, dig=fels[0][1])
+        assert isinstance(msg, memoryview)
+        assert msg == clones[0]
+
+        # chunks hold whole messages up to size
+        chunks = [bytes(chunk) for chunk in replayer.chunkIter(pre=pre, size=len(clones[0]))]
+        assert b''.join(chunks) == b''.join(clones)
+        assert len(chunks) >= 2
+        chunks = [bytes(chunk) for chunk in replayer.chunkIter(pre=pre, size=2 ** 20)]
+        assert chunks == [b''.join(clones)]
+
+        assert debHab.replay() == bytearray(b''.join(clones))
+
+        assert debHab.db.txn is None
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_replay_all()
@@ -2217,6 +2217,75 @@ def test_serderacdc():
     """End Test"""
 
 
+def test_serder_lazy():
+    """Test lazy Serder and memoized derived properties"""
+    keys = ["DNG2arBDtHK_JyHRAq-emRdC6UM-yIpCAeJIWDiXp4Hx",
+            "DFApqDoGKbHqDF4FLIbPMzGSdEtzNUA6qcbRbTDEdQbS"]
+    serder = SerderKERI(makify=True, ilk=kering.Ilks.icp)  # make with defaults
+    sad = serder.sad
+    sad['k'] = keys
+    sad['kt'] = "2"
+    sad['n'] = ["EBuPb6RwJnrmBDRkjsBvn97o4fTl7UyL2nB2zBzTA-8Q"]
+    sad['nt'] = "1"
+    eager = SerderKERI(sad=sad, makify=True)
+    assert eager.verify()
+    assert not eager.lazy
+
+    ims = bytearray(eager.raw) + bytearray(b"rest")
+    serder = SerderKERI(raw=ims, strip=True, lazy=True)
+    assert ims == bytearray(b"rest")
+    assert serder.lazy  # leading fields reaped without loading sad
+    assert serder.raw == eager.raw
+    assert serder.size == eager.size
+    assert serder.kind == eager.kind
+    assert serder.proto == eager.proto
+    assert serder.vrsn == eager.vrsn
+    assert serder.said == eager.said
+    assert serder.ilk == kering.Ilks.icp
+    assert serder.estive
+    assert serder.pre == eager.pre
+    assert serder.sn == 0
+    assert serder.lazy  # still not loaded
+
+    verfers = serder.verfers  # touch field so loads
+    assert not serder.lazy
+    assert [verfer.qb64 for verfer in verfers] == keys
+    assert serder.sad == eager.sad
+    assert serder.verify()
+
+    # derived primitives are memoized and lists are copies
+    assert serder.verfers is not verfers
+    assert serder.verfers[0] is verfers[0]
+    verfers.pop()
+    assert len(serder.verfers) == 2
+    assert serder.tholder is serder.tholder
+    assert serder.tholder.sith == "2"
+    assert serder.ndigers[0] is serder.ndigers[0]
+    assert serder.sner is serder.sner
+
+    # lazy defers said verification to .verify
+    bad = bytearray(eager.raw.replace(eager.said.encode(), b"E" + b"A" * 43))
+    serder = SerderKERI(raw=bad, lazy=True)
+    assert serder.said == "E" + "A" * 43
+    assert not serder.verify()
+    with pytest.raises(kering.ValidationError):
+        SerderKERI(raw=bad)
+
+    # non JSON has no reaped leading fields so loads to get said
+    raw = SerderKERI(sad=eager.sad, makify=True, kind=kering.Serials.cbor).raw
+    serder = SerderKERI(raw=raw, lazy=True)
+    assert not serder.lazy
+    assert serder.ilk == kering.Ilks.icp
+    assert serder.verify()
+
+    # Serdery reaps lazy
+    serder = Serdery().reap(bytearray(eager.raw), lazy=True)
+    assert isinstance(serder, SerderKERI)
+    assert serder.lazy
+    assert serder.said == eager.said
+    """End Test"""
+
+
 def test_serdery():
     """Test Serdery"""
     #Create incoming message stream for Serdery to reap
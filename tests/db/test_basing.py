@@ -3,6 +3,7 @@
 tests.db.dbing module
 
 """
+import datetime
 import json
 import os
 from dataclasses import dataclass, asdict
@@ -14,7 +15,7 @@ from hio.base import doing
 from tests.app import openMultiSig
 from keri.kering import Versionage
 from keri.app import habbing
-from keri.core import coring, eventing
+from keri.core import coring, eventing, parsing
 from keri.core.coring import MtrDex
 from keri.core.coring import Serials, versify
 from keri.core.coring import Salter, Serder
@@ -24,6 +25,7 @@ from keri.db import dbing
 from keri.db.basing import openDB, Baser, KeyStateRecord
 from keri.db.dbing import (dgKey, onKey, snKey)
 from keri.db.dbing import openLMDB
+from keri.help import helping
 from keri.help.helping import datify, dictify
 
 
@@ -2165,6 +2167,164 @@ def test_dbdict():
 
 
 
+    """End Test"""
+
+
+def test_dbdict_bounded():
+    """
+    Test bounded evicting dbdict kevers cache with pinned local prefixes
+    """
+    with habbing.openHby(name="local", temp=True) as hby, \
+            habbing.openHby(name="remote", temp=True) as remHby:
+        hab = hby.makeHab(name="local")
+        kevers = hby.db.kevers
+        assert kevers.size == Baser.KeverCacheSize
+        assert hab.pre in hby.db.prefixes
+        signer = hby.signator.pre  # hidden so not pinned
+        assert signer not in hby.db.prefixes
+        assert list(kevers.keys()) == [signer, hab.pre]
+
+        kvy = eventing.Kevery(db=hby.db, lax=True, local=False)
+        psr = parsing.Parser(kvy=kvy)
+        remHabs = []
+        for i in range(4):
+            remHab = remHby.makeHab(name=f"remote{i}")
+            remHab.interact()
+            remHabs.append(remHab)
+            for msg in remHab.db.clonePreIter(pre=remHab.pre):
+                psr.parseOne(ims=bytearray(msg))
+        pres = [remHab.pre for remHab in remHabs]
+        assert list(kevers.keys()) == [signer, hab.pre] + pres
+        assert kevers.evictions == 0
+
+        kevers.size = 3
+        assert kevers.evict() == 3
+        assert kevers.evictions == 3
+        assert list(kevers.keys()) == [hab.pre] + pres[2:]  # lru evicted
+
+        misses, loads = kevers.misses, kevers.loads
+        kever = kevers[pres[0]]  # reloaded from .states and least recent evicted
+        assert kever.sn == 1
+        assert kevers.misses == misses + 1
+        assert kevers.loads == loads + 1
+        assert kevers.evictions == 4
+        assert list(kevers.keys()) == [hab.pre, pres[3], pres[0]]
+
+        hits = kevers.hits
+        assert kevers[pres[3]].sn == 1  # hit moves to most recently used
+        assert kevers.hits == hits + 1
+        assert list(kevers.keys()) == [hab.pre, pres[0], pres[3]]
+
+        kevers.size = 0  # local prefix is pinned
+        assert kevers.evict() == 2
+        assert list(kevers.keys()) == [hab.pre]
+        assert hab.kever.sn == 0
+        assert kevers.evictions == 6
+        assert hby.signator.verify(b"abc", hby.signator.sign(b"abc"))  # reloaded
+        assert list(kevers.keys()) == [hab.pre]
+        evictions = kevers.evictions
+
+        # updates of evicted kevers are kept in .states and reloaded
+        kevers.size = 2
+        kevers.evict()
+        psr.parseOne(ims=remHabs[1].interact())
+        assert list(kevers.keys()) == [hab.pre, pres[1]]
+        assert kevers[pres[1]].sn == 2
+        kevers.size = 1
+        assert kevers.evict() == 1
+        assert list(kevers.keys()) == [hab.pre]
+        assert kevers[pres[1]].sn == 2  # evicted again on reload
+        assert list(kevers.keys()) == [hab.pre]
+
+        stats = kevers.stats()
+        assert stats["entries"] == 1
+        assert stats["size"] == 1
+        assert stats["evictions"] == kevers.evictions == evictions + 2
+        assert stats["misses"] >= stats["loads"] > 0
+
+    """End Test"""
+
+
+def test_compact_kever_state():
+    """
+    Test slotted lazily materialized Kever reloaded from CBOR key state
+    """
+    with habbing.openHby(name="local", temp=True) as hby, \
+            habbing.openHby(name="remote", temp=True) as remHby:
+        remHab = remHby.makeHab(name="remote")
+        remHab.rotate()
+        remHab.interact()
+        kvy = eventing.Kevery(db=hby.db, lax=True, local=False)
+        psr = parsing.Parser(kvy=kvy)
+        for msg in remHab.db.clonePreIter(pre=remHab.pre):
+            psr.parseOne(ims=bytearray(msg))
+        kever = hby.db.kevers[remHab.pre]
+        state = kever.state()
+        assert not hasattr(kever, "__dict__")
+        assert not hasattr(state, "__dict__")
+
+        raw = hby.db.getVal(hby.db.states.sdb, hby.db.states._tokey(remHab.pre))
+        assert bytes(raw) == state._ascbor()  # binary encoded
+        assert len(raw) < len(state._asjson())
+        assert hby.db.states.get(keys=remHab.pre) == state
+
+        hby.db.kevers.pop(remHab.pre)
+        kever = hby.db.kevers[remHab.pre]  # reloaded from state
+        assert kever._serder is None and kever._raw is not None
+        assert kever._verfers is None and kever._keys == state.k
+        assert kever._digers is None and kever._digs == state.n
+        assert kever.digs == state.n
+        assert kever.serder.said == remHab.kever.serder.said
+        assert kever._raw is None
+        assert kever.state() == state  # without materializing keys
+        assert kever._verfers is None and kever._digers is None
+
+        assert [verfer.qb64 for verfer in kever.verfers] == state.k
+        assert [diger.qb64 for diger in kever.digers] == state.n
+        assert kever._keys is None and kever._digs is None
+        assert kever.state() == state
+
+        # key state written as json by prior version is still read
+        hby.db.setVal(hby.db.states.sdb, hby.db.states._tokey(remHab.pre), state._asjson())
+        hby.db.kevers.pop(remHab.pre)
+        assert hby.db.kevers[remHab.pre].state() == state
+
+    """End Test"""
+
+
+def test_wig_notifier():
+    """
+    Test WigNotifier called back when wigs are stored
+    """
+    notifier = basing.WigNotifier()
+    keys = []
+    notifier.watch("a.b", keys.append)
+    notifier.watch(b"a.b", keys.append)
+    notifier.notify(b"a.c")
+    assert keys == []
+    notifier.notify(memoryview(b"a.b"))
+    assert keys == [b"a.b", b"a.b"]
+    notifier.unwatch("a.b", keys.append)
+    notifier.notify("a.b")
+    assert keys == [b"a.b", b"a.b", b"a.b"]
+    notifier.unwatch("a.b", keys.append)
+    assert notifier.watches == {}
+    notifier.unwatch("a.b", keys.append)  # not watched
+
+    with openDB() as db:
+        dgkey = dbing.dgKey(b"pre", b"dig")
+        keys = []
+        db.wigNotifier.watch(dgkey, keys.append)
+        assert db.addWig(dgkey, b"wig0")
+        assert keys == [dgkey]
+        assert not db.addWig(dgkey, b"wig0")  # dup not written so not notified
+        assert keys == [dgkey]
+        assert db.putWigs(dgkey, [b"wig1", b"wig2"])
+        assert keys == [dgkey, dgkey]
+        assert db.cntWigs(dgkey) == 3
+        db.addWig(dbing.dgKey(b"pre", b"other"), b"wig0")
+        assert keys == [dgkey, dgkey]
+
     """End Test"""
 
 
@@ -2274,6 +2434,41 @@ def test_group_members():
     """End Test"""
 
 
+
+def test_escrow_stats():
+    """
+    Test escrow age histogram, escrow meter and escrow statistics
+    """
+    now = helping.nowUTC()
+    dtes = [now - datetime.timedelta(seconds=s) for s in (10, 100, 5000)]
+    counts, total = basing.ageHistogram(dtes, now=now)
+    assert counts == [1, 2, 2, 2, 3, 3, 3]
+    assert total == 5110.0
+
+    meter = basing.EscrowMeter()
+    meter.record("a", 2.0)
+    meter.record("a", 1.0)
+    with meter.timed("b"):
+        pass
+    assert meter.passes["a"] == [2, 3.0, 1.0, 2.0]
+    assert meter.passes["b"][0] == 1
+
+    with openDB() as db:
+        stats = db.escrowStats()
+        assert set(stats) == {"ooes", "pses", "pwes", "ldes", "uwes", "ures",
+                              "vres", "qnfs", "rpes"}
+        assert stats["ooes"] == dict(count=0, buckets=[0] * 7, total=0.0)
+
+        pre = b'BAKY1sKmgyjAiUDdUBPNPyrSz_ad_Qf9yzhDNZlEKiMc'
+        dig = b'EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IMkBq-yxvHBw5'
+        db.putDts(dgKey(pre, dig), helping.toIso8601(now - datetime.timedelta(seconds=120)).encode())
+        db.addOoe(snKey(pre, 1), dig)
+        db.addOoe(snKey(pre, 2), b'EHxAGIN4ZXeVMi7UQWkvqT8VNDQ6Fv-ghHkDyN7oYkzK')  # no dts
+        stats = db.escrowStats(now=now)
+        assert stats["ooes"] == dict(count=2, buckets=[0, 1, 1, 1, 1, 1, 1], total=120.0)
+        assert db.escrowStats(ages=False)["ooes"] == dict(count=2)
+
+
 if __name__ == "__main__":
     test_baser()
     test_clean_baser()
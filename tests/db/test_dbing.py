@@ -14,7 +14,7 @@ from  ordered_set import OrderedSet as oset
 
 from hio.base import doing
 
-from keri.db import dbing
+from keri.db import dbing, subing
 from keri.db.dbing import clearDatabaserDir, openLMDB
 from keri.db.dbing import (dgKey, onKey, fnKey, snKey, dtKey, splitKey,
                            splitKeyON, splitKeyFN, splitKeySN, splitKeyDT)
@@ -795,6 +795,106 @@ def test_lmdber():
 
     """ End Test """
 
+def test_lmdber_transact():
+    """
+    Test LMDBer.transact multi-operation write transactions
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        ddb = dber.env.open_db(key=b'boop.', dupsort=True)
+        sdb = subing.Suber(db=dber, subkey='bags.')
+        assert dber.txn is None
+
+        with dber.transact() as txn:
+            assert dber.txn is txn
+            assert dber.putVal(db, b'A', b'a')
+            assert dber.getVal(db, b'A') == b'a'  # reads see own writes
+            assert dber.addVal(ddb, b'B', b'b0')
+            assert dber.addVal(ddb, b'B', b'b1')
+            assert dber.getVals(ddb, b'B') == [b'b0', b'b1']
+            assert sdb.put(keys="C", val="c")  # sub db classes join too
+            with dber.transact() as inner:  # nested joins outer
+                assert inner is txn
+                assert dber.setVal(db, b'D', b'd')
+            assert dber.txn is txn
+
+        assert dber.txn is None
+        assert dber.getVal(db, b'A') == b'a'  # committed once
+        assert dber.getVal(db, b'D') == b'd'
+        assert dber.getVals(ddb, b'B') == [b'b0', b'b1']
+        assert sdb.get(keys="C") == "c"
+
+        # exception aborts all writes in transaction
+        with pytest.raises(ValueError):
+            with dber.transact():
+                assert dber.setVal(db, b'A', b'z')
+                assert dber.delVal(db, b'D')
+                assert sdb.rem(keys="C")
+                assert dber.getVal(db, b'D') is None
+                raise ValueError("abort")
+
+        assert dber.txn is None
+        assert dber.getVal(db, b'A') == b'a'
+        assert dber.getVal(db, b'D') == b'd'
+        assert sdb.get(keys="C") == "c"
+
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
+
+def test_lmdber_snapshot():
+    """
+    Test LMDBer.snapshot and .snapshotIter read transactions
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        for key in (b'A', b'B', b'C'):
+            assert dber.putVal(db, key, key.lower())
+
+        with dber.snapshot() as txn:
+            assert dber.txn is txn
+            assert not dber.writable
+            assert dber.getVal(db, b'A') == b'a'
+            assert dber.setVal(db, b'A', b'z')  # writes commit on their own
+            assert dber.getVal(db, b'A') == b'a'  # not seen by snapshot
+            with dber.snapshot() as inner:  # nested joins outer
+                assert inner is txn
+            with dber.transact() as wtxn:  # write transaction within snapshot
+                assert dber.txn is wtxn and dber.writable
+                assert dber.getVal(db, b'A') == b'z'
+            assert dber.txn is txn
+        assert dber.txn is None
+        assert dber.getVal(db, b'A') == b'z'
+
+        with dber.transact() as wtxn:  # snapshot within transact joins it
+            assert dber.setVal(db, b'A', b'y')
+            with dber.snapshot() as txn:
+                assert txn is wtxn
+                assert dber.getVal(db, b'A') == b'y'
+        assert dber.txn is None
+
+        def gen():
+            for key, val in dber.getTopItemIter(db):
+                assert dber.txn is not None  # snapshot ambient while running
+                yield bytes(key), bytes(dber.getVal(db, key))
+
+        items = []
+        for key, val in dber.snapshotIter(gen()):
+            assert dber.txn is None  # not ambient for consumer
+            assert dber.setVal(db, b'C', b'x')  # not seen by snapshot
+            items.append((key, val))
+        assert items == [(b'A', b'y'), (b'B', b'b'), (b'C', b'c')]
+
+        it = dber.snapshotIter(gen())
+        assert next(it) == (b'A', b'y')
+        it.close()  # closes generator within snapshot
+        assert dber.txn is None
+
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
 
 if __name__ == "__main__":
     test_key_funcs()
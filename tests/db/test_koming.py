@@ -218,6 +218,42 @@ def test_kom_get_item_iter():
 
 
 
+def test_kom_many():
+    """
+    Test Komer bulk putMany getMany remMany
+    """
+
+    @dataclass
+    class Stuff:
+        a: str  # dummy
+        b: str  # dummy too
+
+        def __iter__(self):
+            return iter(asdict(self))
+
+    with dbing.openLMDB() as db:
+        mydb = koming.Komer(db=db, schema=Stuff, subkey='recs.')
+
+        items = [(("a", str(i)), Stuff(a=str(i), b="Blue")) for i in range(10)]
+        assert mydb.putMany(iter(items)) == 10
+        assert mydb.putMany([(("a", "0"), Stuff(a="0", b="Red"))]) == 0
+        assert mydb.get(("a", "0")) == Stuff(a="0", b="Blue")
+        assert mydb.pinMany([(("a", "0"), Stuff(a="0", b="Red"))]) == 1
+
+        keys = [("a", "0"), "a.1", ("b", "0")]
+        assert mydb.getMany(keys) == [Stuff(a="0", b="Red"),
+                                      Stuff(a="1", b="Blue"),
+                                      None]
+        assert next(mydb.getManyIter(iter(keys))) == Stuff(a="0", b="Red")
+
+        assert mydb.remMany(keys) == 2
+        assert mydb.getMany(keys) == [None, None, None]
+        assert mydb.cntAll() == 8
+
+    assert not os.path.exists(db.path)
+    assert not db.opened
+
+
 def test_put_invalid_dataclass():
     @dataclass
     class Record:
@@ -416,6 +452,11 @@ def test_deserialization():
         assert actual.state == "UT"
         assert actual.zip == 84058
 
+        # json written before kind changed is still read
+        for kind in (Serials.cbor, Serials.mgpk):
+            desrl = k._deserializer(kind)
+            assert desrl(json) == desrl(memoryview(json)) == actual
+
 
 
 def test_dup_komer():
@@ -1602,6 +1602,24 @@ def test_crypt_signer_suber():
                          (("ab", signer0.verfer.qb64, ), signer0.qb64),
                          ]
 
+        # test bulk put pin and get with encrypter and decrypter
+        assert sdb.remMany([("a", signer0.verfer.qb64), ("a", signer1.verfer.qb64)]) == 2
+        items = [(("a", signer0.verfer.qb64), signer0), (("a", signer1.verfer.qb64), signer1)]
+        assert sdb.putMany(items, encrypter=encrypter1) == 2
+        assert sdb.putMany(items, encrypter=encrypter1) == 0  # no overwrite
+        raw = sdb.db.getVal(db=sdb.sdb, key=sdb._tokey(("a", signer0.verfer.qb64)))
+        assert bytes(raw) != signer0.qb64b  # not plaintext
+        keys = [keys for keys, _ in items] + [("a", "DNotAKey")]
+        signers = sdb.getMany(keys, decrypter=decrypter1)
+        assert [sgnr.qb64 for sgnr in signers[:2]] == [signer0.qb64, signer1.qb64]
+        assert signers[0].verfer.transferable
+        assert signers[2] is None
+        with pytest.raises(ValueError):  # ciphertext is not a Signer
+            sdb.getMany(keys[:1])
+        assert sdb.pinMany(items, encrypter=encrypter0) == 2
+        assert ([sgnr.qb64 for sgnr in sdb.getManyIter(keys[:2], decrypter=decrypter0)]
+                == [signer0.qb64, signer1.qb64])
+
 
         # now test with manager
         manager = keeping.Manager(ks=ks, seed=seed0, salt=salt, aeid=aeid0, )
@@ -1632,6 +1650,66 @@ def test_crypt_signer_suber():
 
 
 
+def test_suber_many():
+    """
+    Test bulk putMany getMany remMany of Suber family
+    """
+    with dbing.openLMDB() as db:
+        sdb = subing.Suber(db=db, subkey='bags.')
+
+        items = [(("a", "%04x" % i), "val%d" % i) for i in range(100)]
+        assert sdb.putMany(iter(items)) == 100
+        assert sdb.putMany([(("a", "0000"), "other"), (("b", "0000"), "new")]) == 1
+        assert sdb.get(("a", "0000")) == "val0"  # not overwritten
+        assert sdb.pinMany([(("a", "0000"), "other")]) == 1
+        assert sdb.get(("a", "0000")) == "other"
+
+        keys = [("a", "0001"), "a.0002", ("z", "0000"), ("b", "0000")]
+        assert sdb.getMany(keys) == ["val1", "val2", None, "new"]
+        assert list(sdb.getManyIter(iter(keys))) == ["val1", "val2", None, "new"]
+        assert sdb.getMany([]) == []
+
+        assert sdb.remMany(keys) == 3
+        assert sdb.getMany(keys) == [None, None, None, None]
+        assert len(list(sdb.getItemIter())) == 98
+
+        # joins ambient transaction and aborts with it
+        with pytest.raises(ValueError):
+            with db.transact():
+                sdb.putMany([(("c", "0000"), "see")])
+                assert sdb.getMany([("c", "0000")]) == ["see"]
+                raise ValueError()
+        assert sdb.get(("c", "0000")) is None
+
+        serdb = subing.SerderSuber(db=db, subkey='srdrs.')
+        srdrs = [eventing.incept(keys=["BDzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc"]),
+                 eventing.incept(keys=["BFQi_ZLDE6QEhfzRGD-hQKQ1LSoKxPiTDv8sk3y0xV8o"])]
+        assert serdb.putMany([(srdr.pre, srdr) for srdr in srdrs]) == 2
+        actual = serdb.getMany([srdr.pre for srdr in srdrs])
+        assert [srdr.said for srdr in actual] == [srdr.said for srdr in srdrs]
+
+        iosdb = subing.IoSetSuber(db=db, subkey='ioset.')
+        assert iosdb.putMany([("x", ["z", "y"]), ("w", ["u"]), ("x", ["y", "v"])]) == 3
+        assert iosdb.getMany(["x", "w", "q"]) == [["z", "y", "v"], ["u"], []]
+        assert iosdb.putMany([("w", ["u"])]) == 0
+        assert iosdb.remMany(iter(["x", "q"])) == 1
+        assert iosdb.getMany(["x", "w"]) == [[], ["u"]]
+
+        signers = coring.Salter(raw=b'0123456789abcdef').signers(count=2,
+                                                                  transferable=True)
+        sigdb = subing.SignerSuber(db=db, subkey='pris.')
+        assert sigdb.putMany([(signer.verfer.qb64b, signer) for signer in signers]) == 2
+        actual = sigdb.getMany([signers[0].verfer.qb64b, b"missing"])
+        assert actual[0].qb64 == signers[0].qb64
+        assert actual[0].verfer.transferable
+        assert actual[1] is None
+
+    assert not os.path.exists(db.path)
+    assert not db.opened
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_cesr_ioset_suber()
     test_serder_suber()
@@ -8,6 +8,7 @@ Includes Falcon ReST endpoints for testing purposes
 import logging
 
 import falcon
+import pytest
 from falcon import testing
 from hio.base import tyming, doing
 from hio.help import Hict
@@ -436,10 +437,46 @@ def test_get_oobi():
         assert serder.ked['a']['eid'] == hab.pre
         assert serder.ked['a']['scheme'] == kering.Schemes.http
         assert serder.ked['a']['url'] == "http://127.0.0.1:5555"
+        # streamed body has the same replies as replyToOobi
+        msgs = bytes(hab.replyToOobi(aid=hab.pre, role=None))
+        assert len(rep.content) == len(msgs)
+        assert rep.content.count(b'"t":"rpy"') == msgs.count(b'"t":"rpy"')
 
     """Done Test"""
 
 
+def test_stream_chunks():
+    """ Test streamChunks and primeStream """
+    parts = [b"ab", b"", b"cde", b"f", b"ghijk"]
+    assert list(ending.streamChunks(parts, size=3)) == [b"abcde", b"fghijk"]
+    assert list(ending.streamChunks(parts, size=100)) == [b"abcdefghijk"]
+    assert list(ending.streamChunks([], size=3)) == []
+    assert b"".join(ending.streamChunks(iter(parts))) == b"".join(parts)
+
+    first, chunks = ending.primeStream([b"", b"ab", b"cd"])
+    assert first == b"ab"
+    assert list(chunks) == [b"ab", b"cd"]
+
+    first, chunks = ending.primeStream(iter([b"", b""]))
+    assert first is None
+    assert list(chunks) == []
+
+    def failing():
+        yield b"ab"
+        raise ValueError("bad")
+
+    # errors before first chunk surface on priming
+    with pytest.raises(ValueError):
+        ending.primeStream(ending.streamChunks(failing(), size=3))
+
+    first, chunks = ending.primeStream(ending.streamChunks(failing(), size=2))
+    assert first == b"ab"
+    assert next(chunks) == b"ab"
+    with pytest.raises(ValueError):
+        next(chunks)
+    """Done Test"""
+
+
 def test_siginput(mockHelpingNowUTC):
     print()
     with habbing.openHab(name="test", base="test", temp=True) as (hby, hab):
@@ -272,6 +272,42 @@ def test_iso8601():
 
     """ End Test """
 
+def test_lrucache():
+    """
+    Test LRUCache bounded least recently used cache
+    """
+    with pytest.raises(ValueError):
+        helping.LRUCache(maxsize=0)
+
+    cache = helping.LRUCache(maxsize=2)
+    assert len(cache) == 0
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert "a" in cache and "b" in cache
+    assert cache.get("a") == 1  # now b is least recently used
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("b", default=0) == 0
+    assert cache.get("c") == 3
+    assert cache.stats == dict(size=2, maxsize=2, hits=2, misses=2, evictions=1)
+
+    cache.put("a", 4)  # replace does not evict
+    assert cache.get("a") == 4
+    assert cache.evictions == 1
+
+    assert cache.pop("a") == 4
+    assert cache.pop("a") is None
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 3  # counters survive clear
+
+    """ End Test """
+
+
 
 if __name__ == "__main__":
     test_klasify()
@@ -11,6 +11,7 @@ from keri.app import habbing, signing
 from keri.core import eventing as ceventing, scheming
 from keri.core import parsing, coring
 from keri.core.eventing import SealEvent
+from keri.db import dbing
 from keri.help import helping
 from keri.vc import proving
 from keri.vdr import verifying, credentialing, eventing
@@ -490,6 +491,45 @@ def test_verifier_chained_credential(seeder):
         saider = ianreg.reger.schms.get(vLeiSchema)
         assert saider[0].qb64 == vLeiCreder.said
 
+        # composite issuer|subject, schema index with paging
+        reger = ianreg.reger
+        assert [s.qb64 for s in reger.credsIter(ian.pre)] == [vLeiCreder.said]
+        assert [s.qb64 for s in reger.credsIter(ian.pre, schema=vLeiSchema)] == [vLeiCreder.said]
+        assert [s.qb64 for s in reger.credsIter(ian.pre, schema=qviSchema)] == []
+        assert [s.qb64 for s in reger.credsIter(han.pre, issued=False)] == [vLeiCreder.said]
+        assert [s.qb64 for s in reger.credsIter(ian.pre, issued=False)] == [creder.said]
+        assert list(reger.credsIter(ian.pre, after=vLeiCreder.said)) == []
+        with pytest.raises(kering.MissingEntryError):
+            list(reger.credsIter(ian.pre, after=vLeiCreder.said[:-4] + "AAAA"))
+
+        reger.isch.trim()
+        reger.ssch.trim()
+        assert list(reger.credsIter(ian.pre)) == []
+        assert reger.reindexCreds() == 2
+        assert [s.qb64 for s in reger.credsIter(ian.pre)] == [vLeiCreder.said]
+
+        # chains as references instead of expanded
+        cred, = reger.cloneCreds([vLeiCreder.saider], expand=False)
+        assert cred["chains"] == [creder.said]
+        cred, = reger.cloneCreds([vLeiCreder.saider])
+        assert cred["chains"][0]["sad"]["d"] == creder.said
+
+        # shared ancestor expanded once per call and cloned from db once
+        reger.credCache.clear()
+        misses = reger.credCache.misses
+        creds = reger.cloneCreds([vLeiCreder.saider, creder.saider, vLeiCreder.saider])
+        assert reger.credCache.misses - misses == 2
+        assert creds[0] is creds[2]
+        assert creds[0]["chains"][0] is creds[1]
+        assert reger.cloneCreds([creder.saider]) == [creds[1]]
+        assert reger.credCache.misses - misses == 2
+
+        # TEL state change drops cached clone
+        assert creder.said in reger.credCache
+        assert not reger.putTel(dbing.snKey(creder.said, 0), b'')  # exists so not written
+        assert creder.said not in reger.credCache
+        assert vLeiCreder.said in reger.credCache
+
         # test operators
 
         untargetedSubject = dict(